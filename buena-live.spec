@@ -197,6 +197,34 @@ excludes = [
     'sphinx', 'docutils',
 ]
 
+# Tree-shaking: also exclude stdlib modules unreachable from main.py, as
+# computed by build_scripts/compute_excludes.py. Anything listed as a hidden
+# import above is kept, since those are loaded dynamically.
+excludes_file = app_dir / 'build_scripts' / 'excludes.json'
+if excludes_file.exists():
+    import json
+    hidden_top_levels = {name.split('.')[0] for name in hiddenimports}
+    unused_modules = json.loads(excludes_file.read_text())['unused']
+    auto_excludes = [m for m in unused_modules
+                     if m not in hidden_top_levels and m not in excludes]
+    excludes.extend(auto_excludes)
+    print(f"Excluding {len(auto_excludes)} unreachable stdlib modules (excludes.json)")
+else:
+    print("excludes.json not found - only the manual excludes list is applied")
+
+# PyInstaller always excludes __main__ and appends it to this very list in
+# place. Listed up front, the excludes saved with the Analysis match the next
+# run's, so an unchanged build (or a restored .build_cache) reuses it instead
+# of redoing the Analysis with "Building because excludes changed"
+excludes.append('__main__')
+
+# Run-time interpreter options for the frozen app: -OO, matching the
+# Analysis(optimize=2) bytecode below so sys.flags.optimize is 2 at run time
+# (asserts and `if __debug__:` blocks dropped, __doc__ stripped).
+# Equivalent to --python-option=OO, which PyInstaller only accepts when
+# generating a spec, not when building from one.
+python_options = [('O', None, 'OPTION'), ('O', None, 'OPTION')]
+
 # Analysis: scan the main script and its dependencies
 a = Analysis(
     ['main.py'],                    # Main entry point
@@ -228,7 +256,7 @@ if sys.platform == 'darwin':
     exe = EXE(
         pyz,
         a.scripts,
-        [],
+        python_options,
         exclude_binaries=True,
         name='TicketeraBuena',
         debug=False,
@@ -278,7 +306,7 @@ else:
         a.binaries,
         a.zipfiles,
         a.datas,
-        [],
+        python_options,
         name='TicketeraBuena',
         debug=False,
         bootloader_ignore_signals=False,
@@ -0,0 +1,120 @@
+"""
+Helpers shared by the platform build scripts (build_mac.py, build_windows.py).
+
+Key functions:
+    - fix_windows_utf8: Force UTF-8 console output on Windows
+    - clean_build_dirs: Remove build/, dist/ and __pycache__/
+    - verify_dependencies: Warn about missing credentials.json / venv
+    - get_dir_size: Size of a directory tree in MB
+    - run_pyinstaller: Run PyInstaller in-process
+"""
+
+import os
+import sys
+import shutil
+from pathlib import Path
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+
+
+def fix_windows_utf8():
+    """Force UTF-8 encoding for stdout/stderr on Windows."""
+    # Already UTF-8 when launched in UTF-8 mode (PYTHONUTF8=1 / -X utf8)
+    if sys.platform != "win32" or sys.flags.utf8_mode:
+        return
+    import io
+    if isinstance(sys.stdout, io.TextIOWrapper):
+        sys.stdout.reconfigure(encoding='utf-8')  # type: ignore
+    if isinstance(sys.stderr, io.TextIOWrapper):
+        sys.stderr.reconfigure(encoding='utf-8')  # type: ignore
+
+
+@lru_cache(maxsize=None)
+def project_entries(project_root: Path) -> frozenset:
+    """
+    Top-level names in the project root.
+
+    Listed once with a single scandir instead of probing each path with its
+    own exists() call. Taken before the build, so it does not see outputs.
+    """
+    with os.scandir(project_root) as it:
+        return frozenset(entry.name for entry in it)
+
+
+def clean_build_dirs(project_root: Path):
+    """Remove build and dist directories."""
+    print("Cleaning build directories...")
+    entries = project_entries(project_root)
+    dirs_to_clean = [d for d in ('build', 'dist', '__pycache__') if d in entries]
+
+    # rmtree is I/O-bound and releases the GIL in each unlink, so the
+    # trees are deleted concurrently
+    def remove(dir_name):
+        shutil.rmtree(project_root / dir_name)
+        print(f"  Removed {dir_name}/")
+
+    with ThreadPoolExecutor(max_workers=len(dirs_to_clean) or 1) as executor:
+        list(executor.map(remove, dirs_to_clean))
+
+
+def verify_dependencies(project_root: Path, venv_hint: str):
+    """
+    Verify all required dependencies are present.
+
+    Args:
+        project_root: Repository root
+        venv_hint: Platform-specific command shown to activate the venv
+    """
+    print("Verifying dependencies...")
+
+    # Check credentials.json
+    if 'credentials.json' not in project_entries(project_root):
+        print(f"WARNING: credentials.json not found at {project_root / 'credentials.json'}")
+        print("  The built app will not be able to access Google Sheets")
+
+    # Check if we're in virtual environment
+    if not hasattr(sys, 'real_prefix') and not (hasattr(sys, 'base_prefix') and sys.base_prefix != sys.prefix):
+        print("WARNING: Not running in virtual environment")
+        print(f"  Consider activating venv: {venv_hint}")
+
+    print("[OK] Dependency check complete\n")
+
+
+def get_dir_size(path):
+    """Calculate total size of directory in MB."""
+    # os.scandir reuses the directory listing's cached type/stat info,
+    # avoiding the per-entry is_file()/stat() syscalls of Path.rglob
+    total, stack = 0, [os.fspath(path)]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    total += entry.stat(follow_symlinks=False).st_size
+    return total / (1024 * 1024)
+
+
+def run_pyinstaller(args):
+    """Run PyInstaller in-process and return its exit code.
+
+    Uses PyInstaller's programmatic entry point instead of spawning the
+    pyinstaller executable, saving a second interpreter start-up and not
+    requiring pyinstaller on PATH.
+    """
+    try:
+        from PyInstaller.__main__ import run as pyi_run
+    except ImportError:
+        print("ERROR: PyInstaller not installed (pip install pyinstaller)")
+        return 1
+
+    try:
+        pyi_run(args)
+    except SystemExit as e:
+        if isinstance(e.code, int):
+            return e.code
+        return 0 if e.code is None else 1
+    except Exception as e:
+        print(f"ERROR: PyInstaller raised: {e}")
+        return 1
+    return 0
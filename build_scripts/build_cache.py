@@ -0,0 +1,144 @@
+"""
+Content-addressed cache for PyInstaller's Analysis artefacts.
+
+PyInstaller keeps its Analysis results (module graph, compiled bytecode)
+under build/<spec name>/. When that directory is lost - a --clean build, a
+fresh CI checkout - the whole Analysis phase runs again even if nothing
+changed. This module snapshots only those artefacts into .build_cache/,
+keyed by a fingerprint of every build input, and restores them when the
+inputs match. The PKG/EXE outputs, most of build/'s size, are left out:
+PyInstaller rebuilds them from the restored Analysis.
+
+Usage (from build_mac.py / build_windows.py):
+    fingerprint = compute_build_fingerprint(project_root, __version__)
+    restore_build_cache(project_root, fingerprint)
+    ... run PyInstaller ...
+    save_build_cache(project_root, fingerprint)
+"""
+
+import os
+import time
+import hashlib
+import tarfile
+from pathlib import Path
+
+CACHE_DIR_NAME = ".build_cache"
+
+# PyInstaller's work directory for buena-live.spec (--workpath build)
+WORK_DIR = Path("build") / "buena-live"
+
+# Analysis-stage files in WORK_DIR: the module graph and TOCs, the compiled
+# pure-Python archive and bytecode
+_CACHED_ARTEFACTS = ('Analysis-*.toc', 'PYZ-*.toc', 'PYZ-*.pyz',
+                     'base_library.zip', 'localpycs')
+
+# Directories never considered build inputs
+_SKIP_DIRS = {'build', 'dist', CACHE_DIR_NAME, '__pycache__', '.git',
+              'venv', '.venv', 'tufup_repo'}
+
+# Non-Python inputs that change what PyInstaller produces
+_EXTRA_INPUTS = ['buena-live.spec', 'requirements.txt', 'build_scripts/excludes.json']
+
+
+def _iter_build_inputs(project_root: Path):
+    """Yield all build input files under project_root in a stable order."""
+    python_files = []
+    for dirpath, dirnames, filenames in os.walk(project_root):
+        dirnames[:] = sorted(d for d in dirnames if d not in _SKIP_DIRS)
+        python_files.extend(
+            os.path.join(dirpath, f) for f in filenames if f.endswith('.py')
+        )
+    for path in sorted(python_files):
+        yield Path(path)
+
+    for name in _EXTRA_INPUTS:
+        path = project_root / name
+        if path.is_file():
+            yield path
+
+
+def compute_build_fingerprint(project_root: Path, version: str) -> str:
+    """
+    Hash every file that affects the PyInstaller output.
+
+    Args:
+        project_root: Repository root
+        version: Application version being built
+
+    Returns:
+        str: Hex digest identifying this exact set of build inputs
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(version.encode())
+    for path in _iter_build_inputs(project_root):
+        digest.update(path.relative_to(project_root).as_posix().encode())
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(chunk)
+    return digest.hexdigest()
+
+
+def restore_build_cache(project_root: Path, fingerprint: str) -> bool:
+    """
+    Restore the Analysis artefacts if they were produced from the same inputs.
+
+    An existing work directory is left untouched: PyInstaller already
+    reuses it incrementally.
+
+    Returns:
+        bool: True if the artefacts were restored from the cache
+    """
+    work_dir = project_root / WORK_DIR
+    cache_dir = project_root / CACHE_DIR_NAME
+    fingerprint_file = cache_dir / "fingerprint"
+    archive = cache_dir / "analysis.tar"
+
+    if work_dir.exists() or not archive.exists() or not fingerprint_file.exists():
+        return False
+    if fingerprint_file.read_text().strip() != fingerprint:
+        return False
+
+    with tarfile.open(archive) as tar:
+        tar.extractall(project_root, filter="data")
+
+    # PyInstaller redoes the Analysis if main.py is newer than its TOC, which
+    # a fresh checkout always is. The fingerprint already proved the inputs
+    # unchanged, so stamp the restored files as current
+    now = time.time()
+    for dirpath, _, filenames in os.walk(work_dir):
+        for name in filenames:
+            os.utime(os.path.join(dirpath, name), (now, now))
+
+    print(f"[OK] Restored PyInstaller cache ({fingerprint[:12]})")
+    return True
+
+
+def save_build_cache(project_root: Path, fingerprint: str) -> bool:
+    """
+    Snapshot the Analysis artefacts into the cache under the given fingerprint.
+
+    Returns:
+        bool: True if the snapshot was written
+    """
+    work_dir = project_root / WORK_DIR
+    cache_dir = project_root / CACHE_DIR_NAME
+    fingerprint_file = cache_dir / "fingerprint"
+
+    artefacts = sorted(path for pattern in _CACHED_ARTEFACTS
+                       for path in work_dir.glob(pattern))
+    if not artefacts:
+        return False
+    if fingerprint_file.exists() and fingerprint_file.read_text().strip() == fingerprint:
+        return False
+
+    cache_dir.mkdir(exist_ok=True)
+    tmp_archive = cache_dir / "analysis.tar.tmp"
+    with tarfile.open(tmp_archive, "w") as tar:
+        for path in artefacts:
+            tar.add(path, arcname=path.relative_to(project_root).as_posix())
+    os.replace(tmp_archive, cache_dir / "analysis.tar")
+    # Snapshot of the whole build/ tree written by earlier versions
+    (cache_dir / "build.tar").unlink(missing_ok=True)
+    fingerprint_file.write_text(fingerprint)
+    print(f"[OK] Saved PyInstaller cache ({fingerprint[:12]})")
+    return True
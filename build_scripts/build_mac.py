@@ -29,49 +29,77 @@ import subprocess
 import argparse
 from pathlib import Path
 
+from _common import clean_build_dirs, verify_dependencies, get_dir_size, run_pyinstaller
+
 # Add project root to path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 from version import __version__
-
-def clean_build_dirs():
-    """Remove build and dist directories."""
-    print("Cleaning build directories...")
-    dirs_to_clean = ['build', 'dist', '__pycache__']
-    for dir_name in dirs_to_clean:
-        dir_path = project_root / dir_name
-        if dir_path.exists():
-            shutil.rmtree(dir_path)
-            print(f"  Removed {dir_name}/")
-
-def build_app():
-    """Build the macOS .app bundle using PyInstaller."""
+from build_cache import compute_build_fingerprint, restore_build_cache, save_build_cache
+import compute_excludes
+
+# Every path the macOS build reads or writes, resolved once
+_PATHS = {
+    'spec': project_root / "buena-live.spec",
+    'dist': project_root / "dist",
+    'build': project_root / "build",
+    'app': project_root / "dist" / "TicketeraBuena.app",
+    'dmg': project_root / "dist" / f"TicketeraBuena-{__version__}-mac.dmg",
+}
+
+def build_app(clean=False):
+    """Build the macOS .app bundle using PyInstaller.
+
+    Args:
+        clean: Pass --clean to PyInstaller to discard its analysis cache.
+            Left off by default so rebuilds reuse the cached build/ work.
+            Also skips restoring build/ from .build_cache/.
+    """
     print(f"\nBuilding Ticketera Buena v{__version__} for macOS...")
 
     # Check if spec file exists
-    spec_file = project_root / "buena-live.spec"
+    spec_file = _PATHS['spec']
     if not spec_file.exists():
         print(f"ERROR: Spec file not found: {spec_file}")
         return False
 
-    # Run PyInstaller
-    cmd = [
-        "pyinstaller",
-        "--clean",
+    # Run PyInstaller (in-process)
+    pyi_args = [
         "--noconfirm",
+        "--distpath", str(_PATHS['dist']),
+        "--workpath", str(_PATHS['build']),
         str(spec_file)
     ]
-
-    print(f"Running: {' '.join(cmd)}")
-    result = subprocess.run(cmd, cwd=project_root)
-
-    if result.returncode != 0:
+    if clean:
+        pyi_args.insert(0, "--clean")
+
+    # Tree-shake unreachable stdlib modules (read by the spec file)
+    # (regenerated when main.py, the spec or requirements.txt is newer)
+    compute_excludes.ensure_current()
+
+    # Reuse a previous Analysis if the build inputs haven't changed
+    fingerprint = compute_build_fingerprint(project_root, __version__)
+    if not clean:
+        restore_build_cache(project_root, fingerprint)
+
+    print(f"Running: pyinstaller {' '.join(pyi_args)}")
+    returncode = run_pyinstaller(pyi_args)
+    # A hook or runtime hook imported a tree-shaken module, so this bundle
+    # lacks it: regenerate excludes.json (now keeping it) and build again
+    if returncode == 0 and compute_excludes.refresh_after_build():
+        print("Rebuilding with the updated excludes.json...")
+        fingerprint = compute_build_fingerprint(project_root, __version__)
+        returncode = run_pyinstaller(pyi_args)
+
+    if returncode != 0:
         print("ERROR: PyInstaller build failed")
         return False
 
+    save_build_cache(project_root, fingerprint)
+
     # Check if .app was created
-    app_path = project_root / "dist" / "TicketeraBuena.app"
+    app_path = _PATHS['app']
     if not app_path.exists():
         print(f"ERROR: App bundle not found at {app_path}")
         return False
@@ -90,12 +118,11 @@ def create_dmg():
         print("Skipping .dmg creation")
         return False
 
-    app_path = project_root / "dist" / "TicketeraBuena.app"
-    dmg_path = project_root / "dist" / f"TicketeraBuena-{__version__}-mac.dmg"
+    app_path = _PATHS['app']
+    dmg_path = _PATHS['dmg']
 
     # Remove existing DMG if it exists
-    if dmg_path.exists():
-        dmg_path.unlink()
+    dmg_path.unlink(missing_ok=True)
 
     # Create DMG
     cmd = [
@@ -113,38 +140,15 @@ def create_dmg():
     result = subprocess.run(cmd, cwd=project_root, capture_output=True)
 
     # Note: create-dmg sometimes returns non-zero even on success
-    if dmg_path.exists():
-        print(f"\n✓ Successfully created: {dmg_path}")
-        print(f"  Size: {dmg_path.stat().st_size / (1024*1024):.2f} MB")
-        return True
-    else:
+    try:
+        dmg_stat = os.stat(dmg_path)
+    except FileNotFoundError:
         print("ERROR: DMG creation failed")
         return False
 
-def get_dir_size(path):
-    """Calculate total size of directory in MB."""
-    total = 0
-    for entry in Path(path).rglob('*'):
-        if entry.is_file():
-            total += entry.stat().st_size
-    return total / (1024 * 1024)
-
-def verify_dependencies():
-    """Verify all required dependencies are present."""
-    print("Verifying dependencies...")
-
-    # Check credentials.json
-    credentials_path = project_root / "credentials.json"
-    if not credentials_path.exists():
-        print(f"WARNING: credentials.json not found at {credentials_path}")
-        print("  The built app will not be able to access Google Sheets")
-
-    # Check if we're in virtual environment
-    if not hasattr(sys, 'real_prefix') and not (hasattr(sys, 'base_prefix') and sys.base_prefix != sys.prefix):
-        print("WARNING: Not running in virtual environment")
-        print("  Consider activating venv: source venv/bin/activate")
-
-    print("✓ Dependency check complete\n")
+    print(f"\n✓ Successfully created: {dmg_path}")
+    print(f"  Size: {dmg_stat.st_size / (1024*1024):.2f} MB")
+    return True
 
 def main():
     parser = argparse.ArgumentParser(description="Build BuenaLive for macOS")
@@ -162,14 +166,14 @@ def main():
         return 1
 
     # Verify dependencies
-    verify_dependencies()
+    verify_dependencies(project_root, "source venv/bin/activate")
 
     # Clean if requested
     if args.clean:
-        clean_build_dirs()
+        clean_build_dirs(project_root)
 
     # Build the app
-    if not build_app():
+    if not build_app(clean=args.clean):
         return 1
 
     # Create DMG if requested
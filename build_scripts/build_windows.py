@@ -22,77 +22,111 @@ Output:
     - dist/TicketeraBuena-Setup.exe: Windows installer (if --installer specified)
 """
 
+import os
 import sys
 import shutil
 import subprocess
 import argparse
-from pathlib import Path
+from pathlib import Path, PureWindowsPath
+from string import Template
+
+from _common import (fix_windows_utf8, clean_build_dirs,
+                     verify_dependencies, run_pyinstaller)
 
 # Fix Unicode encoding issues on Windows
-if sys.platform == "win32":
-    # Force UTF-8 encoding for stdout/stderr on Windows
-    import io
-    if isinstance(sys.stdout, io.TextIOWrapper):
-        sys.stdout.reconfigure(encoding='utf-8')  # type: ignore
-    if isinstance(sys.stderr, io.TextIOWrapper):
-        sys.stderr.reconfigure(encoding='utf-8')  # type: ignore
+fix_windows_utf8()
 
 # Add project root to path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 from version import __version__
-
-def clean_build_dirs():
-    """Remove build and dist directories."""
-    print("Cleaning build directories...")
-    dirs_to_clean = ['build', 'dist', '__pycache__']
-    for dir_name in dirs_to_clean:
-        dir_path = project_root / dir_name
-        if dir_path.exists():
-            shutil.rmtree(dir_path)
-            print(f"  Removed {dir_name}/")
-
-def build_exe():
-    """Build the Windows executable using PyInstaller with optimizations."""
+from build_cache import compute_build_fingerprint, restore_build_cache, save_build_cache
+import compute_excludes
+
+# Every path the Windows build reads or writes, resolved once
+_PATHS = {
+    'spec': project_root / "buena-live.spec",
+    'dist': project_root / "dist",
+    'build': project_root / "build",
+    'exe': project_root / "dist" / "TicketeraBuena.exe",
+    'installer': project_root / "dist" / f"TicketeraBuena-Setup-{__version__}.exe",
+    'icon': project_root / "assets" / "buena-logo.ico",
+    'nsis_template': project_root / "build_scripts" / "installer.nsi.template",
+    'nsis': project_root / "build_scripts" / "installer.nsi",
+}
+
+class _NsisTemplate(Template):
+    """string.Template using @{name} placeholders; NSIS itself uses $ and ${}."""
+    delimiter = '@'
+
+def build_exe(clean=False):
+    """Build the Windows executable using PyInstaller with optimizations.
+
+    Args:
+        clean: Pass --clean to PyInstaller to discard its analysis cache.
+            Left off by default so rebuilds reuse the cached build/ work.
+            Also skips restoring build/ from .build_cache/.
+    """
     print(f"\nBuilding TicketeraBuena v{__version__} for Windows...")
     print("Optimizations enabled: module exclusions, bytecode optimization")
 
     # Check if spec file exists
-    spec_file = project_root / "buena-live.spec"
+    spec_file = _PATHS['spec']
     if not spec_file.exists():
         print(f"ERROR: Spec file not found: {spec_file}")
         return False
 
     print("  Note: UPX compression disabled for Python 3.11+ compatibility")
 
-    # Run PyInstaller with optimizations
-    cmd = [
-        "pyinstaller",
-        "--clean",           # Clean cache and remove temporary files
+    # Run PyInstaller (in-process) with optimizations
+    pyi_args = [
         "--noconfirm",       # Replace output directory without confirmation
+        "--distpath", str(_PATHS['dist']),
+        "--workpath", str(_PATHS['build']),
         str(spec_file)
     ]
+    if clean:
+        pyi_args.insert(0, "--clean")  # Clean cache and remove temporary files
+
+    # Tree-shake unreachable stdlib modules (read by the spec file)
+    # (regenerated when main.py, the spec or requirements.txt is newer)
+    compute_excludes.ensure_current()
 
-    print(f"Running: {' '.join(cmd)}")
+    # Reuse a previous Analysis if the build inputs haven't changed
+    fingerprint = compute_build_fingerprint(project_root, __version__)
+    if not clean:
+        restore_build_cache(project_root, fingerprint)
+
+    print(f"Running: pyinstaller {' '.join(pyi_args)}")
     print("This may take a few minutes...")
 
     import time
     start_time = time.time()
-    result = subprocess.run(cmd, cwd=project_root)
+    returncode = run_pyinstaller(pyi_args)
+    # A hook or runtime hook imported a tree-shaken module, so this bundle
+    # lacks it: regenerate excludes.json (now keeping it) and build again
+    if returncode == 0 and compute_excludes.refresh_after_build():
+        print("Rebuilding with the updated excludes.json...")
+        fingerprint = compute_build_fingerprint(project_root, __version__)
+        returncode = run_pyinstaller(pyi_args)
     build_time = time.time() - start_time
 
-    if result.returncode != 0:
+    if returncode != 0:
         print("ERROR: PyInstaller build failed")
         return False
 
+    save_build_cache(project_root, fingerprint)
+
     # Check if .exe was created
-    exe_path = project_root / "dist" / "TicketeraBuena.exe"
-    if not exe_path.exists():
+    exe_path = _PATHS['exe']
+    try:
+        exe_stat = os.stat(exe_path)
+    except FileNotFoundError:
         print(f"ERROR: Executable not found at {exe_path}")
         return False
 
-    exe_size_mb = exe_path.stat().st_size / (1024*1024)
+    exe_size_mb = exe_stat.st_size / (1024*1024)
     print(f"\n{'='*60}")
     print(f"[OK] Successfully built: {exe_path}")
     print(f"  Size: {exe_size_mb:.2f} MB")
@@ -103,105 +137,32 @@ def build_exe():
 
 def create_nsis_script():
     """Create NSIS installer script with absolute paths."""
-    # Get absolute path to icon for NSIS
-    icon_path = (project_root / "assets" / "buena-logo.ico").resolve()
-    icon_path_win = str(icon_path).replace('/', '\\')
-
-    # Get absolute path to dist directory
-    dist_path = (project_root / "dist").resolve()
-    dist_path_win = str(dist_path).replace('/', '\\')
-
-    nsis_script = f"""
-; TicketeraBuena NSIS Installer Script
-; Generated automatically by build_windows.py
-
-!define APP_NAME "TicketeraBuena"
-!define APP_VERSION "{__version__}"
-!define APP_PUBLISHER "TicketeraBuena"
-!define APP_EXE "TicketeraBuena.exe"
-
-; Modern UI
-!include "MUI2.nsh"
-
-; General configuration
-Name "${{APP_NAME}} ${{APP_VERSION}}"
-OutFile "{dist_path_win}\\TicketeraBuena-Setup-${{APP_VERSION}}.exe"
-InstallDir "$PROGRAMFILES\\${{APP_NAME}}"
-InstallDirRegKey HKLM "Software\\${{APP_NAME}}" "Install_Dir"
-RequestExecutionLevel admin
-
-; Interface Settings
-!define MUI_ABORTWARNING
-!define MUI_ICON "{icon_path_win}"
-!define MUI_UNICON "{icon_path_win}"
-
-; Pages
-!insertmacro MUI_PAGE_WELCOME
-!insertmacro MUI_PAGE_DIRECTORY
-!insertmacro MUI_PAGE_INSTFILES
-!insertmacro MUI_PAGE_FINISH
-
-!insertmacro MUI_UNPAGE_CONFIRM
-!insertmacro MUI_UNPAGE_INSTFILES
-
-; Languages
-!insertmacro MUI_LANGUAGE "English"
-
-; Installer Section
-Section "Install"
-    SetOutPath "$INSTDIR"
-
-    ; Add files
-    File "{dist_path_win}\\${{APP_EXE}}"
-
-    ; Create uninstaller
-    WriteUninstaller "$INSTDIR\\Uninstall.exe"
-
-    ; Registry keys
-    WriteRegStr HKLM "Software\\${{APP_NAME}}" "Install_Dir" "$INSTDIR"
-    WriteRegStr HKLM "Software\\Microsoft\\Windows\\CurrentVersion\\Uninstall\\${{APP_NAME}}" "DisplayName" "${{APP_NAME}}"
-    WriteRegStr HKLM "Software\\Microsoft\\Windows\\CurrentVersion\\Uninstall\\${{APP_NAME}}" "UninstallString" '"$INSTDIR\\Uninstall.exe"'
-    WriteRegStr HKLM "Software\\Microsoft\\Windows\\CurrentVersion\\Uninstall\\${{APP_NAME}}" "DisplayVersion" "${{APP_VERSION}}"
-    WriteRegStr HKLM "Software\\Microsoft\\Windows\\CurrentVersion\\Uninstall\\${{APP_NAME}}" "Publisher" "${{APP_PUBLISHER}}"
-    WriteRegDWORD HKLM "Software\\Microsoft\\Windows\\CurrentVersion\\Uninstall\\${{APP_NAME}}" "NoModify" 1
-    WriteRegDWORD HKLM "Software\\Microsoft\\Windows\\CurrentVersion\\Uninstall\\${{APP_NAME}}" "NoRepair" 1
-
-    ; Create shortcuts
-    CreateDirectory "$SMPROGRAMS\\${{APP_NAME}}"
-    CreateShortcut "$SMPROGRAMS\\${{APP_NAME}}\\${{APP_NAME}}.lnk" "$INSTDIR\\${{APP_EXE}}"
-    CreateShortcut "$SMPROGRAMS\\${{APP_NAME}}\\Uninstall.lnk" "$INSTDIR\\Uninstall.exe"
-    CreateShortcut "$DESKTOP\\${{APP_NAME}}.lnk" "$INSTDIR\\${{APP_EXE}}"
-SectionEnd
-
-; Uninstaller Section
-Section "Uninstall"
-    ; Remove files
-    Delete "$INSTDIR\\${{APP_EXE}}"
-    Delete "$INSTDIR\\Uninstall.exe"
-
-    ; Remove shortcuts
-    Delete "$SMPROGRAMS\\${{APP_NAME}}\\*.*"
-    Delete "$DESKTOP\\${{APP_NAME}}.lnk"
-    RMDir "$SMPROGRAMS\\${{APP_NAME}}"
-
-    ; Remove directories
-    RMDir "$INSTDIR"
-
-    ; Remove registry keys
-    DeleteRegKey HKLM "Software\\Microsoft\\Windows\\CurrentVersion\\Uninstall\\${{APP_NAME}}"
-    DeleteRegKey HKLM "Software\\${{APP_NAME}}"
-SectionEnd
-"""
+    # Absolute icon and dist paths, with backslash separators for NSIS
+    icon_path_win = str(PureWindowsPath(_PATHS['icon'].resolve()))
+    dist_path_win = str(PureWindowsPath(_PATHS['dist'].resolve()))
+
+    nsis_script = _NsisTemplate(_PATHS['nsis_template'].read_text(encoding='utf-8')).substitute(
+        app_version=__version__,
+        dist_path=dist_path_win,
+        icon_path=icon_path_win,
+    )
 
-    nsis_file = project_root / "build_scripts" / "installer.nsi"
-    with open(nsis_file, 'w') as f:
-        f.write(nsis_script)
+    nsis_file = _PATHS['nsis']
+
+    # Leave an identical script untouched so its mtime doesn't change.
+    # Written as bytes: no newline translation or text-layer encoding.
+    data = nsis_script.encode('utf-8')
+    if nsis_file.exists() and nsis_file.read_bytes() == data:
+        return nsis_file
+
+    with open(nsis_file, 'wb') as f:
+        f.write(data)
 
     return nsis_file
 
 def verify_icon():
     """Verify that the icon file exists for NSIS."""
-    icon_path = project_root / "assets" / "buena-logo.ico"
+    icon_path = _PATHS['icon']
 
     if not icon_path.exists():
         print(f"ERROR: Icon file not found: {icon_path}")
@@ -210,16 +171,23 @@ def verify_icon():
     print(f"[OK] Icon file found: {icon_path}")
     return True
 
-def create_installer():
-    """Create NSIS installer."""
-    print("\nCreating NSIS installer...")
+def prepare_installer():
+    """Locate makensis and write the NSIS script.
+
+    Nothing here depends on the built .exe, so it runs before the build:
+    a missing NSIS install is reported up front instead of after PyInstaller.
+
+    Returns:
+        tuple: (nsis_compiler, nsis_script) paths, or None if NSIS is missing
+    """
+    print("\nPreparing NSIS installer...")
 
     # Check if NSIS is installed
     nsis_compiler = shutil.which("makensis")
     if nsis_compiler is None:
         print("WARNING: NSIS not found. Download from https://nsis.sourceforge.io/")
         print("Skipping installer creation")
-        return False
+        return None
 
     # Verify icon exists
     if not verify_icon():
@@ -230,7 +198,12 @@ def create_installer():
     nsis_script = create_nsis_script()
     print(f"Created NSIS script: {nsis_script}")
 
-    # Compile installer
+    return nsis_compiler, nsis_script
+
+def compile_installer(nsis_compiler, nsis_script):
+    """Compile the NSIS installer from the already-built .exe."""
+    print("\nCreating NSIS installer...")
+
     cmd = [nsis_compiler, str(nsis_script)]
     print(f"Running: makensis...")
     result = subprocess.run(cmd, cwd=project_root)
@@ -239,31 +212,16 @@ def create_installer():
         print("ERROR: NSIS compilation failed")
         return False
 
-    installer_path = project_root / "dist" / f"TicketeraBuena-Setup-{__version__}.exe"
-    if installer_path.exists():
-        print(f"\n[OK] Successfully created: {installer_path}")
-        print(f"  Size: {installer_path.stat().st_size / (1024*1024):.2f} MB")
-        return True
-    else:
+    installer_path = _PATHS['installer']
+    try:
+        installer_stat = os.stat(installer_path)
+    except FileNotFoundError:
         print("ERROR: Installer not found after compilation")
         return False
 
-def verify_dependencies():
-    """Verify all required dependencies are present."""
-    print("Verifying dependencies...")
-
-    # Check credentials.json
-    credentials_path = project_root / "credentials.json"
-    if not credentials_path.exists():
-        print(f"WARNING: credentials.json not found at {credentials_path}")
-        print("  The built app will not be able to access Google Sheets")
-
-    # Check if we're in virtual environment
-    if not hasattr(sys, 'real_prefix') and not (hasattr(sys, 'base_prefix') and sys.base_prefix != sys.prefix):
-        print("WARNING: Not running in virtual environment")
-        print("  Consider activating venv: venv\\Scripts\\activate")
-
-    print("[OK] Dependency check complete\n")
+    print(f"\n[OK] Successfully created: {installer_path}")
+    print(f"  Size: {installer_stat.st_size / (1024*1024):.2f} MB")
+    return True
 
 def main():
     parser = argparse.ArgumentParser(description="Build TicketeraBuena for Windows")
@@ -288,20 +246,23 @@ def main():
         print("Continuing anyway, but installer creation may not work")
 
     # Verify dependencies
-    verify_dependencies()
+    verify_dependencies(project_root, "venv\\Scripts\\activate")
 
     # Clean if requested
     if args.clean:
-        clean_build_dirs()
+        clean_build_dirs(project_root)
+
+    # Prepare the installer up front; only makensis needs the built .exe
+    installer_prepared = prepare_installer() if args.installer else None
 
     # Build the executable
-    if not build_exe():
+    if not build_exe(clean=args.clean):
         return 1
 
     # Create installer if requested
     installer_success = True
     if args.installer:
-        installer_success = create_installer()
+        installer_success = installer_prepared is not None and compile_installer(*installer_prepared)
         if not installer_success:
             print("\nWARNING: Installer creation failed, but executable was built successfully")
             # Don't fail the build if only installer failed
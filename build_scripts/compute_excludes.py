@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+Compute stdlib modules unreachable from main.py for PyInstaller's excludes.
+
+Walks the import graph starting at main.py (including third-party packages
+it pulls in) with modulefinder, and writes every top-level stdlib module that
+was never reached to build_scripts/excludes.json. buena-live.spec merges that
+list into Analysis(excludes=...), so dead branches of the import graph are
+dropped before bundling.
+
+The build scripts regenerate it (ensure_current) whenever it is missing or
+older than any project module, the spec file or requirements.txt, so a new
+import never ships excluded.
+
+modulefinder cannot see imports added by PyInstaller hooks (hiddenimports),
+runtime hooks or the bootloader, so the keep-set is also seeded from the last
+build's own Analysis (build/buena-live/): every module it bundled, plus every
+import it reported as cut off by an exclude. After each build,
+refresh_after_build() checks that warn file; if a module from excludes.json
+was imported anyway, excludes.json is regenerated and the build scripts
+build once more.
+
+Usage:
+    python build_scripts/compute_excludes.py
+"""
+
+import re
+import sys
+import ast
+import json
+from pathlib import Path
+from importlib.machinery import PathFinder
+from modulefinder import ModuleFinder
+
+project_root = Path(__file__).parent.parent
+excludes_file = Path(__file__).parent / "excludes.json"
+
+# PyInstaller's work directory for buena-live.spec (--workpath build)
+pyinstaller_work_dir = project_root / "build" / "buena-live"
+
+# Lines of PyInstaller's warn-*.txt for imports that hit an exclude
+_EXCLUDED_RE = re.compile(r"^excluded module named '?([\w.]+)'? - imported by", re.MULTILINE)
+
+# Loaded by the interpreter or the PyInstaller bootloader without an import
+# statement that modulefinder could see
+ALWAYS_KEEP = {
+    'abc', 'codecs', 'collections', 'encodings', 'enum', 'functools', 'importlib',
+    'io', 'keyword', 'linecache', 'locale', 'marshal', 'operator', 'os', 'posixpath',
+    'ntpath', 're', 'reprlib', 'site', 'stat', 'struct', 'sys', 'traceback',
+    'types', 'warnings', 'weakref', 'zipimport', 'zlib',
+    # Platform modules: the analysis host may not be the target platform
+    'nt', 'posix', 'msvcrt', 'winreg', 'pwd', 'grp',
+    # Imported by PyInstaller's runtime hooks (pyi_rth_inspect, pyi_rth_pkgutil,
+    # pyi_rth_multiprocessing)
+    'inspect', 'pkgutil', 'multiprocessing',
+}
+
+
+# file_info type _NamespaceFinder gives namespace packages (modulefinder's own
+# types are small ints)
+_NAMESPACE_PACKAGE = 100
+
+
+class _NamespaceFinder(ModuleFinder):
+    """
+    ModuleFinder that can enter namespace packages (no __init__.py, e.g.
+    google/ from google-auth). The stock one assumes every spec has a loader
+    and crashes on them, aborting the whole analysis.
+    """
+
+    def find_module(self, name, path, parent=None):
+        try:
+            return super().find_module(name, path, parent)
+        except AttributeError:
+            spec = PathFinder.find_spec(name, path if path is not None else self.path)
+            if spec is None or spec.submodule_search_locations is None:
+                raise ImportError(name) from None
+            return None, list(spec.submodule_search_locations), ("", "", _NAMESPACE_PACKAGE)
+
+    def load_module(self, fqname, fp, pathname, file_info):
+        if file_info[2] != _NAMESPACE_PACKAGE:
+            return super().load_module(fqname, fp, pathname, file_info)
+        module = self.add_module(fqname)
+        module.__path__ = pathname
+        return module
+
+
+def find_used_modules(entry_point: Path) -> set:
+    """Return top-level names of every module reachable from entry_point."""
+    finder = _NamespaceFinder(path=[str(project_root)] + sys.path)
+    finder.run_script(str(entry_point))
+    return {name.split('.')[0] for name in finder.modules}
+
+
+def _toc_modules(node, found: set):
+    """Collect top-level names of the PYMODULE entries anywhere in a TOC."""
+    if isinstance(node, (list, tuple)):
+        if len(node) == 3 and node[2] == 'PYMODULE' and isinstance(node[0], str):
+            found.add(node[0].split('.')[0])
+            return
+        for item in node:
+            _toc_modules(item, found)
+
+
+def excluded_in_last_build() -> set:
+    """Top-level names the last build imported but an exclude cut off."""
+    found = set()
+    for warn_file in pyinstaller_work_dir.glob("warn-*.txt"):
+        text = warn_file.read_text(encoding="utf-8", errors="replace")
+        found.update(name.split('.')[0] for name in _EXCLUDED_RE.findall(text))
+    return found
+
+
+def modules_from_last_build() -> set:
+    """
+    Top-level names PyInstaller's last Analysis needed.
+
+    What it bundled (Analysis-00.toc) plus what it had to leave out because of
+    an exclude (warn file). Empty if there is no previous build.
+    """
+    found = excluded_in_last_build()
+    for toc_file in pyinstaller_work_dir.glob("Analysis-*.toc"):
+        try:
+            _toc_modules(ast.literal_eval(toc_file.read_text(encoding="utf-8")), found)
+        except (ValueError, SyntaxError) as e:
+            print(f"WARNING: Could not read {toc_file.name}: {e}")
+    return found
+
+
+def compute_unused_stdlib(used: set) -> list:
+    """Return public top-level stdlib modules not present in used."""
+    return sorted(
+        name for name in sys.stdlib_module_names
+        if not name.startswith('_') and name not in used and name not in ALWAYS_KEEP
+    )
+
+
+def _inputs():
+    """Files whose changes can alter the import graph or the spec's use of it."""
+    yield from project_root.glob("*.py")
+    yield project_root / "buena-live.spec"
+    yield project_root / "requirements.txt"
+
+
+def is_stale() -> bool:
+    """True if excludes.json is missing or older than any of its inputs."""
+    try:
+        generated = excludes_file.stat().st_mtime_ns
+    except FileNotFoundError:
+        return True
+    for path in _inputs():
+        try:
+            if path.stat().st_mtime_ns > generated:
+                return True
+        except FileNotFoundError:
+            continue
+    return False
+
+
+def ensure_current():
+    """Regenerate excludes.json if is_stale(); returns main()'s exit code or 0."""
+    if is_stale():
+        return main()
+    return 0
+
+
+def cut_off_modules() -> list:
+    """Modules from excludes.json that the last build imported anyway."""
+    try:
+        unused = set(json.loads(excludes_file.read_text())['unused'])
+    except FileNotFoundError:
+        return []
+    return sorted(excluded_in_last_build() & unused)
+
+
+def refresh_after_build() -> bool:
+    """
+    Regenerate excludes.json if the build that just ran cut off modules it
+    imports (hooks, runtime hooks). Returns True if the build must run again.
+    """
+    cut_off = cut_off_modules()
+    if not cut_off:
+        return False
+    print(f"WARNING: excludes.json dropped modules the build imports: {', '.join(cut_off)}")
+    return main() == 0
+
+
+def main():
+    entry_point = project_root / "main.py"
+    print(f"Analyzing imports reachable from {entry_point}...")
+
+    try:
+        used = find_used_modules(entry_point)
+    except Exception as e:
+        print(f"ERROR: Import analysis failed: {e}")
+        return 1
+
+    # What PyInstaller itself found last time (hooks, runtime hooks)
+    seeded = modules_from_last_build() - used
+    used |= seeded
+    if seeded:
+        print(f"  + {len(seeded)} modules from the last PyInstaller analysis")
+
+    unused = compute_unused_stdlib(used)
+    excludes_file.write_text(json.dumps({'used': sorted(used), 'unused': unused}, indent=2))
+
+    print(f"[OK] {len(used)} modules reachable, {len(unused)} stdlib modules unused")
+    print(f"[OK] Written: {excludes_file}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,9 +3,11 @@
 Create app icons from logo PNG for Mac (.icns) and Windows (.ico)
 """
 
+import os
 import sys
+import hashlib
 from pathlib import Path
-from PIL import Image
+from concurrent.futures import ThreadPoolExecutor
 
 project_root = Path(__file__).parent.parent
 logo_path = project_root / "assets" / "buena-logo.png"
@@ -14,10 +16,47 @@ output_dir = project_root / "assets"
 # Icon sizes needed
 ICON_SIZES = [16, 32, 48, 64, 128, 256, 512, 1024]
 
+def _source_hash(logo_path, sizes):
+    """Hash of the source image and requested sizes, used to skip regeneration"""
+    digest = hashlib.blake2b(logo_path.read_bytes(), digest_size=8)
+    digest.update(repr(sorted(sizes)).encode())
+    return digest.hexdigest()
+
+def _hash_file(output_path):
+    """Sidecar file recording the source hash output_path was built from"""
+    return output_path.with_suffix(output_path.suffix + '.hash')
+
+def _is_cached(output_path, src_hash):
+    """True if output_path exists and was built from the same source hash"""
+    hash_file = _hash_file(output_path)
+    return output_path.exists() and hash_file.exists() and hash_file.read_text() == src_hash
+
+def _resize(square, size):
+    """LANCZOS-resize the square canvas to size x size"""
+    from PIL import Image
+    return square.resize((size, size), Image.Resampling.LANCZOS)
+
+def _resize_all(square, sizes):
+    """Resize the square canvas to every distinct size, each from the source.
+
+    Chaining resizes (each level from the next larger one) would stack
+    LANCZOS ringing and blur on the small sizes. Returns a dict mapping
+    size -> image.
+    """
+    return {size: _resize(square, size) for size in set(sizes)}
+
 def create_ico(logo_path, output_path):
     """Create Windows .ico file"""
     print(f"Creating Windows icon: {output_path}")
 
+    sizes = [16, 32, 48, 64, 128, 256]
+    src_hash = _source_hash(logo_path, sizes)
+    if _is_cached(output_path, src_hash):
+        print(f"✓ Cached: {output_path}")
+        return
+
+    # Pillow is imported lazily so the no-op/error paths don't pay for it
+    from PIL import Image
     img = Image.open(logo_path)
 
     # Create square canvas
@@ -29,16 +68,31 @@ def create_ico(logo_path, output_path):
     square.paste(img, offset)
 
     # Create multiple sizes for .ico
-    icon_sizes = [(s, s) for s in [16, 32, 48, 64, 128, 256]]
+    icon_sizes = [(s, s) for s in sizes]
+
+    # Resize once per size so the ICO writer picks up ready-made images
+    images = _resize_all(square, sizes)
+    largest = max(sizes)
 
-    # Save as .ico with multiple sizes
-    square.save(output_path, format='ICO', sizes=icon_sizes)
+    # Save as .ico with multiple sizes; the largest image must be the base
+    # one because PIL drops any requested size bigger than it
+    images[largest].save(output_path, format='ICO', sizes=icon_sizes,
+                         append_images=[images[s] for s in sizes if s != largest])
+    _hash_file(output_path).write_text(src_hash)
     print(f"✓ Created: {output_path}")
 
 def create_iconset_for_mac(logo_path, output_dir):
     """Create Mac .icns file using iconutil"""
     print(f"Creating macOS icon")
 
+    icns_path = output_dir / "buena-logo.icns"
+    sizes = [16, 32, 128, 256, 512]
+    src_hash = _source_hash(logo_path, sizes)
+    if _is_cached(icns_path, src_hash):
+        print(f"✓ Cached: {icns_path}")
+        return icns_path
+
+    from PIL import Image
     img = Image.open(logo_path)
 
     # Create square canvas
@@ -53,25 +107,23 @@ def create_iconset_for_mac(logo_path, output_dir):
     iconset_dir = output_dir / "buena-logo.iconset"
     iconset_dir.mkdir(exist_ok=True)
 
-    # Generate all required sizes
-    sizes = [16, 32, 128, 256, 512]
+    # Generate all required sizes: normal and retina (@2x) resolution
+    jobs = []
     for size in sizes:
-        # Normal resolution
-        resized = square.resize((size, size), Image.Resampling.LANCZOS)
-        resized.save(iconset_dir / f"icon_{size}x{size}.png")
+        jobs.append((size, iconset_dir / f"icon_{size}x{size}.png"))
+        jobs.append((size * 2, iconset_dir / f"icon_{size}x{size}@2x.png"))
+
+    # One resize per distinct size; retina variants reuse the matching image
+    images = _resize_all(square, [target for target, _ in jobs])
 
-        # Retina resolution (@2x)
-        if size <= 512:
-            retina_size = size * 2
-            resized_retina = square.resize((retina_size, retina_size), Image.Resampling.LANCZOS)
-            resized_retina.save(iconset_dir / f"icon_{size}x{size}@2x.png")
+    # PNG encoding releases the GIL, so write the files in parallel
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        list(executor.map(lambda job: images[job[0]].save(job[1]), jobs))
 
     print(f"✓ Created iconset: {iconset_dir}")
 
     # Convert to .icns using iconutil (Mac only)
     import subprocess
-    icns_path = output_dir / "buena-logo.icns"
-
     try:
         result = subprocess.run(
             ["iconutil", "-c", "icns", str(iconset_dir), "-o", str(icns_path)],
@@ -79,6 +131,7 @@ def create_iconset_for_mac(logo_path, output_dir):
             capture_output=True,
             text=True
         )
+        _hash_file(icns_path).write_text(src_hash)
         print(f"✓ Created: {icns_path}")
         return icns_path
     except subprocess.CalledProcessError as e:
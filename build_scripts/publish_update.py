@@ -43,7 +43,6 @@ sys.path.insert(0, str(project_root))
 
 from version import __version__
 from tufup.repo import Repository
-from tufup.common import SUFFIX_ARCHIVE
 
 APP_NAME = "BuenaLive"
 DEFAULT_REPO_DIR = project_root / "tufup_repo"
@@ -112,29 +111,34 @@ def find_dist_bundle() -> Path:
     """
     dist_dir = project_root / "dist"
 
-    if not dist_dir.exists():
+    # One scandir pass: entries carry their type, and stat() results are
+    # cached on the entry, so no candidate is stat'ed more than once
+    try:
+        with os.scandir(dist_dir) as it:
+            entries = {entry.name: entry for entry in it}
+    except FileNotFoundError:
         raise FileNotFoundError(
             f"dist/ directory not found. Build the application first:\n"
             f"  Mac: python build_scripts/build_mac.py\n"
             f"  Windows: python build_scripts/build_windows.py"
-        )
+        ) from None
 
     # Look for .app (Mac) or BuenaLive directory (Windows)
     candidates = []
 
     # Mac .app bundle
-    app_bundle = dist_dir / f"{APP_NAME}.app"
-    if app_bundle.exists() and app_bundle.is_dir():
+    app_bundle = entries.get(f"{APP_NAME}.app")
+    if app_bundle is not None and app_bundle.is_dir():
         candidates.append(app_bundle)
 
     # Windows executable (single file)
-    exe_file = dist_dir / f"{APP_NAME}.exe"
-    if exe_file.exists():
+    exe_file = entries.get(f"{APP_NAME}.exe")
+    if exe_file is not None:
         candidates.append(exe_file)
 
     # Windows directory bundle (if using --onedir)
-    win_dir = dist_dir / APP_NAME
-    if win_dir.exists() and win_dir.is_dir():
+    win_dir = entries.get(APP_NAME)
+    if win_dir is not None and win_dir.is_dir():
         candidates.append(win_dir)
 
     if not candidates:
@@ -144,39 +148,8 @@ def find_dist_bundle() -> Path:
         )
 
     # Prefer most recently modified
-    latest = max(candidates, key=lambda p: p.stat().st_mtime)
-    return latest
-
-def create_archive(bundle_path: Path, output_dir: Path) -> Path:
-    """
-    Create a tufup archive from application bundle.
-
-    Args:
-        bundle_path: Path to application bundle
-        output_dir: Directory to store archive
-
-    Returns:
-        Path: Path to created archive
-
-    Notes:
-        Archive format: {app_name}-{version}.tar.gz
-    """
-    print(f"\nCreating archive from {bundle_path}...")
-
-    archive_name = f"{APP_NAME}-{__version__}{SUFFIX_ARCHIVE}"
-    archive_path = output_dir / archive_name
-
-    # Create archive using tufup's method
-    # For now, use tar command (tufup will handle this internally)
-    import tarfile
-
-    with tarfile.open(archive_path, "w:gz") as tar:
-        tar.add(bundle_path, arcname=bundle_path.name)
-
-    print(f"[OK] Created archive: {archive_path}")
-    print(f"  Size: {archive_path.stat().st_size / (1024*1024):.2f} MB")
-
-    return archive_path
+    latest = max(candidates, key=lambda entry: entry.stat().st_mtime)
+    return Path(latest.path)
 
 def publish_version(repo_dir: Path, skip_patch: bool = False):
     """
@@ -219,26 +192,18 @@ def publish_version(repo_dir: Path, skip_patch: bool = False):
         print(f"ERROR: Failed to load repository: {e}")
         return False
 
-    # Create archive
     targets_dir = repo_dir / "targets"
-    targets_dir.mkdir(exist_ok=True)
-
-    try:
-        archive_path = create_archive(bundle_path, targets_dir)
-    except Exception as e:
-        print(f"ERROR: Failed to create archive: {e}")
-        return False
 
     # Add to repository
     try:
         print(f"\nAdding version {__version__} to repository...")
 
         # This will:
-        # 1. Add archive to targets
+        # 1. Create the archive from the bundle and add it to targets
         # 2. Generate patch from previous version (if exists and not skip_patch)
         # 3. Update and sign metadata
         repo.add_bundle(
-            new_bundle_path=archive_path,
+            new_bundle_dir=bundle_path,
             new_version=__version__,
             skip_patch=skip_patch
         )
@@ -251,12 +216,13 @@ def publish_version(repo_dir: Path, skip_patch: bool = False):
         print(f"  Targets: {repo_dir}/targets/")
 
         # List target files
-        target_files = list(targets_dir.glob("*"))
+        with os.scandir(targets_dir) as it:
+            target_files = sorted((entry for entry in it if entry.is_file()),
+                                  key=lambda entry: entry.name)
         print(f"\n  Available versions:")
-        for target_file in sorted(target_files):
-            if target_file.is_file():
-                size_mb = target_file.stat().st_size / (1024*1024)
-                print(f"    - {target_file.name} ({size_mb:.2f} MB)")
+        for target_file in target_files:
+            size_mb = target_file.stat().st_size / (1024*1024)
+            print(f"    - {target_file.name} ({size_mb:.2f} MB)")
 
         print("\nNext steps:")
         print("  1. Test the update locally")
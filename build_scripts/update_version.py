@@ -24,12 +24,50 @@ import subprocess
 import argparse
 from pathlib import Path
 
+try:
+    import pygit2
+except ImportError:
+    pygit2 = None
+
 project_root = Path(__file__).parent.parent
 version_file = project_root / "version.py"
 
+# MAJOR.MINOR.PATCH with optional pre-release suffix
+SEMVER_RE = re.compile(r'^\d+\.\d+\.\d+(?:-[\w\.]+)?$')
+
+# The __version__ assignment in version.py; matched on raw bytes so the
+# file is never decoded
+VERSION_ASSIGN_RE = re.compile(rb'__version__\s*=\s*["\']([^"\']+)["\']')
+
+
+def _get_tag_from_pygit2():
+    """Find a tag pointing at HEAD in-process with libgit2 (no git subprocess)."""
+    repo = pygit2.Repository(str(project_root))
+    head = repo.head.target
+    for ref_name in repo.references:
+        if not ref_name.startswith('refs/tags/'):
+            continue
+        # Annotated tags point at a tag object; peel to the tagged commit
+        ref = repo.references[ref_name]
+        if ref.peel(pygit2.Commit).id == head:
+            return ref.shorthand
+    return None
+
 
 def get_version_from_git():
     """Get version from git tag."""
+    if pygit2 is not None:
+        try:
+            tag = _get_tag_from_pygit2()
+        except pygit2.GitError as e:
+            print(f"WARNING: pygit2 lookup failed ({e}), falling back to git")
+        else:
+            if tag:
+                print(f"Found git tag: {tag}")
+                return tag
+            print("WARNING: No git tag found on current commit")
+            return None
+
     try:
         # Get the current tag
         result = subprocess.run(
@@ -83,8 +121,7 @@ def parse_version(version_string):
         version_string = version_string[1:]
 
     # Validate semantic versioning format
-    semver_pattern = r'^\d+\.\d+\.\d+(-[\w\.]+)?$'
-    if not re.match(semver_pattern, version_string):
+    if not SEMVER_RE.match(version_string):
         print(f"ERROR: Invalid version format: {version_string}")
         print("Expected format: MAJOR.MINOR.PATCH (e.g., 1.2.3)")
         return None
@@ -94,38 +131,34 @@ def parse_version(version_string):
 
 def read_current_version():
     """Read current version from version.py."""
-    if not version_file.exists():
+    try:
+        content = version_file.read_bytes()
+    except FileNotFoundError:
         return None
 
-    with open(version_file, 'r') as f:
-        content = f.read()
-
-    match = re.search(r'__version__\s*=\s*["\']([^"\']+)["\']', content)
+    match = VERSION_ASSIGN_RE.search(content)
     if match:
-        return match.group(1)
+        return match.group(1).decode()
     return None
 
 
 def update_version_file(new_version):
     """Update version.py with new version."""
-    if not version_file.exists():
+    # Read current file
+    try:
+        content = version_file.read_bytes()
+    except FileNotFoundError:
         print(f"ERROR: version.py not found at {version_file}")
         return False
 
-    # Read current file
-    with open(version_file, 'r') as f:
-        content = f.read()
-
     # Replace version string
-    new_content = re.sub(
-        r'__version__\s*=\s*["\'][^"\']+["\']',
-        f'__version__ = "{new_version}"',
+    new_content = VERSION_ASSIGN_RE.sub(
+        f'__version__ = "{new_version}"'.encode(),
         content
     )
 
     # Write back
-    with open(version_file, 'w') as f:
-        f.write(new_content)
+    version_file.write_bytes(new_content)
 
     print(f"✓ Updated version.py: {new_version}")
     return True
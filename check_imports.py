@@ -5,6 +5,8 @@ Esto simula lo que PyInstaller necesitará en runtime.
 """
 
 import sys
+from importlib.util import find_spec
+from concurrent.futures import ThreadPoolExecutor
 
 modules_to_check = [
     # === MÓDULOS USADOS DIRECTAMENTE ===
@@ -73,14 +75,31 @@ print("Verificando módulos necesarios para PyInstaller...\n")
 missing = []
 available = []
 
-for module in modules_to_check:
+
+def probe(module):
+    """Devuelve (módulo, encontrado, error) sin ejecutar el módulo.
+
+    find_spec solo localiza el módulo (sí importa los paquetes padre de un
+    submódulo), así que no se carga todo selenium/google.
+    """
     try:
-        __import__(module)
+        return module, find_spec(module) is not None, "módulo no encontrado"
+    except ImportError as e:
+        return module, False, e
+
+
+# Las búsquedas en sys.path son independientes y liberan el GIL en los stat,
+# así que se hacen en paralelo; map conserva el orden de la lista
+with ThreadPoolExecutor(max_workers=8) as executor:
+    results = list(executor.map(probe, modules_to_check))
+
+for module, found, error in results:
+    if found:
         available.append(module)
         print(f"✓ {module}")
-    except ImportError as e:
+    else:
         missing.append(module)
-        print(f"✗ {module} - {e}")
+        print(f"✗ {module} - {error}")
 
 print(f"\n{'='*60}")
 print(f"Disponibles: {len(available)}/{len(modules_to_check)}")
@@ -28,15 +28,54 @@ import json
 import getpass
 import hashlib
 from pathlib import Path
+from functools import lru_cache
 from cryptography.fernet import Fernet
 import base64
 
+
+@lru_cache(maxsize=None)
+def _derive_key(username, directory, app_name):
+    """Deriva la clave Fernet del seed usuario/directorio/app (cacheada por proceso)"""
+    seed = f"{username}:{directory}:{app_name}".encode()
+    key_hash = hashlib.sha256(seed).digest()
+    return base64.urlsafe_b64encode(key_hash[:32])
+
+
+@lru_cache(maxsize=None)
+def _fernet_for(key):
+    """Instancia Fernet compartida por clave (es inmutable y thread-safe)"""
+    return Fernet(key)
+
+
+@lru_cache(maxsize=None)
+def _credentials_path(app_name, app_dir):
+    """Ruta del archivo de credenciales para esta app/instalación (cacheada por proceso)"""
+    # Use stable app directory name instead of CWD
+    dir_name = os.path.basename(app_dir)
+    username = getpass.getuser()
+
+    # Directorio oculto en home del usuario; se crea recién al escribir
+    # (_write_atomic), así un directorio borrado después se vuelve a crear
+    home_dir = Path.home()
+    cred_dir = home_dir / f".{app_name}_{username}_{dir_name}"
+
+    return cred_dir / "user_credentials.enc"
+
+
 class CredentialManager:
     def __init__(self, app_name="buena-live"):
         self.app_name = app_name
         self._app_dir = self._get_app_dir()
         self.credentials_file = self._get_credentials_path()
         self._encryption_key = self._generate_key()
+        # Credenciales desencriptadas y st_mtime_ns del archivo del que salieron
+        self._cached_creds = None
+        self._cached_mtime_ns = None
+
+    @property
+    def _fernet(self):
+        """Fernet de la clave estable, compartido entre instancias"""
+        return _fernet_for(self._encryption_key)
 
     def _get_app_dir(self):
         """Get a stable application directory independent of CWD.
@@ -54,16 +93,7 @@ class CredentialManager:
 
     def _get_credentials_path(self):
         """Genera la ruta del archivo de credenciales específica por usuario/app"""
-        # Use stable app directory name instead of CWD
-        dir_name = os.path.basename(self._app_dir)
-        username = getpass.getuser()
-
-        # Crear directorio oculto en home del usuario
-        home_dir = Path.home()
-        app_dir = home_dir / f".{self.app_name}_{username}_{dir_name}"
-        app_dir.mkdir(exist_ok=True)
-
-        return app_dir / "user_credentials.enc"
+        return _credentials_path(self.app_name, self._app_dir)
 
     def _generate_key(self):
         """Genera una clave de encriptación específica por usuario/máquina/app"""
@@ -72,25 +102,19 @@ class CredentialManager:
         # Use stable app directory instead of CWD for consistent key generation
         stable_dir = os.path.abspath(self._app_dir)
 
-        # Crear seed único para esta instalación/usuario
-        seed = f"{username}:{stable_dir}:{self.app_name}".encode()
-        key_hash = hashlib.sha256(seed).digest()
-
-        # Convertir a clave Fernet válida
-        return base64.urlsafe_b64encode(key_hash[:32])
+        # Clave Fernet derivada del seed único para esta instalación/usuario
+        return _derive_key(username, stable_dir, self.app_name)
 
     def _generate_legacy_key(self):
         """Generate key using the old CWD-based method for migration purposes."""
         username = getpass.getuser()
         current_dir = os.path.abspath(os.getcwd())
-        seed = f"{username}:{current_dir}:{self.app_name}".encode()
-        key_hash = hashlib.sha256(seed).digest()
-        return base64.urlsafe_b64encode(key_hash[:32])
+        return _derive_key(username, current_dir, self.app_name)
 
     def save_credentials(self, email, password):
         """Guarda credenciales encriptadas automáticamente"""
         try:
-            fernet = Fernet(self._encryption_key)
+            fernet = self._fernet
 
             credentials_data = {
                 "email": email,
@@ -103,9 +127,9 @@ class CredentialManager:
             encrypted_data = fernet.encrypt(json_data)
 
             # Guardar en archivo
-            with open(self.credentials_file, 'wb') as f:
-                f.write(encrypted_data)
+            self._write_atomic(encrypted_data)
 
+            self._cache_credentials(email, password)
             return True
 
         except Exception as e:
@@ -119,26 +143,30 @@ class CredentialManager:
         legacy CWD-based key and re-encrypts with the new stable key.
         """
         try:
-            if not os.path.exists(self.credentials_file):
+            try:
+                mtime_ns = os.stat(self.credentials_file).st_mtime_ns
+            except FileNotFoundError:
                 return None, None
 
+            # El archivo no cambió desde la última lectura: no desencriptar de nuevo
+            if self._cached_creds is not None and mtime_ns == self._cached_mtime_ns:
+                return self._cached_creds
+
             with open(self.credentials_file, 'rb') as f:
                 encrypted_data = f.read()
 
             # Try current key first
             try:
-                fernet = Fernet(self._encryption_key)
+                fernet = self._fernet
                 decrypted_data = fernet.decrypt(encrypted_data)
             except Exception:
                 # Try legacy CWD-based key for migration
                 try:
                     legacy_key = self._generate_legacy_key()
-                    legacy_fernet = Fernet(legacy_key)
+                    legacy_fernet = _fernet_for(legacy_key)
                     decrypted_data = legacy_fernet.decrypt(encrypted_data)
                     # Re-encrypt with new stable key
-                    new_fernet = Fernet(self._encryption_key)
-                    with open(self.credentials_file, 'wb') as f:
-                        f.write(new_fernet.encrypt(decrypted_data))
+                    self._write_atomic(self._fernet.encrypt(decrypted_data))
                     print("Credenciales migradas a clave estable")
                 except Exception:
                     print("Error: no se pudieron desencriptar credenciales con ninguna clave")
@@ -150,20 +178,41 @@ class CredentialManager:
             if credentials_data.get("app") != self.app_name:
                 return None, None
 
-            return credentials_data.get("email"), credentials_data.get("password")
+            return self._cache_credentials(credentials_data.get("email"),
+                                           credentials_data.get("password"))
 
         except Exception as e:
             print(f"Error cargando credenciales: {e}")
             return None, None
 
+    def _write_atomic(self, data):
+        """Escribe el archivo de credenciales de forma atómica.
+
+        Se escribe a un temporal y se reemplaza con os.replace, así un corte a
+        mitad de escritura nunca deja un archivo truncado que Fernet rechace.
+        """
+        self.credentials_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = self.credentials_file.with_suffix('.enc.tmp')
+        with open(tmp_file, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_file, self.credentials_file)
+
+    def _cache_credentials(self, email, password):
+        """Recuerda las credenciales junto con el mtime actual del archivo"""
+        self._cached_creds = (email, password)
+        self._cached_mtime_ns = os.stat(self.credentials_file).st_mtime_ns
+        return self._cached_creds
+
     def credentials_exist(self):
-        """Verifica si existen credenciales guardadas"""
+        """Verifica si existen credenciales guardadas y válidas para esta app"""
+        # Con el cache de load_credentials solo se desencripta si el archivo cambió
         email, password = self.load_credentials()
         return email is not None and password is not None
 
     def clear_credentials(self):
         """Elimina credenciales guardadas"""
         try:
+            self._cached_creds = self._cached_mtime_ns = None
             if os.path.exists(self.credentials_file):
                 os.remove(self.credentials_file)
             return True
@@ -173,6 +222,7 @@ class CredentialManager:
 
     def update_credentials_if_changed(self, email, password):
         """Actualiza credenciales solo si son diferentes a las guardadas"""
+        # Con el cache de load_credentials esto no desencripta si nada cambió
         saved_email, saved_password = self.load_credentials()
 
         # Si no hay credenciales guardadas o son diferentes, guardar
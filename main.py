@@ -28,6 +28,8 @@ See Also:
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext
 import threading
+import queue
+from concurrent.futures import ThreadPoolExecutor
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
@@ -35,9 +37,12 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import (TimeoutException, NoSuchElementException,
+                                        InvalidSessionIdException, WebDriverException,
+                                        StaleElementReferenceException)
 from webdriver_manager.chrome import ChromeDriverManager
 import gspread
+from gspread.utils import rowcol_to_a1
 from google.oauth2.service_account import Credentials
 import time
 import os
@@ -45,6 +50,13 @@ from datetime import datetime
 import sys
 import re
 import json
+import hashlib
+import string
+import shutil
+import subprocess
+import tempfile
+from functools import lru_cache
+from pathlib import Path
 from credential_manager import CredentialManager
 from version import __version__
 import updater
@@ -88,6 +100,673 @@ if sys.platform == 'win32':
                 except (AttributeError, OSError):
                     pass
 
+# Path de ChromeDriver resuelto por webdriver-manager, persistido entre ejecuciones
+CHROMEDRIVER_CACHE_FILE = Path.home() / ".cache" / "buenalive" / "chromedriver_path.json"
+
+CHROME_VERSION_RE = re.compile(r'(\d+)\.\d+')
+
+
+@lru_cache(maxsize=None)
+def _detect_chrome_major():
+    """Versión mayor de Google Chrome instalada, o None si no se puede detectar"""
+    version = None
+    try:
+        if sys.platform == 'win32':
+            import winreg
+            for hive in (winreg.HKEY_CURRENT_USER, winreg.HKEY_LOCAL_MACHINE):
+                try:
+                    with winreg.OpenKey(hive, r"Software\Google\Chrome\BLBeacon") as key:
+                        version = winreg.QueryValueEx(key, "version")[0]
+                        break
+                except OSError:
+                    continue
+        else:
+            if sys.platform == 'darwin':
+                candidates = ['/Applications/Google Chrome.app/Contents/MacOS/Google Chrome']
+            else:
+                candidates = [shutil.which(name) for name in
+                              ('google-chrome', 'google-chrome-stable', 'chromium', 'chromium-browser')]
+            for binary in candidates:
+                if binary and os.path.exists(binary):
+                    result = subprocess.run([binary, '--version'], capture_output=True,
+                                            text=True, check=False, timeout=10)
+                    version = result.stdout
+                    break
+    except Exception:
+        return None
+
+    match = CHROME_VERSION_RE.search(version or '')
+    return int(match.group(1)) if match else None
+
+
+def _load_cached_chromedriver(chrome_major):
+    """Path de ChromeDriver persistido si sigue siendo válido para esta versión de Chrome"""
+    if chrome_major is None:
+        return None
+    try:
+        with open(CHROMEDRIVER_CACHE_FILE, encoding='utf-8') as f:
+            cached = json.load(f)
+        if cached['chrome_major'] != chrome_major:
+            return None
+        # Si el binario fue reemplazado o borrado (p. ej. por el antivirus), re-resolver
+        if os.stat(cached['path']).st_mtime != cached['mtime']:
+            return None
+        return cached['path']
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _save_cached_chromedriver(chrome_major, driver_path):
+    """Persiste el path de ChromeDriver junto con la versión de Chrome y su mtime"""
+    if chrome_major is None:
+        return
+    try:
+        CHROMEDRIVER_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        with open(CHROMEDRIVER_CACHE_FILE, 'w', encoding='utf-8') as f:
+            json.dump({'chrome_major': chrome_major, 'path': driver_path,
+                       'mtime': os.stat(driver_path).st_mtime}, f)
+    except OSError:
+        pass
+
+
+@lru_cache(maxsize=None)
+def _install_chromedriver(chrome_major):
+    """ChromeDriverManager().install() una vez por versión mayor de Chrome y proceso"""
+    return ChromeDriverManager().install()
+
+
+def _sheet_write_ranges(pending):
+    """Arma los rangos de values_batch_update a partir de (hoja, fila, col, valor).
+
+    Las celdas contiguas de una misma fila (Resultado + Código) viajan como un
+    solo rango en vez de uno por celda.
+    """
+    groups = []
+    for title, row, col, value in pending:
+        last = groups[-1] if groups else None
+        if last and last[:2] == (title, row) and last[2] + len(last[3]) == col:
+            last[3].append(value)
+        else:
+            groups.append((title, row, col, [value]))
+
+    data = []
+    for title, row, col, values in groups:
+        quoted = title.replace("'", "''")
+        end = rowcol_to_a1(row, col + len(values) - 1)
+        data.append({'range': f"'{quoted}'!{rowcol_to_a1(row, col)}:{end}", 'values': [values]})
+    return data
+
+
+def _env_int(name, default):
+    """Entero positivo de una variable de entorno, o default si falta o es inválido"""
+    value = os.getenv(name, '')
+    return int(value) if value.isdigit() and int(value) > 0 else default
+
+
+GOOGLE_SCOPES = ['https://spreadsheets.google.com/feeds',
+                 'https://www.googleapis.com/auth/drive']
+
+
+@lru_cache(maxsize=1)
+def _get_gspread_client(credentials_file):
+    """Cliente gspread autorizado, uno por proceso.
+
+    Parsear credentials.json y cargar la clave RSA se hace una sola vez; el
+    token se renueva solo cuando vence. Lanza excepción si el archivo falta
+    o es inválido (y en ese caso no queda cacheado).
+    """
+    # Leer credentials.json con utf-8-sig para manejar BOM en Windows
+    with open(credentials_file, 'r', encoding='utf-8-sig') as f:
+        creds_data = json.load(f)
+    creds = Credentials.from_service_account_info(creds_data, scopes=GOOGLE_SCOPES)
+    return gspread.authorize(creds)
+
+
+# Spreadsheets ya abiertos por ID: reconectar al mismo Sheet no repite open_by_key
+_opened_spreadsheets = {}
+
+
+# Filas emitidas cuyo resultado todavía no se confirmó en el Sheet, registradas en
+# disco apenas se emite cada ticket: si la app se cierra antes de que el lote
+# llegue al Sheet, la próxima corrida no las reemite. Cada entrada se borra en
+# cuanto su escritura se confirma; el Sheet sigue siendo la fuente de verdad
+PROCESSED_ROWS_FILE = Path.home() / ".cache" / "buenalive" / "processed_rows.json"
+
+# Columnas que escribe la automatización; no cuentan para identificar la fila
+_OUTPUT_COLUMNS = ('Resultado', 'Código', 'Estado')
+
+_processed_rows = None
+_processed_rows_lock = threading.Lock()
+
+
+def _row_fingerprint(row):
+    """Hash estable del contenido de la fila, para no confundirla si el Sheet cambió"""
+    data = '\x1f'.join(f"{k}={v}" for k, v in row.items() if k not in _OUTPUT_COLUMNS)
+    return hashlib.sha1(data.encode('utf-8')).hexdigest()
+
+
+def _load_processed_rows():
+    """{hoja: {fila: [fingerprint, ticket]}} persistido, o vacío si no hay registro"""
+    global _processed_rows
+    if _processed_rows is None:
+        try:
+            with open(PROCESSED_ROWS_FILE, encoding='utf-8') as f:
+                _processed_rows = json.load(f)
+        except (OSError, ValueError):
+            _processed_rows = {}
+    return _processed_rows
+
+
+def _processed_ticket(sheet_key, idx, row):
+    """Ticket ya emitido para esta fila según el registro local, o None"""
+    with _processed_rows_lock:
+        entry = _load_processed_rows().get(sheet_key, {}).get(str(idx))
+    if entry and entry[0] == _row_fingerprint(row):
+        return entry[1]
+    return None
+
+
+def _write_processed_rows(rows):
+    """Reescribe el registro (reemplazo atómico); llamar con _processed_rows_lock"""
+    try:
+        PROCESSED_ROWS_FILE.parent.mkdir(parents=True, exist_ok=True)
+        tmp = PROCESSED_ROWS_FILE.with_suffix('.tmp')
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(rows, f)
+        os.replace(tmp, PROCESSED_ROWS_FILE)
+    except OSError:
+        pass
+
+
+def _save_processed_row(sheet_key, idx, row, ticket_number):
+    """Registra la fila como emitida y pendiente de confirmar en el Sheet"""
+    with _processed_rows_lock:
+        rows = _load_processed_rows()
+        rows.setdefault(sheet_key, {})[str(idx)] = [_row_fingerprint(row), ticket_number]
+        _write_processed_rows(rows)
+
+
+def _forget_processed_rows(sheet_rows):
+    """Borra del registro las filas [(hoja, fila), ...] ya confirmadas en el Sheet"""
+    with _processed_rows_lock:
+        rows = _load_processed_rows()
+        changed = False
+        for sheet_key, idx in sheet_rows:
+            entries = rows.get(sheet_key)
+            if entries and entries.pop(str(idx), None) is not None:
+                changed = True
+                if not entries:
+                    del rows[sheet_key]
+        if changed:
+            _write_processed_rows(rows)
+
+
+# Perfil de Chrome persistente (opt-in con BL_PERSIST_PROFILE): conserva entre
+# corridas el cache HTTP en disco, el bytecode de V8 y los service workers
+PERSISTENT_PROFILE_NAME = 'buenalive-profile'
+PERSISTENT_DISK_CACHE_BYTES = 512 * 1024 * 1024
+
+
+def _persistent_profile_dir():
+    """Directorio del perfil persistente, preferentemente en tmpfs (RAM)"""
+    base = os.environ.get('XDG_RUNTIME_DIR')
+    if not base and os.path.isdir('/dev/shm'):
+        base = '/dev/shm'
+    if not base:
+        base = tempfile.gettempdir()
+    profile = os.path.join(base, PERSISTENT_PROFILE_NAME)
+    os.makedirs(os.path.join(profile, 'cache'), exist_ok=True)
+    return profile
+
+class _DniCharTable(dict):
+    """Tabla para str.translate: conserva letras y dígitos ASCII, borra el resto.
+
+    Cualquier otro code point (incluidos los >255, p. ej. guiones Unicode) cae
+    en __missing__, que lo marca para borrar y lo deja cacheado en la tabla.
+    """
+    def __missing__(self, codepoint):
+        self[codepoint] = None
+        return None
+
+_DNI_TABLE = _DniCharTable((ord(c), ord(c)) for c in string.ascii_letters + string.digits)
+
+# Espacios Unicode que aparecen en fechas del sitio/Sheets (NBSP, thin space,
+# narrow NBSP), reemplazados por ' ' en una sola pasada con str.translate
+_SPACES_TABLE = str.maketrans({'\u00a0': ' ', '\u2009': ' ', '\u202f': ' '})
+
+def _parse_valor(valor):
+    """Normaliza el 'Valor' del Sheet en una pasada.
+
+    Returns:
+        (texto, nombre_tarifa): el texto completo ("General - $ 1.000,00") y el
+        nombre de la tarifa antes de " -" ("General"), o el texto entero si
+        no trae precio. Los valores numéricos (int/float) se convierten sin
+        recorrer el string.
+    """
+    if isinstance(valor, (int, float)):
+        texto = str(valor)
+        return texto, texto
+    texto = str(valor).strip()
+    nombre, sep, _ = texto.partition(' -')
+    return texto, (nombre.strip() if sep else texto)
+
+
+def _find_tarifa(textos, valor_sheet, nombre_tarifa):
+    """Índice de la opción de tarifa que corresponde al Valor del Sheet, o None.
+
+    Primero busca el texto exacto; si no, por nombre de tarifa, prefiriendo la
+    opción con precio real sobre la gratuita ($ 0,00).
+    """
+    try:
+        return textos.index(valor_sheet)
+    except ValueError:
+        pass
+
+    encontrada = None
+    prefijo = nombre_tarifa + ' -'
+    for i, texto in enumerate(textos):
+        if texto.startswith(prefijo):
+            if encontrada is None or '$ 0,00' not in texto:
+                encontrada = i
+    return encontrada
+
+# Recursos que el POS no necesita para operar (tracking y fuentes); se bloquean
+# por CDP para que Chrome ni siquiera los descargue
+BLOCKED_URL_PATTERNS = [
+    '*google-analytics.com*',
+    '*googletagmanager.com*',
+    '*hotjar*',
+    '*intercom*',
+    '*facebook.net*',
+    '*.woff',
+    '*.woff2',
+    '*.ttf',
+    # Imágenes rasterizadas (logos, banners de eventos): el formulario no las usa
+    '*.png',
+    '*.jpg',
+    '*.jpeg',
+    '*.gif',
+    '*.webp',
+]
+
+# Orígenes cuyo storage se borra al reutilizar Chrome; las cookies se borran
+# para todos los dominios, pero Storage.clearDataForOrigin va origen por origen
+SESSION_ORIGINS = ('https://pos.buenalive.com',)
+
+# Pantallas del login: selector de sistema (Backoffice) y tarjetas de eventos
+# del dashboard
+BACKOFFICE_XPATH = "//h2[contains(text(),'Backoffice')]"
+DASHBOARD_CARD_CSS = "li[class*='block overflow-hidden rounded bg-white']"
+
+def _login_page_state(driver):
+    """En qué pantalla quedó el login: 'form', 'backoffice', 'dashboard' o False.
+
+    Con el perfil persistente (BL_PERSIST_PROFILE) la sesión puede seguir
+    abierta y la home ya no muestra el formulario. Sirve como condición de
+    WebDriverWait: False sigue esperando.
+    """
+    if driver.find_elements(By.ID, "username"):
+        return 'form'
+    if driver.find_elements(By.XPATH, BACKOFFICE_XPATH):
+        return 'backoffice'
+    if driver.find_elements(By.CSS_SELECTOR, DASHBOARD_CARD_CSS):
+        return 'dashboard'
+    return False
+
+# Selectores del formulario de emisión (componentes headlessui). Los ids llevan
+# un sufijo generado (p. ej. headlessui-listbox-button-:r1:), así que alcanza con
+# matchear el prefijo: CSS [id^=...] lo resuelve querySelectorAll de forma nativa
+LISTBOX_BUTTONS_CSS = 'button[id^="headlessui-listbox-button"]'
+FUNCION_BUTTONS_CSS = 'button[id^="headlessui-listbox-button"].cursor-default'
+LISTBOX_OPTIONS_CSS = 'li[id^="headlessui-listbox-option"]'
+COMBOBOX_BUTTON_CSS = 'button[id^="headlessui-combobox-button"]'
+COMBOBOX_OPTIONS_CSS = 'li[id^="headlessui-combobox-option"]'
+SALE_PAGE_READY_CSS = 'button[id^="headlessui-listbox-button"], input, form'
+
+# wait_and_click trabaja con XPath; starts-with() en vez de contains()
+TIPO_DOC_BUTTON_XPATH = "//button[starts-with(@id, 'headlessui-listbox-button')]//span[contains(text(), '{}')]/.."
+PAGAR_BUTTON_XPATH = "//button[@type='submit' and contains(., 'Pagar')]"
+# Las opciones de pago cargaron: el selector de forma de pago o el botón Pagar
+PAYMENT_OPTIONS_XPATH = "//div[@role='radiogroup'] | " + PAGAR_BUTTON_XPATH
+CORTESIA_RADIO_XPATH = "//div[@role='radiogroup']//p[text()='Cortesía']/ancestor::div[@role='radio']"
+
+# Dónde aparece el número de ticket en la confirmación, en orden de preferencia
+TICKET_NUMBER_XPATHS = (
+    "//p[contains(@class, 'text-gray-500') and contains(text(), '#')]",
+    "//span[contains(text(), '#')]",
+    "//div[contains(text(), '#')]",
+    "//*[contains(@class, 'text-sm') and contains(text(), '#')]",
+)
+# Unión de todos, para esperar a que aparezca cualquiera
+TICKET_NUMBER_ANY_XPATH = " | ".join(TICKET_NUMBER_XPATHS)
+
+# Lo mismo que recorrer TICKET_NUMBER_XPATHS leyendo .text de cada elemento,
+# pero en un solo execute_script: candidatos con '#' en su propio texto, en el
+# mismo orden de preferencia; devuelve el primer '#123' o null
+JS_READ_TICKET_NUMBER = """
+var selectors = ['p.text-gray-500', 'span', 'div', '.text-sm'];
+function ownText(el) {
+    var text = '';
+    for (var node = el.firstChild; node; node = node.nextSibling) {
+        if (node.nodeType === Node.TEXT_NODE) text += node.data;
+    }
+    return text;
+}
+for (var s = 0; s < selectors.length; s++) {
+    var nodes = document.querySelectorAll(selectors[s]);
+    for (var i = 0; i < nodes.length; i++) {
+        if (ownText(nodes[i]).indexOf('#') === -1) continue;
+        var match = (nodes[i].innerText || '').match(/#\d+/);
+        if (match) return match[0];
+    }
+}
+return null;
+"""
+
+# Espera con un MutationObserver (hasta arguments[1] ms) a que se rendericen las
+# opciones del listbox que abre el click en arguments[0], y se las pasa a
+# onOptions(); cada script define antes onOptions() y sus propios argumentos
+_JS_OPEN_LISTBOX_AND_WAIT = """
+var done = arguments[arguments.length - 1];
+var finished = false;
+function listOptions() {
+    return document.querySelectorAll('li[id^="headlessui-listbox-option"]');
+}
+function optionLabel(li) {
+    var span = li.querySelector('span.block.truncate');
+    return (span || li).innerText.trim();
+}
+function finish() {
+    if (finished) return;
+    finished = true;
+    observer.disconnect();
+    clearTimeout(timer);
+    onOptions(listOptions());
+}
+var observer = new MutationObserver(function () {
+    if (listOptions().length) finish();
+});
+observer.observe(document.body, {childList: true, subtree: true});
+var timer = setTimeout(finish, arguments[1]);
+arguments[0].click();
+if (listOptions().length) finish();
+"""
+
+# Abre el listbox y devuelve los textos de sus opciones
+JS_OPEN_LISTBOX = """
+function onOptions(options) {
+    done(Array.prototype.map.call(options, optionLabel));
+}
+""" + _JS_OPEN_LISTBOX_AND_WAIT
+
+# Abre el listbox y clickea la primera opción que contenga arguments[2] (sin
+# distinguir mayúsculas), o la primera opción si arguments[3]; devuelve el
+# texto clickeado o null. El texto viaja como argumento, no en un selector
+JS_SELECT_LISTBOX_OPTION = """
+var needle = arguments[2].toLowerCase();
+var fallbackFirst = arguments[3];
+function onOptions(options) {
+    var chosen = null;
+    for (var i = 0; i < options.length && !chosen; i++) {
+        if (optionLabel(options[i]).toLowerCase().includes(needle)) chosen = options[i];
+    }
+    if (!chosen && fallbackFirst && options.length) chosen = options[0];
+    if (chosen) chosen.click();
+    done(chosen ? optionLabel(chosen) : null);
+}
+""" + _JS_OPEN_LISTBOX_AND_WAIT
+
+# Abre el combobox (click en arguments[0]) y devuelve los textos de sus opciones
+# apenas se renderizan, o [] a los arguments[1] ms
+JS_OPEN_COMBOBOX = """
+var done = arguments[arguments.length - 1];
+var finished = false;
+function listOptions() {
+    return document.querySelectorAll('li[id^="headlessui-combobox-option"]');
+}
+function finish() {
+    if (finished) return;
+    finished = true;
+    observer.disconnect();
+    clearTimeout(timer);
+    done(Array.prototype.map.call(listOptions(), function (li) {
+        return li.innerText.trim();
+    }));
+}
+var observer = new MutationObserver(function () {
+    if (listOptions().length) finish();
+});
+observer.observe(document.body, {childList: true, subtree: true});
+var timer = setTimeout(finish, arguments[1]);
+arguments[0].click();
+if (listOptions().length) finish();
+"""
+
+# Clickea la opción número arguments[0] del combobox abierto
+JS_CLICK_COMBOBOX_OPTION = """
+var option = document.querySelectorAll('li[id^="headlessui-combobox-option"]')[arguments[0]];
+if (!option) return false;
+option.click();
+return true;
+"""
+
+# Clickea la opción del listbox abierto cuyo texto es exactamente arguments[0]
+JS_CLICK_LISTBOX_OPTION = """
+var options = document.querySelectorAll('li[id^="headlessui-listbox-option"]');
+for (var i = 0; i < options.length; i++) {
+    var span = options[i].querySelector('span.block.truncate');
+    if ((span || options[i]).innerText.trim() === arguments[0]) {
+        options[i].click();
+        return true;
+    }
+}
+return false;
+"""
+
+# Resuelve true apenas aparece un alert de documento duplicado (la clave
+# 'duplicatedDocuments' o su mensaje traducido), y false apenas
+# aparecen las opciones de pago (la reserva pasó) o a los arguments[0] ms; un
+# MutationObserver evita tener que consultar en un loop
+JS_WAIT_DUPLICATE_DNI = """
+var done = arguments[arguments.length - 1];
+var finished = false;
+function finish(found) {
+    if (finished) return;
+    finished = true;
+    observer.disconnect();
+    clearTimeout(timer);
+    done(found);
+}
+var duplicated = /duplicatedDocuments|DNI.*duplicad|ya.*registrad/i;
+function check() {
+    var alerts = document.querySelectorAll('div[role="alert"]');
+    for (var i = 0; i < alerts.length; i++) {
+        if (duplicated.test(alerts[i].textContent)) {
+            finish(true);
+            return;
+        }
+    }
+    if (document.querySelector('div[role="radiogroup"]')) {
+        finish(false);
+        return;
+    }
+    var submits = document.querySelectorAll('button[type="submit"]');
+    for (var j = 0; j < submits.length; j++) {
+        if (submits[j].textContent.includes('Pagar')) {
+            finish(false);
+            return;
+        }
+    }
+}
+var observer = new MutationObserver(check);
+observer.observe(document.body, {childList: true, subtree: true, characterData: true});
+var timer = setTimeout(function () { finish(false); }, arguments[0]);
+check();
+"""
+
+# Resuelve true apenas el selector arguments[0] aparece en el DOM (o desaparece,
+# si arguments[1] es false), o el estado final a los arguments[2] ms
+JS_WAIT_FOR_SELECTOR = """
+var done = arguments[arguments.length - 1];
+var selector = arguments[0];
+var present = arguments[1];
+var finished = false;
+function matches() {
+    return (document.querySelector(selector) !== null) === present;
+}
+function finish(ok) {
+    if (finished) return;
+    finished = true;
+    observer.disconnect();
+    clearTimeout(timer);
+    done(ok);
+}
+var observer = new MutationObserver(function () {
+    if (matches()) finish(true);
+});
+observer.observe(document.documentElement, {childList: true, subtree: true, attributes: true});
+var timer = setTimeout(function () { finish(matches()); }, arguments[2]);
+if (matches()) finish(true);
+"""
+
+# Extrae nombre y link "Emitir stock" de cada tarjeta de evento en un solo viaje
+JS_SCRAPE_EVENTS = """
+var cards = document.querySelectorAll('li.block.overflow-hidden.rounded.bg-white');
+var events = [];
+for (var i = 0; i < cards.length; i++) {
+    var title = cards[i].querySelector('a.font-semibold');
+    var links = cards[i].querySelectorAll('a');
+    for (var j = 0; j < links.length; j++) {
+        if (title && links[j].textContent.includes('Emitir stock') && links[j].href) {
+            events.push({name: title.innerText, href: links[j].href});
+            break;
+        }
+    }
+}
+return events;
+"""
+
+# Escribe arguments[1] en el input arguments[0] de una vez. Usa el setter nativo
+# de value (el de la instancia lo intercepta el value tracker de React, que si no
+# descartaría el cambio) y dispara input/change para que el form lo registre
+JS_SET_INPUT_VALUE = """
+var el = arguments[0];
+var proto = el instanceof HTMLTextAreaElement ? HTMLTextAreaElement.prototype : HTMLInputElement.prototype;
+Object.getOwnPropertyDescriptor(proto, 'value').set.call(el, arguments[1]);
+el.dispatchEvent(new Event('input', {bubbles: true}));
+el.dispatchEvent(new Event('change', {bubbles: true}));
+"""
+
+# Recorre una lista fija de pasos de click dentro del navegador, en un solo
+# round trip. Cada paso espera (MutationObserver, hasta timeout_ms) un elemento
+# visible y habilitado que coincida con alguno de sus (css, texto), lo clickea y,
+# si tiene wait_gone, espera a que ese selector desaparezca. Si el paso no
+# aparece se prueba su fallback; si en cambio aparece algo de su skip_if (la
+# página ya pasó a la etapa siguiente) se saltea sin agotar el timeout.
+# Devuelve un bool por paso (clickeado o no)
+JS_RUN_CLICK_STEPS = """
+var steps = arguments[0];
+var done = arguments[arguments.length - 1];
+var results = [];
+function usable(el) {
+    return !el.disabled && el.getClientRects().length > 0;
+}
+var SKIP = {};
+function findAny(alternatives) {
+    for (var a = 0; a < alternatives.length; a++) {
+        var nodes = document.querySelectorAll(alternatives[a][0]);
+        for (var i = 0; i < nodes.length; i++) {
+            if (nodes[i].textContent.includes(alternatives[a][1]) && usable(nodes[i])) {
+                return nodes[i];
+            }
+        }
+    }
+    return null;
+}
+function find(step) {
+    var el = findAny(step.alternatives);
+    if (!el && step.skip_if && findAny(step.skip_if)) return SKIP;
+    return el;
+}
+function waitFor(test, timeoutMs, callback) {
+    var finished = false;
+    var observer = null;
+    var timer = null;
+    function finish(result) {
+        if (finished) return;
+        finished = true;
+        if (observer) observer.disconnect();
+        clearTimeout(timer);
+        callback(result);
+    }
+    var first = test();
+    if (first) { finish(first); return; }
+    observer = new MutationObserver(function () {
+        var result = test();
+        if (result) finish(result);
+    });
+    observer.observe(document.body, {childList: true, subtree: true, attributes: true});
+    timer = setTimeout(function () { finish(null); }, timeoutMs);
+}
+function runStep(step, next) {
+    waitFor(function () { return find(step); }, step.timeout_ms, function (el) {
+        if (el === SKIP) { next(false); return; }
+        if (!el) {
+            if (step.fallback) runStep(step.fallback, next);
+            else next(false);
+            return;
+        }
+        el.click();
+        if (!step.wait_gone) { next(true); return; }
+        waitFor(function () { return !document.querySelector(step.wait_gone); },
+                step.wait_gone_ms, function () { next(true); });
+    });
+}
+function run(index) {
+    if (index >= steps.length) { done(results); return; }
+    runStep(steps[index], function (clicked) {
+        results.push(clicked);
+        run(index + 1);
+    });
+}
+run(0);
+"""
+
+# Pasos fijos del formulario después de guardar asistentes, para run_click_steps.
+# Equivalen a los XPath de wait_and_click: contains(@class, 'group') → .group,
+# contains(., 'X') → texto contenido. Sin 'timeout' usan el default de headless
+# Botón que indica que ya se está en la elección de método de envío
+_QUENTRO_BUTTON = ('button.group', 'Quentro')
+
+# Innominados: omitir la carga de asistentes (PASO 6)
+CLICK_STEPS_OMITIR_ASISTENTES = [
+    {'description': 'botón Omitir',
+     'alternatives': [('button[type="submit"]', 'Omitir')], 'timeout': 5,
+     'skip_if': [_QUENTRO_BUTTON],
+     'fallback': {'alternatives': [('button.bg-primary-600', 'Omitir')], 'timeout': 3}},
+]
+CLICK_STEPS_METODO_ENVIO = [
+    {'description': 'omitir', 'alternatives': [('button', 'Omitir')], 'timeout': 3,
+     'skip_if': [_QUENTRO_BUTTON]},
+    {'description': 'Quentro', 'alternatives': [_QUENTRO_BUTTON]},
+    {'description': 'enviar por email', 'alternatives': [('button.group', 'Enviar por email')]},
+]
+CLICK_STEPS_DESPUES_EMAIL = [
+    {'description': 'botón Continuar después de email',
+     'alternatives': [('button[type="submit"].self-end', 'Continuar')],
+     'timeout': 5,
+     # Espera a que cargue la siguiente sección (el campo email desaparece)
+     'wait_gone': '#email', 'wait_gone_timeout': 3,
+     'fallback': {'alternatives': [('button[type="submit"].bg-primary-600', 'Continuar')],
+                  'timeout': 3, 'wait_gone': '#email', 'wait_gone_timeout': 3}},
+    {'description': 'omitir pequeño',
+     'alternatives': [('div.border-t button[type="button"]', 'Omitir')], 'timeout': 5},
+]
+CLICK_STEPS_RESERVAR = [
+    {'description': 'reservar entradas', 'alternatives': [('button', 'Reservar entradas')],
+     'fallback': {'alternatives': [('button.bg-primary-600.text-base', '')]}},
+]
+
 class TicketAutomation:
     def __init__(self, headless_mode=True):
         self.driver = None
@@ -101,10 +780,36 @@ class TicketAutomation:
         else:
             # Running in development - use current directory
             self.credentials_file = "credentials.json"
-        self.log_text = None
+        # Cola hacia el widget de log de la GUI (None = solo consola)
+        self.log_queue = None
         self.selected_event = None
         self.current_row = None
         self.headless_mode = headless_mode  # Configuración para producción
+        # Escrituras al Sheet pendientes (hoja, fila, col, valor), enviadas juntas
+        # con values_batch_update
+        self._pending_writes = []
+        self._writes_lock = threading.Lock()
+        # Los lotes intermedios se envían en este hilo, sin frenar la emisión;
+        # un solo worker mantiene el orden de las escrituras
+        self._sheet_executor = ThreadPoolExecutor(max_workers=1)
+        # {worksheet.id: {encabezado: columna 1-based}}, de la última lectura
+        self._header_index = {}
+        # {spreadsheet.id: {título: Worksheet}}: los metadatos se piden una vez
+        self._worksheets = {}
+        self._login_credentials = None
+        # Las sesiones paralelas prefijan su log y no comparten el perfil persistente
+        self.log_prefix = ""
+        self.allow_persistent_profile = True
+        # Tope actual de execute_async_script en el driver (segundos)
+        self._script_timeout = 0
+        # Chrome adicionales ya logueados (BL_SESSIONS), reutilizados entre corridas
+        self._helpers = []
+        self._helpers_lock = threading.Lock()
+        # Serializa los arranques de sesiones; _helpers_lock solo cuida la lista
+        self._warm_lock = threading.Lock()
+        # Se marca al cerrar la aplicación: las corridas en curso cortan en la
+        # próxima fila en vez de seguir contra un Chrome ya cerrado
+        self._closing = threading.Event()
         
     def setup_driver(self):
         """Configura el driver de Chrome con optimizaciones de performance"""
@@ -138,7 +843,11 @@ class TicketAutomation:
         # Optimizaciones de performance para procesamiento masivo
         chrome_options.add_argument('--disable-extensions')
         chrome_options.add_argument('--disable-plugins')
-        chrome_options.add_argument('--disable-images')
+        # Chrome no tiene un switch --disable-images: las imágenes se apagan con
+        # la preferencia de contenido (y además se bloquean por CDP)
+        chrome_options.add_experimental_option('prefs', {
+            'profile.managed_default_content_settings.images': 2,
+        })
         chrome_options.add_argument('--disable-javascript-harmony-shipping')
         chrome_options.add_argument('--disable-background-timer-throttling')
         chrome_options.add_argument('--disable-renderer-backgrounding')
@@ -149,6 +858,21 @@ class TicketAutomation:
         chrome_options.add_argument('--disable-ipc-flooding-protection')
         chrome_options.add_argument('--memory-pressure-off')
 
+        # Perfil persistente solo si se pide explícitamente: por defecto cada Chrome
+        # arranca limpio (un perfil compartido no admite dos Chrome a la vez)
+        if self.allow_persistent_profile and self.headless_mode and os.getenv('BL_PERSIST_PROFILE'):
+            try:
+                profile = _persistent_profile_dir()
+                chrome_options.add_argument(f'--user-data-dir={profile}')
+                chrome_options.add_argument(f'--disk-cache-dir={os.path.join(profile, "cache")}')
+                chrome_options.add_argument(f'--disk-cache-size={PERSISTENT_DISK_CACHE_BYTES}')
+            except OSError as e:
+                self.log(f"⚠ No se pudo crear el perfil persistente: {e}")
+
+        # driver.get() vuelve en DOMContentLoaded, sin esperar fuentes ni beacons de
+        # analytics; cada interacción ya está protegida por un WebDriverWait explícito
+        chrome_options.page_load_strategy = 'eager'
+
         # Configuraciones experimentales para estabilidad
         chrome_options.add_experimental_option('excludeSwitches', ['enable-logging', 'enable-automation'])
         chrome_options.add_experimental_option('useAutomationExtension', False)
@@ -164,14 +888,22 @@ class TicketAutomation:
 
             # Platform-specific ChromeDriver setup
             driver_path = None
-            import subprocess as sp
-            import shutil
+            downloaded = False
 
-            if sys.platform == 'darwin':
+            # Reusar el ChromeDriver ya resuelto si Chrome no cambió de versión mayor
+            # (evita la consulta de red de webdriver-manager en cada inicio)
+            chrome_major = _detect_chrome_major()
+            cached_driver = _load_cached_chromedriver(chrome_major)
+
+            if cached_driver:
+                self.log(f"✓ ChromeDriver en cache para Chrome {chrome_major}: {cached_driver}")
+                driver_path = cached_driver
+
+            elif sys.platform == 'darwin':
                 # Mac: Solución para el error de código -9 (macOS bloqueando ChromeDriver)
                 # SOLUCIÓN 1: Intentar usar ChromeDriver de Homebrew (recomendado)
                 try:
-                    result = sp.run(['which', 'chromedriver'], capture_output=True, text=True, check=False)
+                    result = subprocess.run(['which', 'chromedriver'], capture_output=True, text=True, check=False)
                     if result.returncode == 0 and result.stdout.strip():
                         homebrew_path = result.stdout.strip()
                         self.log(f"✓ ChromeDriver encontrado en Homebrew: {homebrew_path}")
@@ -206,8 +938,8 @@ class TicketAutomation:
                 # 2. Kill stale chromedriver processes before cache cleanup
                 if not driver_path:
                     try:
-                        sp.run(['taskkill', '/F', '/IM', 'chromedriver.exe'],
-                               capture_output=True, check=False)
+                        subprocess.run(['taskkill', '/F', '/IM', 'chromedriver.exe'],
+                                       capture_output=True, check=False)
                     except Exception:
                         pass
 
@@ -225,7 +957,8 @@ class TicketAutomation:
             if not driver_path:
                 self.log("Descargando ChromeDriver compatible con webdriver-manager...")
                 try:
-                    driver_path = ChromeDriverManager().install()
+                    driver_path = _install_chromedriver(chrome_major)
+                    downloaded = True
                     self.log(f"✓ ChromeDriver descargado: {driver_path}")
 
                     # Mac: Intentar remover cuarentena agresivamente
@@ -233,11 +966,11 @@ class TicketAutomation:
                         try:
                             wdm_root = os.path.expanduser("~/.wdm")
                             self.log("Removiendo atributos de seguridad de macOS...")
-                            sp.run(['xattr', '-r', '-d', 'com.apple.quarantine', wdm_root],
-                                   capture_output=True, check=False)
+                            subprocess.run(['xattr', '-r', '-d', 'com.apple.quarantine', wdm_root],
+                                           capture_output=True, check=False)
                             os.chmod(driver_path, 0o755)
-                            sp.run(['codesign', '--force', '--deep', '--sign', '-', driver_path],
-                                   capture_output=True, check=False)
+                            subprocess.run(['codesign', '--force', '--deep', '--sign', '-', driver_path],
+                                           capture_output=True, check=False)
                             self.log("✓ Permisos configurados")
                         except Exception as perm_error:
                             self.log(f"⚠ Error configurando permisos: {perm_error}")
@@ -279,9 +1012,26 @@ class TicketAutomation:
             self.driver = webdriver.Chrome(service=service, options=chrome_options)
             self.log("✓ ChromeDriver configurado correctamente")
 
-            # Configurar timeouts
+            # Bloquear analytics/tracking y fuentes vía CDP (opcional: si falla, seguir)
+            try:
+                self.driver.execute_cdp_cmd("Network.enable", {})
+                self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+            except Exception as cdp_error:
+                self.log(f"⚠ No se pudo configurar el bloqueo de URLs: {cdp_error}")
+
+            # Recién ahora (ya firmado en Mac y probado) se guarda para el próximo inicio
+            if downloaded:
+                _save_cached_chromedriver(chrome_major, driver_path)
+
+            # Configurar timeouts (page load queda como tope para el modo eager)
             self.driver.set_page_load_timeout(30)
-            self.driver.implicitly_wait(5)
+            # Sin implicit wait: cada espera es un WebDriverWait explícito, y los
+            # find_element de los fallbacks (tipo de documento, tarifa) fallan al
+            # instante en vez de bloquear 5s cada uno
+            self.driver.implicitly_wait(0)
+            # Tope de execute_async_script; _ensure_script_timeout solo lo sube
+            self.driver.set_script_timeout(30)
+            self._script_timeout = 30
 
             self.log("✓ Driver configurado correctamente")
             return True
@@ -291,21 +1041,103 @@ class TicketAutomation:
             self.log(f"Detalle: {traceback.format_exc()}")
             return False
 
-    def _navigate_to_sale_page(self):
+    def _driver_alive(self):
+        """True si hay un driver y su sesión de Chrome sigue respondiendo"""
+        if self.driver is None or not self.driver.session_id:
+            return False
+        try:
+            self.driver.current_url
+            return True
+        except (InvalidSessionIdException, WebDriverException):
+            return False
+
+    def ensure_driver(self):
+        """Reutiliza el Chrome abierto si sigue vivo; solo lanza uno nuevo si no.
+
+        Relanzar Chrome (proceso, perfil y handshake de DevTools) cuesta varios
+        segundos, así que un driver vivo solo se limpia con reset_session().
+        """
+        if self._driver_alive():
+            self.log("✓ Reutilizando Chrome ya abierto")
+            self.reset_session()
+            return True
+
+        if self.driver is not None:
+            # Solo Chrome: la instancia (y su worker del Sheet) sigue en uso
+            self._quit_driver()
+        return self.setup_driver()
+
+    def reset_session(self):
+        """Limpia cookies y storage sin relanzar Chrome.
+
+        delete_all_cookies() y localStorage.clear() solo alcanzan al origen de
+        la pestaña actual; por CDP se borran las cookies de todos los dominios
+        y el storage de cada origen de SESSION_ORIGINS (más el actual).
+        """
+        try:
+            origins = set(SESSION_ORIGINS)
+            current = self.driver.execute_script(
+                "window.sessionStorage.clear(); return window.location.origin;")
+            if current and current.startswith('http'):
+                origins.add(current)
+            self.driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+            for origin in origins:
+                self.driver.execute_cdp_cmd("Storage.clearDataForOrigin",
+                                            {"origin": origin, "storageTypes": "all"})
+        except WebDriverException as e:
+            self.log(f"⚠ No se pudo limpiar la sesión: {e}")
+
+    def close(self):
+        """Cierra Chrome; se llama una sola vez, al salir de la aplicación"""
+        self._closing.set()
+        with self._helpers_lock:
+            helpers, self._helpers = self._helpers, []
+        for helper in helpers:
+            helper.close()
+        self.flush_sheet_writes()
+        self._sheet_executor.shutdown(wait=True)
+        self._quit_driver()
+
+    def _quit_driver(self):
+        """Cierra solo el Chrome de esta instancia; se puede volver a lanzar otro"""
+        if self.driver is None:
+            return
+        try:
+            self.driver.quit()
+        except WebDriverException:
+            pass
+        self.driver = None
+
+    @property
+    def selected_event(self):
+        return self._selected_event
+
+    @selected_event.setter
+    def selected_event(self, event):
+        # La URL de venta se arma una vez por evento, no en cada navegación
+        self._selected_event = event
+        self.sale_url = f"https://pos.buenalive.com/events/{event['id']}/sale" if event else None
+
+    def _navigate_to_sale_page(self, reload=True):
         """Navigate back to the sale page for the current event.
 
+        With reload=False the page is only loaded when the browser is not
+        already on it; use it only when the form was left untouched, since
+        a reload is what clears a half-filled form.
+
         Returns True if navigation succeeded, False if no event is selected
         or navigation failed.
         """
         if not self.selected_event:
             self.log("⚠ No hay evento seleccionado para navegar")
             return False
+        sale_url = self.sale_url
         try:
-            self.driver.get(f"https://pos.buenalive.com/events/{self.selected_event['id']}/sale")
-            WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.XPATH,
-                    "//button[contains(@id, 'headlessui-listbox-button')] | //input | //form"))
-            )
+            if not reload and self.driver.current_url.rstrip('/') == sale_url:
+                return True
+            self.driver.get(sale_url)
+            if not self.wait_for_dom(SALE_PAGE_READY_CSS, timeout=10):
+                raise TimeoutException("la página no terminó de cargar")
             return True
         except Exception as e:
             self.log(f"⚠ Error navegando a página de emisión: {e}")
@@ -334,84 +1166,53 @@ class TicketAutomation:
             self.log("Extrayendo opciones del evento...")
 
             # Wait for the page to have at least one listbox button
-            WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "button[id*='headlessui-listbox-button']"))
+            WebDriverWait(self.driver, 10, poll_frequency=0.05).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, LISTBOX_BUTTONS_CSS))
             )
 
             # --- 1. Funciones: open dropdown, collect texts, select first to unlock Sector ---
-            funcion_buttons = self.driver.find_elements(By.CSS_SELECTOR,
-                "button[id*='headlessui-listbox-button']")
+            funcion_buttons = self.driver.find_elements(By.CSS_SELECTOR, LISTBOX_BUTTONS_CSS)
             if not funcion_buttons:
                 self.log("  ✗ No se encontraron dropdowns de función")
                 return options
 
-            self.driver.execute_script("arguments[0].click();", funcion_buttons[0])
-            time.sleep(0.8)
-
-            funcion_opts = self.driver.find_elements(By.CSS_SELECTOR,
-                "li[id*='headlessui-listbox-option']")
-            options['funciones'] = [opt.text.strip() for opt in funcion_opts if opt.text.strip()]
+            # Open + read every option text in one round trip (matching stays in Python)
+            funcion_labels = self.open_listbox(funcion_buttons[0])
+            options['funciones'] = [label for label in funcion_labels if label]
             self.log(f"  Funciones: {options['funciones']}")
 
-            if not funcion_opts:
+            if not funcion_labels:
                 self.driver.execute_script("document.body.click();")
-                time.sleep(0.3)
+                self.wait_for_dom(LISTBOX_OPTIONS_CSS, present=False)
                 return options
 
             # Select first función (this enables Sector)
-            self.driver.execute_script("arguments[0].click();", funcion_opts[0])
-            time.sleep(1)
+            self.click_listbox_option(funcion_labels[0])
+            self.wait_for_dom(LISTBOX_OPTIONS_CSS, present=False)
 
             # --- 2. Sectores: wait for enabled, open, collect, select first to unlock Tarifa ---
-            sector_buttons = self.driver.find_elements(By.CSS_SELECTOR,
-                "button[id*='headlessui-listbox-button']")
-            if len(sector_buttons) > 1:
-                sector_btn = sector_buttons[1]
-                # Wait up to 3s for sector to become enabled
-                for _ in range(10):
-                    if not sector_btn.get_attribute('disabled'):
-                        break
-                    time.sleep(0.3)
-                    sector_buttons = self.driver.find_elements(By.CSS_SELECTOR,
-                        "button[id*='headlessui-listbox-button']")
-                    if len(sector_buttons) > 1:
-                        sector_btn = sector_buttons[1]
-
-                self.driver.execute_script("arguments[0].click();", sector_btn)
-                time.sleep(0.8)
-
-                sector_opts = self.driver.find_elements(By.CSS_SELECTOR,
-                    "li[id*='headlessui-listbox-option']")
-                options['sectores'] = [opt.text.strip() for opt in sector_opts if opt.text.strip()]
+            sector_btn = self._wait_enabled(LISTBOX_BUTTONS_CSS, index=1)
+            if sector_btn is not None:
+                sector_labels = self.open_listbox(sector_btn)
+                options['sectores'] = [label for label in sector_labels if label]
                 self.log(f"  Sectores: {options['sectores']}")
 
-                if sector_opts:
+                if sector_labels:
                     # Select first sector (this enables Tarifa)
-                    self.driver.execute_script("arguments[0].click();", sector_opts[0])
-                    time.sleep(1)
+                    self.click_listbox_option(sector_labels[0])
+                    self.wait_for_dom(LISTBOX_OPTIONS_CSS, present=False)
 
             # --- 3. Tarifas: wait for enabled, open combobox button, collect ---
             try:
-                tarifa_btn = self.driver.find_element(By.CSS_SELECTOR,
-                    "button[id*='headlessui-combobox-button']")
-                # Wait up to 3s for tarifa to become enabled
-                for _ in range(10):
-                    if not tarifa_btn.get_attribute('disabled'):
-                        break
-                    time.sleep(0.3)
-                    tarifa_btn = self.driver.find_element(By.CSS_SELECTOR,
-                        "button[id*='headlessui-combobox-button']")
-
-                self.driver.execute_script("arguments[0].click();", tarifa_btn)
-                time.sleep(0.8)
+                tarifa_btn = self._wait_enabled(COMBOBOX_BUTTON_CSS)
+                if tarifa_btn is None:
+                    raise NoSuchElementException("No se encontró el combobox de tarifa")
 
-                tarifa_opts = self.driver.find_elements(By.CSS_SELECTOR,
-                    "li[id*='headlessui-combobox-option']")
-                options['valores'] = [opt.text.strip() for opt in tarifa_opts if opt.text.strip()]
+                options['valores'] = [label for label in self.open_combobox(tarifa_btn) if label]
 
                 # Close tarifa dropdown
                 self.driver.execute_script("document.activeElement.blur(); document.body.click();")
-                time.sleep(0.3)
+                self.wait_for_dom(COMBOBOX_OPTIONS_CSS, present=False)
             except Exception as e:
                 self.log(f"  Error extrayendo tarifas del primer sector: {e}")
 
@@ -420,49 +1221,31 @@ class TicketAutomation:
                 for sector_name in options['sectores'][1:]:
                     try:
                         # Re-open sector dropdown and select this sector
-                        sector_buttons = self.driver.find_elements(By.CSS_SELECTOR,
-                            "button[id*='headlessui-listbox-button']")
+                        sector_buttons = self.driver.find_elements(By.CSS_SELECTOR, LISTBOX_BUTTONS_CSS)
                         if len(sector_buttons) <= 1:
                             break
-                        self.driver.execute_script("arguments[0].click();", sector_buttons[1])
-                        time.sleep(0.8)
-
-                        sector_opts = self.driver.find_elements(By.CSS_SELECTOR,
-                            "li[id*='headlessui-listbox-option']")
-                        clicked = False
-                        for opt in sector_opts:
-                            if opt.text.strip() == sector_name:
-                                self.driver.execute_script("arguments[0].click();", opt)
-                                clicked = True
-                                time.sleep(1)
-                                break
-                        if not clicked:
+                        self.open_listbox(sector_buttons[1])
+                        clicked = self.click_listbox_option(sector_name)
+                        if clicked:
+                            # El combobox ya está habilitado por el sector anterior: no hay
+                            # una señal en el DOM de que sus tarifas se recargaron
+                            time.sleep(1)
+                        else:
                             self.driver.execute_script("document.body.click();")
-                            time.sleep(0.3)
+                            self.wait_for_dom(LISTBOX_OPTIONS_CSS, present=False)
                             continue
 
                         # Open tarifa and collect additional values
-                        tarifa_btn = self.driver.find_element(By.CSS_SELECTOR,
-                            "button[id*='headlessui-combobox-button']")
-                        for _ in range(10):
-                            if not tarifa_btn.get_attribute('disabled'):
-                                break
-                            time.sleep(0.3)
-                            tarifa_btn = self.driver.find_element(By.CSS_SELECTOR,
-                                "button[id*='headlessui-combobox-button']")
-
-                        self.driver.execute_script("arguments[0].click();", tarifa_btn)
-                        time.sleep(0.8)
+                        tarifa_btn = self._wait_enabled(COMBOBOX_BUTTON_CSS)
+                        if tarifa_btn is None:
+                            raise NoSuchElementException("No se encontró el combobox de tarifa")
 
-                        tarifa_opts = self.driver.find_elements(By.CSS_SELECTOR,
-                            "li[id*='headlessui-combobox-option']")
-                        for opt in tarifa_opts:
-                            valor = opt.text.strip()
+                        for valor in self.open_combobox(tarifa_btn):
                             if valor and valor not in options['valores']:
                                 options['valores'].append(valor)
 
                         self.driver.execute_script("document.activeElement.blur(); document.body.click();")
-                        time.sleep(0.3)
+                        self.wait_for_dom(COMBOBOX_OPTIONS_CSS, present=False)
                     except Exception as e:
                         self.log(f"  Error extrayendo tarifas para sector '{sector_name}': {e}")
 
@@ -497,10 +1280,7 @@ class TicketAutomation:
 
         # Normalize all whitespace variants FIRST (non-breaking spaces, double spaces, etc.)
         # This is critical for cross-platform matching (website vs Sheets vs user input)
-        normalized = datetime_str
-        normalized = normalized.replace('\u00a0', ' ')  # Non-breaking space
-        normalized = normalized.replace('\u2009', ' ')  # Thin space
-        normalized = normalized.replace('\u202f', ' ')  # Narrow no-break space
+        normalized = datetime_str.translate(_SPACES_TABLE)  # NBSP, thin, narrow NBSP
         normalized = re.sub(r'\s+', ' ', normalized)    # Collapse multiple spaces
         normalized = normalized.strip()
 
@@ -613,7 +1393,7 @@ class TicketAutomation:
         normalized = re.sub(r'\s+', ' ', normalized)
 
         # Remove non-breaking spaces and other Unicode whitespace
-        normalized = normalized.replace('\u00a0', ' ').replace('\u2009', ' ')
+        normalized = normalized.translate(_SPACES_TABLE)
 
         return normalized
 
@@ -660,14 +1440,114 @@ class TicketAutomation:
             if not worksheet:
                 return None
 
-            headers = worksheet.row_values(1)
-            if column_name in headers:
-                return headers.index(column_name) + 1
-            return None
+            # Headers already read by read_worksheet_rows: no API call per lookup
+            col_idx = self._header_index.get(worksheet.id)
+            if col_idx is None:
+                col_idx = self._index_headers(worksheet, worksheet.row_values(1))
+            return col_idx.get(column_name)
         except Exception as e:
             self.log(f"Error getting column index for '{column_name}': {e}")
             return None
 
+    def _index_headers(self, worksheet, headers):
+        """Cachea {encabezado: columna 1-based} de la hoja (gana la primera aparición)"""
+        col_idx = {}
+        for col, header in enumerate(headers, start=1):
+            col_idx.setdefault(header, col)
+        self._header_index[worksheet.id] = col_idx
+        return col_idx
+
+    def get_worksheet(self, *titles):
+        """Primera hoja del Sheet conectado cuyo título está en titles.
+
+        Lista las hojas con un solo fetch de metadatos y lo cachea, así cada
+        corrida solo gasta la lectura de valores; se vuelve a listar si la
+        hoja no aparece (p. ej. se creó después).
+        """
+        for refresh in (False, True):
+            if refresh or self.sheet.id not in self._worksheets:
+                self._worksheets[self.sheet.id] = {ws.title: ws for ws in self.sheet.worksheets()}
+            by_title = self._worksheets[self.sheet.id]
+            for title in titles:
+                if title in by_title:
+                    return by_title[title]
+        raise gspread.WorksheetNotFound(titles[0])
+
+    def read_worksheet_rows(self, worksheet):
+        """Lee toda la hoja con un único get_all_values().
+
+        Returns:
+            (headers, records): la fila 1 y un dict por fila de datos, en el
+            orden del Sheet (records[0] es la fila 2). Los valores quedan como
+            strings (sin convertir a número, así un DNI conserva sus ceros).
+        """
+        values = worksheet.get_all_values()
+        headers = values[0] if values else []
+        self._index_headers(worksheet, headers)
+        if not values:
+            return [], []
+        return headers, [dict(zip(headers, row)) for row in values[1:]]
+
+    def queue_cell_write(self, row, col, value, worksheet=None):
+        """Encola la escritura de una celda; se envía en lote, sin bloquear la emisión"""
+        if not worksheet:
+            worksheet = getattr(self, 'current_worksheet', None)
+        if not worksheet or not col:
+            return
+
+        with self._writes_lock:
+            self._pending_writes.append((worksheet.title, row, col, value))
+            full = len(self._pending_writes) >= self.SHEET_FLUSH_EVERY
+        if full and self.sheet:
+            # Lote intermedio en segundo plano: la fila siguiente no espera a la API
+            self._submit_writes()
+
+    def flush_sheet_writes(self):
+        """Envía todas las escrituras pendientes y espera a que terminen.
+
+        Como usa el mismo worker que los lotes en segundo plano, al volver
+        también terminaron los que estaban en vuelo.
+        """
+        if not self.sheet:
+            return
+        future = self._submit_writes()
+        if future is not None:
+            future.result()
+
+    def _submit_writes(self):
+        """Pasa las escrituras pendientes al worker del Sheet; None si ya se cerró.
+
+        Una corrida interrumpida al salir puede llegar acá después de close(),
+        que ya envió todo lo encolado hasta ese momento.
+        """
+        try:
+            return self._sheet_executor.submit(self._send_writes, self._take_pending_writes())
+        except RuntimeError:
+            return None
+
+    def _take_pending_writes(self):
+        with self._writes_lock:
+            pending, self._pending_writes = self._pending_writes, []
+        return pending
+
+    def _send_writes(self, pending):
+        """Envía un lote en un único values_batch_update"""
+        if not pending:
+            return
+        try:
+            self.sheet.values_batch_update(body={
+                'valueInputOption': 'USER_ENTERED',
+                'data': _sheet_write_ranges(pending),
+            })
+        except Exception as e:
+            # Se reintentan en el próximo flush
+            with self._writes_lock:
+                self._pending_writes[:0] = pending
+            self.log(f"⚠ Error escribiendo {len(pending)} celdas en Sheet: {e}")
+            return
+        # Ya están en el Sheet: no hace falta recordarlas localmente
+        _forget_processed_rows({(self._sheet_key(title), row) for title, row, _, _ in pending})
+
     def login(self, email, password):
         """Realiza el login en el sistema"""
         try:
@@ -676,41 +1556,49 @@ class TicketAutomation:
             self.driver.get("https://pos.buenalive.com/")
             self.log("✓ Página cargada correctamente")
 
-            # Esperar y completar email
+            # Esperar el formulario, o la sesión que quedó abierta en el perfil
             self.log("Esperando campo de email...")
-            email_input = WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.ID, "username"))
-            )
-            self.log("✓ Campo de email encontrado")
-            email_input.clear()
-            email_input.send_keys(email)
-
-            # Completar password
-            self.log("Completando password...")
-            password_input = self.driver.find_element(By.ID, "password")
-            password_input.clear()
-            password_input.send_keys(password)
-
-            # Click en submit
-            self.log("Haciendo click en 'Ingresar'...")
-            submit_button = self.driver.find_element(By.XPATH, "//button[@type='submit' and contains(., 'Ingresar')]")
-            submit_button.click()
-
-            # Seleccionar Backoffice
-            self.log("Esperando opción Backoffice...")
-            backoffice_button = WebDriverWait(self.driver, 10).until(
-                EC.element_to_be_clickable((By.XPATH, "//h2[contains(text(),'Backoffice')]"))
-            )
-            self.log("✓ Backoffice encontrado, haciendo click...")
-            backoffice_button.click()
+            state = WebDriverWait(self.driver, 10, poll_frequency=0.05).until(_login_page_state)
+            if state == 'form':
+                self.log("✓ Campo de email encontrado")
+                email_input = self.driver.find_element(By.ID, "username")
+                password_input = self.driver.find_element(By.ID, "password")
+                self.log("Completando password...")
+                if self.TYPE_WITH_SEND_KEYS:
+                    email_input.clear()
+                    email_input.send_keys(email)
+                    password_input.clear()
+                    password_input.send_keys(password)
+                else:
+                    # Un execute_script por campo en vez de un evento por carácter
+                    self._fast_set_value(email_input, email)
+                    self._fast_set_value(password_input, password)
+
+                # Click en submit
+                self.log("Haciendo click en 'Ingresar'...")
+                submit_button = self.driver.find_element(By.XPATH, "//button[@type='submit' and contains(., 'Ingresar')]")
+                submit_button.click()
+            else:
+                self.log("✓ Sesión ya iniciada, se omite el formulario")
+
+            if state != 'dashboard':
+                # Seleccionar Backoffice
+                self.log("Esperando opción Backoffice...")
+                backoffice_button = WebDriverWait(self.driver, 10, poll_frequency=0.05).until(
+                    EC.element_to_be_clickable((By.XPATH, BACKOFFICE_XPATH))
+                )
+                self.log("✓ Backoffice encontrado, haciendo click...")
+                backoffice_button.click()
 
             # Verificar que el login fue exitoso esperando elemento del dashboard
             self.log("Esperando dashboard...")
-            WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.XPATH, "//li[contains(@class, 'block overflow-hidden rounded bg-white')] | //div[contains(@class, 'grid')] | //main"))
+            WebDriverWait(self.driver, 10, poll_frequency=0.05).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, DASHBOARD_CARD_CSS + ", div[class*='grid'], main"))
             )
 
             self.log("✓ Login exitoso")
+            # Las sesiones paralelas (BL_SESSIONS) se loguean con la misma cuenta
+            self._login_credentials = (email, password)
             return True
 
         except Exception as e:
@@ -733,51 +1621,42 @@ class TicketAutomation:
         """Obtiene la lista de eventos disponibles"""
         try:
             self.log("Obteniendo eventos disponibles...")
-            
+
+            # Un solo execute_script recorre las tarjetas en el navegador, en vez de
+            # tres round trips a ChromeDriver (find_element/get_attribute) por tarjeta
+            cards = self.driver.execute_script(JS_SCRAPE_EVENTS) or []
+
             events = []
-            event_cards = self.driver.find_elements(By.XPATH, "//li[contains(@class, 'block overflow-hidden rounded bg-white')]")
-            
-            for card in event_cards:
+            for card in cards:
                 try:
-                    event_name = card.find_element(By.XPATH, ".//a[contains(@class, 'font-semibold')]").text
-                    emitir_button = card.find_element(By.XPATH, ".//a[contains(., 'Emitir stock')]")
-                    event_href = emitir_button.get_attribute('href')
+                    event_href = card['href']
                     event_id = event_href.split('/events/')[1].split('/')[0]
-                    
+
                     events.append({
-                        'name': event_name,
+                        'name': card['name'],
                         'id': event_id,
                         'href': event_href,
-                        'element': emitir_button
                     })
-                    
-                    self.log(f"  • {event_name} (ID: {event_id})")
-                    
+
+                    self.log(f"  • {card['name']} (ID: {event_id})")
+
                 except Exception as e:
                     continue
-                    
+
             return events
-            
+
         except Exception as e:
             self.log(f"✗ Error obteniendo eventos: {str(e)}")
             return []
-            
+
     def connect_google_sheets(self, sheet_url):
         """Conecta con Google Sheets"""
         try:
-            scope = ['https://spreadsheets.google.com/feeds',
-                    'https://www.googleapis.com/auth/drive']
-            
             if not os.path.exists(self.credentials_file):
                 self.log("✗ No se encuentra el archivo credentials.json de Google")
                 return None
 
-            # Leer credentials.json con utf-8-sig para manejar BOM en Windows
-            with open(self.credentials_file, 'r', encoding='utf-8-sig') as f:
-                creds_data = json.load(f)
-
-            creds = Credentials.from_service_account_info(creds_data, scopes=scope)
-            client = gspread.authorize(creds)
+            client = _get_gspread_client(self.credentials_file)
             
             if '/d/' in sheet_url:
                 sheet_id = sheet_url.split('/d/')[1].split('/')[0]
@@ -785,7 +1664,9 @@ class TicketAutomation:
                 sheet_id = sheet_url
                 
             self.gspread_client = client
-            self.sheet = client.open_by_key(sheet_id)
+            if sheet_id not in _opened_spreadsheets:
+                _opened_spreadsheets[sheet_id] = client.open_by_key(sheet_id)
+            self.sheet = _opened_spreadsheets[sheet_id]
             self.log(f"✓ Conectado a Google Sheets")
             return self.sheet
             
@@ -793,6 +1674,16 @@ class TicketAutomation:
             self.log(f"✗ Error conectando Google Sheets: {str(e)}")
             return None
     
+    # True para tipear carácter por carácter con send_keys (más lento, pero se ve
+    # escribir en modo visible; útil para depurar el formulario)
+    TYPE_WITH_SEND_KEYS = False
+
+    # Cantidad de Chrome logueados emitiendo en paralelo (BL_SESSIONS; 1 = secuencial)
+    PARALLEL_SESSIONS = _env_int('BL_SESSIONS', 1)
+
+    # Cada cuántas celdas encoladas se escribe el lote al Sheet (cuota: 60 escrituras/min)
+    SHEET_FLUSH_EVERY = 20
+
     # Spreadsheet ID used as reusable staging template (overwritten each time)
     STAGING_TEMPLATE_ID = "15R_wnhpmjmsOj5ZuG4M--wuE33sc5Y32d7cqj5if5wo"
 
@@ -815,15 +1706,10 @@ class TicketAutomation:
         # Initialize gspread client if needed (doesn't require a sheet URL)
         if not self.gspread_client:
             try:
-                scope = ['https://spreadsheets.google.com/feeds',
-                        'https://www.googleapis.com/auth/drive']
                 if not os.path.exists(self.credentials_file):
                     self.log("✗ No se encuentra credentials.json de Google")
                     return None
-                with open(self.credentials_file, 'r', encoding='utf-8-sig') as f:
-                    creds_data = json.load(f)
-                creds = Credentials.from_service_account_info(creds_data, scopes=scope)
-                self.gspread_client = gspread.authorize(creds)
+                self.gspread_client = _get_gspread_client(self.credentials_file)
             except Exception as e:
                 self.log(f"✗ Error conectando a Google: {e}")
                 return None
@@ -986,15 +1872,19 @@ class TicketAutomation:
             self.log(f"  Detalle: {traceback.format_exc()}")
             return None
 
-    def wait_and_click(self, xpath, timeout=None, description="elemento"):
-        """Helper para esperar y clickear un elemento con timeout optimizado"""
+    def wait_and_click(self, locator, timeout=None, description="elemento", by=By.XPATH):
+        """Helper para esperar y clickear un elemento con timeout optimizado.
+
+        XPath por defecto (los botones se buscan por texto); pasar
+        by=By.CSS_SELECTOR cuando alcanza con id/clase, que resuelve más rápido.
+        """
         # Timeout dinámico basado en modo headless (más rápido en headless)
         if timeout is None:
             timeout = 3 if self.headless_mode else 5
 
         try:
-            element = WebDriverWait(self.driver, timeout).until(
-                EC.element_to_be_clickable((By.XPATH, xpath))
+            element = WebDriverWait(self.driver, timeout, poll_frequency=0.05).until(
+                EC.element_to_be_clickable((by, locator))
             )
             # En modo headless, usar JavaScript para clickear
             if self.headless_mode:
@@ -1017,11 +1907,14 @@ class TicketAutomation:
             timeout = 3 if self.headless_mode else 5
 
         try:
-            element = WebDriverWait(self.driver, timeout).until(
+            element = WebDriverWait(self.driver, timeout, poll_frequency=0.05).until(
                 EC.presence_of_element_located((by, identifier))
             )
-            element.clear()
-            element.send_keys(value)
+            if self.TYPE_WITH_SEND_KEYS:
+                element.clear()
+                element.send_keys(value)
+            else:
+                self._fast_set_value(element, value)
             return True
         except TimeoutException:
             self.log(f"  ⚠ No se encontró {description}")
@@ -1030,31 +1923,159 @@ class TicketAutomation:
             self.log(f"  ⚠ Error en {description}: {str(e)}")
             return False
 
-    def check_duplicate_dni_error_fast(self):
-        """Detecta error DNI duplicado con JavaScript rápido y recupera automáticamente"""
+    def _fast_set_value(self, element, value):
+        """Setea el valor de un input en un solo round trip.
+
+        send_keys manda un evento de teclado por carácter; esto escribe el
+        valor completo con JS_SET_INPUT_VALUE.
+        """
+        self.driver.execute_script(JS_SET_INPUT_VALUE, element, value)
+
+    def wait_for_dom(self, selector, present=True, timeout=2):
+        """Espera a que un selector CSS aparezca (o desaparezca) del DOM.
+
+        Reemplaza los sleeps fijos: vuelve apenas se cumple la condición.
+        Devuelve False si se agotó el timeout, sin lanzar excepción.
+        """
+        try:
+            # Un solo round trip: un MutationObserver en la página en vez de
+            # consultar por WebDriver cada 50 ms
+            self._ensure_script_timeout(timeout + 5)
+            return self.driver.execute_async_script(
+                JS_WAIT_FOR_SELECTOR, selector, present, int(timeout * 1000))
+        except TimeoutException:
+            return False
+        except WebDriverException:
+            # P. ej. la página navegó durante la espera: seguir consultando
+            pass
+
+        js = "return document.querySelector(arguments[0]) !== null;"
         try:
-            # JavaScript más rápido que XPath para detectar el error
-            js_check = """
-            var alerts = document.querySelectorAll('div[role="alert"]');
-            for (var i = 0; i < alerts.length; i++) {
-                if (alerts[i].textContent.includes('duplicatedDocuments')) {
-                    return true;
-                }
+            WebDriverWait(self.driver, timeout, poll_frequency=0.05).until(
+                lambda d: d.execute_script(js, selector) == present
+            )
+            return True
+        except TimeoutException:
+            return False
+
+    def _ensure_script_timeout(self, seconds):
+        """Sube el tope de execute_async_script si hace falta (nunca lo baja)"""
+        if seconds > self._script_timeout:
+            self.driver.set_script_timeout(seconds)
+            self._script_timeout = seconds
+
+    def _wait_for(self, selector, count=1, timeout=5):
+        """Espera a que haya al menos count elementos para el selector CSS y los devuelve.
+
+        Una sola espera explícita que ya trae los elementos, en vez de
+        wait_for_dom seguido de otro find_elements. [] si se agotó el timeout.
+        """
+        def enough(driver):
+            elements = driver.find_elements(By.CSS_SELECTOR, selector)
+            return elements if len(elements) >= count else False
+
+        try:
+            return WebDriverWait(self.driver, timeout, poll_frequency=0.05).until(enough)
+        except TimeoutException:
+            return []
+
+    def _wait_enabled(self, selector, index=0, timeout=3):
+        """Espera a que el elemento número index del selector CSS esté habilitado.
+
+        Si el timeout vence devuelve igual el elemento (aunque siga deshabilitado),
+        o None si no existe.
+        """
+        def enabled(driver):
+            elements = driver.find_elements(By.CSS_SELECTOR, selector)
+            return elements[index] if len(elements) > index and elements[index].is_enabled() else False
+
+        try:
+            return WebDriverWait(self.driver, timeout, poll_frequency=0.05,
+                                 ignored_exceptions=(StaleElementReferenceException,)).until(enabled)
+        except TimeoutException:
+            elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
+            return elements[index] if len(elements) > index else None
+
+    def open_listbox(self, button, timeout_ms=2000):
+        """Abre un listbox y devuelve los textos de sus opciones en un solo round trip"""
+        return self.driver.execute_async_script(JS_OPEN_LISTBOX, button, timeout_ms) or []
+
+    def click_listbox_option(self, label):
+        """Clickea la opción del listbox abierto con ese texto exacto; False si no está"""
+        return bool(self.driver.execute_script(JS_CLICK_LISTBOX_OPTION, label))
+
+    def open_combobox(self, button, timeout_ms=3000):
+        """Abre un combobox y devuelve los textos de sus opciones en un solo round trip.
+
+        El índice de cada texto sirve para click_combobox_option; así el match
+        (_find_tarifa) sigue en Python sin leer .text opción por opción.
+        """
+        return self.driver.execute_async_script(JS_OPEN_COMBOBOX, button, timeout_ms) or []
+
+    def click_combobox_option(self, index):
+        """Clickea la opción número index del combobox abierto; False si no está"""
+        return bool(self.driver.execute_script(JS_CLICK_COMBOBOX_OPTION, index))
+
+    def select_listbox_option(self, button, text, fallback_first=True, timeout_ms=2000):
+        """Abre un listbox y clickea la opción que contiene text, todo dentro del navegador.
+
+        Reemplaza click → sleep → find_element → click por un único
+        execute_async_script. Con fallback_first elige la primera opción si
+        ninguna coincide. Devuelve el texto de la opción clickeada o None.
+        """
+        return self.driver.execute_async_script(
+            JS_SELECT_LISTBOX_OPTION, button, timeout_ms, text, fallback_first)
+
+    def run_click_steps(self, steps):
+        """Ejecuta una secuencia fija de clicks dentro del navegador, en un solo round trip.
+
+        Reemplaza una cadena de wait_and_click (cada uno con su WebDriverWait y
+        sus viajes al driver) por un único execute_async_script. steps es una
+        lista como CLICK_STEPS_METODO_ENVIO. Devuelve un bool por paso.
+        """
+        default_timeout = 3 if self.headless_mode else 5
+
+        def to_js(step):
+            js_step = {
+                'alternatives': [list(alt) for alt in step['alternatives']],
+                'timeout_ms': int(step.get('timeout', default_timeout) * 1000),
+                'wait_gone': step.get('wait_gone'),
+                'skip_if': [list(alt) for alt in step['skip_if']] if step.get('skip_if') else None,
+                'wait_gone_ms': int(step.get('wait_gone_timeout', 0) * 1000),
+                'fallback': to_js(step['fallback']) if step.get('fallback') else None,
             }
-            return false;
-            """
+            # Peor caso del paso: su espera más la del fallback
+            js_step['budget_ms'] = (js_step['timeout_ms'] + js_step['wait_gone_ms']
+                                    + (js_step['fallback']['budget_ms'] if js_step['fallback'] else 0))
+            return js_step
 
-            # Verificar inmediatamente después de click
-            for attempt in range(4):  # 4 intentos de 0.5s = 2 segundos total
-                if self.driver.execute_script(js_check):
-                    self.log(f"⚠️ DNI duplicado detectado (intento {attempt + 1}) - regresando a página de emisión")
+        js_steps = [to_js(step) for step in steps]
+        budget = sum(step['budget_ms'] for step in js_steps) / 1000
+        try:
+            self._ensure_script_timeout(budget + 5)
+            results = self.driver.execute_async_script(JS_RUN_CLICK_STEPS, js_steps)
+        except Exception as e:
+            self.log(f"  ⚠ Error ejecutando pasos del formulario: {str(e)}")
+            return [False] * len(steps)
 
-                    # RECUPERACIÓN: Navegar directamente a página de emisión
-                    if self._navigate_to_sale_page():
-                        self.log("  ✓ Página de emisión lista para siguiente ticket")
+        for step, clicked in zip(steps, results):
+            if not clicked:
+                self.log(f"  ⚠ No se encontró {step['description']}, intentando continuar...")
+        return results
 
-                    return True
-                time.sleep(0.5)
+    def check_duplicate_dni_error_fast(self, timeout_ms=2000):
+        """Detecta error DNI duplicado con JavaScript rápido y recupera automáticamente"""
+        try:
+            # Un solo round trip: el observer resuelve apenas aparece el alert,
+            # en vez de consultar 4 veces con pausas de 0.5s
+            if self.driver.execute_async_script(JS_WAIT_DUPLICATE_DNI, timeout_ms):
+                self.log("⚠️ DNI duplicado detectado - regresando a página de emisión")
+
+                # RECUPERACIÓN: Navegar directamente a página de emisión
+                if self._navigate_to_sale_page():
+                    self.log("  ✓ Página de emisión lista para siguiente ticket")
+
+                return True
 
             return False
         except Exception as e:
@@ -1062,45 +2083,57 @@ class TicketAutomation:
             return False
 
 
+    def _prepare_row_payload(self, row_data):
+        """Campos de una fila ya limpios y normalizados (solo Python, sin Selenium)"""
+        funcion = str(row_data.get('Función', '')).strip()
+        dni_raw = str(row_data.get('DNI', ''))
+        valor_sheet, nombre_tarifa = _parse_valor(row_data.get('Valor', ''))
+        return {
+            'nombre': str(row_data.get('Nombre', '')),
+            'apellido': str(row_data.get('Apellido', '')),
+            'funcion': funcion,
+            'funcion_normalizada': self.normalize_datetime_string(funcion) if funcion else funcion,
+            'sector': str(row_data.get('Sector', '')).strip(),
+            'valor_sheet': valor_sheet,
+            'nombre_tarifa': nombre_tarifa,
+            # Limpiar DNI: solo letras y números (soporta pasaportes alfanuméricos)
+            # Convertir a string primero (Google Sheets puede devolver números como int)
+            'dni_raw': dni_raw,
+            'dni': dni_raw.translate(_DNI_TABLE),
+            'tipo_documento': str(row_data.get('Tipo', 'DNI')).strip(),
+            # Una celda con solo espacios cuenta como sin email (salta PASOS 11b-12)
+            'email': str(row_data.get('Mail', '')).strip(),
+            'cantidad': str(row_data.get('Cantidad', '1')),
+        }
+
     def emitir_ticket_completo(self, row_data, row_number):
         """Proceso completo de emisión de ticket siguiendo el flujo exacto"""
-        start_time = time.time()  # Inicio del timer de performance
+        start_ns = time.perf_counter_ns()  # Inicio del timer de performance (monotónico)
         try:
+            payload = self._prepare_row_payload(row_data)
             self.log(f"\n=== Procesando fila {row_number}: {row_data.get('Nombre')} {row_data.get('Apellido')} ===")
 
             # Set current row for error handling
             self.current_row = row_number
 
             # PASO 1: Seleccionar función
-            funcion = str(row_data.get('Función', '')).strip()
+            funcion = payload['funcion']
             if funcion:
                 self.log(f"1. Seleccionando función: {funcion}")
             else:
                 self.log("1. Seleccionando función (primera disponible)...")
 
-            # Click en el primer listbox button (selector de función)
-            funcion_buttons = self.driver.find_elements(By.XPATH,
-                "//button[contains(@id, 'headlessui-listbox-button') and contains(@class, 'cursor-default')]")
+            # Click en el primer listbox button (selector de función), apenas se monta
+            funcion_buttons = self._wait_for(FUNCION_BUTTONS_CSS, timeout=5)
 
             if len(funcion_buttons) > 0:
-                # Click en el primer button (función)
-                if self.headless_mode:
-                    self.driver.execute_script("arguments[0].click();", funcion_buttons[0])
-                else:
-                    funcion_buttons[0].click()
-
-                # Esperar que se desplieguen las opciones
-                time.sleep(0.5)
-
-                # Listar TODAS las opciones disponibles
-                opciones_elements = self.driver.find_elements(By.XPATH,
-                    "//li[contains(@id, 'headlessui-listbox-option')]//span[contains(@class, 'block truncate')]")
-                opciones_disponibles = [opt.text.strip() for opt in opciones_elements]
+                # Abrir el primer button (función) y listar TODAS las opciones disponibles
+                opciones_disponibles = self.open_listbox(funcion_buttons[0])
                 self.log(f"  Opciones de función disponibles: {opciones_disponibles}")
 
                 if funcion:
                     # Normalize the function from Google Sheets for locale-independent comparison
-                    funcion_normalizada = self.normalize_datetime_string(funcion)
+                    funcion_normalizada = payload['funcion_normalizada']
                     self.log(f"  Función del Sheet: '{funcion}' (normalizada: '{funcion_normalizada}')")
 
                     # Find matching option using flexible date matching
@@ -1116,36 +2149,12 @@ class TicketAutomation:
                         self.log(f"  ✓ Función '{funcion}' coincide con '{matching_option}' en el dropdown")
 
                         try:
-                            # Find and click the matching option
-                            # Re-fetch elements to avoid stale element issues
-                            opciones_li = self.driver.find_elements(By.XPATH,
-                                "//li[contains(@id, 'headlessui-listbox-option')]")
-
-                            funcion_option = None
-                            for li_elem in opciones_li:
-                                try:
-                                    span_elem = li_elem.find_element(By.XPATH, ".//span[contains(@class, 'block truncate')]")
-                                    # Use dates_match for consistency (handles whitespace/encoding diffs after re-fetch)
-                                    if self.dates_match(span_elem.text.strip(), matching_option):
-                                        funcion_option = li_elem
-                                        break
-                                except:
-                                    continue
-
-                            if funcion_option:
-                                # Click en la opción
-                                if self.headless_mode:
-                                    self.driver.execute_script("arguments[0].click();", funcion_option)
-                                else:
-                                    funcion_option.click()
-
+                            # Click en la opción (mismo texto que devolvió el listbox abierto)
+                            if self.click_listbox_option(matching_option):
                                 self.log(f"  ✓ Función seleccionada: {funcion}")
-                                time.sleep(0.3)
+                                self.wait_for_dom(LISTBOX_OPTIONS_CSS, present=False)
                             else:
                                 # Debug: show exact bytes to diagnose encoding issues
-                                refetched = [li.find_element(By.XPATH, ".//span[contains(@class, 'block truncate')]").text
-                                             for li in opciones_li if li.find_elements(By.XPATH, ".//span[contains(@class, 'block truncate')]")]
-                                self.log(f"  DEBUG refetched options: {refetched}")
                                 self.log(f"  DEBUG matching_option repr: {repr(matching_option)}")
                                 raise Exception(f"No se encontró el elemento para '{matching_option}'")
 
@@ -1161,7 +2170,7 @@ class TicketAutomation:
                             if self.sheet:
                                 try:
                                     error_msg = f"ERROR: No se pudo seleccionar función '{funcion}'"
-                                    self.sheet.update_cell(self.current_row, self.get_column_index('Estado'), error_msg)
+                                    self.queue_cell_write(self.current_row, self.get_column_index('Estado'), error_msg)
                                 except:
                                     pass
 
@@ -1178,7 +2187,7 @@ class TicketAutomation:
                         # Cerrar el dropdown
                         try:
                             self.driver.execute_script("document.body.click();")
-                            time.sleep(0.3)
+                            self.wait_for_dom(LISTBOX_OPTIONS_CSS, present=False)
                         except:
                             pass
 
@@ -1186,109 +2195,72 @@ class TicketAutomation:
                         if self.sheet:
                             try:
                                 error_msg = f"ERROR: Función '{funcion}' no válida. Opciones: {', '.join(opciones_disponibles)}"
-                                self.sheet.update_cell(self.current_row, self.get_column_index('Estado'), error_msg)
+                                self.queue_cell_write(self.current_row, self.get_column_index('Estado'), error_msg)
                             except:
                                 pass
 
                         # SKIP esta entrada
                         self.log(f"  ⏭️  Saltando esta entrada y continuando con la siguiente...")
-                        self._navigate_to_sale_page()
+                        # No se seleccionó nada todavía: si ya está en la página, no recargar
+                        self._navigate_to_sale_page(reload=False)
                         return
 
                 else:
                     # Si no hay función especificada, usar la primera
                     self.log("  Sin función especificada, usando primera disponible")
                     self.wait_and_click(
-                        "//li[contains(@id, 'headlessui-listbox-option')][1]",
+                        LISTBOX_OPTIONS_CSS,
+                        by=By.CSS_SELECTOR,
                         timeout=5,
                         description="primera función"
                     )
             
             # PASO 2: Seleccionar sector
-            sector = str(row_data.get('Sector', '')).strip()
+            sector = payload['sector']
             if sector:
                 self.log(f"2. Seleccionando sector: {sector}")
                 # Click en el segundo listbox (sector)
-                sector_buttons = self.driver.find_elements(By.XPATH, 
-                    "//button[contains(@id, 'headlessui-listbox-button')]")
+                sector_buttons = self._wait_for(LISTBOX_BUTTONS_CSS, count=2, timeout=2)
                 
                 if len(sector_buttons) > 1:
-                    if self.headless_mode:
-                        self.driver.execute_script("arguments[0].click();", sector_buttons[1])
-                    else:
-                        sector_buttons[1].click()
-                    
-                    # Buscar y clickear el sector correcto
-                    try:
-                        # Buscar match parcial del sector
-                        sector_option = self.driver.find_element(By.XPATH, 
-                            f"//li[contains(@id, 'headlessui-listbox-option')][contains(translate(., 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), '{sector.lower()}')]")
-                        if self.headless_mode:
-                            self.driver.execute_script("arguments[0].click();", sector_option)
-                        else:
-                            sector_option.click()
-                    except:
-                        # Si no encuentra, seleccionar el primero
-                        self.wait_and_click(
-                            "//li[contains(@id, 'headlessui-listbox-option')][1]",
-                            timeout=3,
-                            description="primer sector disponible"
-                        )
+                    # Abrir, buscar match parcial del sector y clickearlo (si no, el primero)
+                    sector_elegido = self.select_listbox_option(sector_buttons[1], sector)
+                    if sector_elegido is None:
+                        self.log("  ⚠ No se encontró ningún sector disponible")
+                    elif sector.lower() not in sector_elegido.lower():
+                        self.log(f"  ⚠ Sector '{sector}' no encontrado, usando '{sector_elegido}'")
             
             # PASO 3: Seleccionar tarifa - usar valor del Sheet
-            valor_sheet = str(row_data.get('Valor', '')).strip()
+            valor_sheet, nombre_tarifa = payload['valor_sheet'], payload['nombre_tarifa']
             self.log(f"3. Seleccionando tarifa: {valor_sheet}")
 
             try:
                 # Click en el botón del combobox para abrir dropdown (NO escribir en el input)
-                tarifa_button = WebDriverWait(self.driver, 5).until(
-                    EC.element_to_be_clickable((By.XPATH, "//button[contains(@id, 'headlessui-combobox-button')]"))
+                tarifa_button = WebDriverWait(self.driver, 5, poll_frequency=0.05).until(
+                    EC.element_to_be_clickable((By.CSS_SELECTOR, COMBOBOX_BUTTON_CSS))
                 )
-                tarifa_button.click()
-                time.sleep(0.5)
 
-                # Obtener TODAS las opciones visibles del dropdown
-                opciones = WebDriverWait(self.driver, 3).until(
-                    EC.presence_of_all_elements_located((By.XPATH, "//li[contains(@id, 'headlessui-combobox-option')]"))
-                )
+                # Abrir y leer TODAS las opciones del dropdown en un solo round trip
+                nombres_opciones = self.open_combobox(tarifa_button)
+                if not nombres_opciones:
+                    raise TimeoutException("No aparecieron opciones de tarifa")
 
-                # Buscar la opción que matchee exactamente el valor del sheet
-                opcion_encontrada = None
-                for opcion in opciones:
-                    texto_opcion = opcion.text.strip()
-                    if texto_opcion == valor_sheet:
-                        opcion_encontrada = opcion
-                        break
+                # Match exacto con el valor del sheet, o parcial por nombre de tarifa
+                indice = _find_tarifa(nombres_opciones, valor_sheet, nombre_tarifa)
 
-                # Si no hay match exacto, buscar por coincidencia parcial (nombre de tarifa)
-                if not opcion_encontrada:
-                    buscar_texto = valor_sheet.split(' -')[0].strip() if ' -' in valor_sheet else valor_sheet
-                    for opcion in opciones:
-                        texto_opcion = opcion.text.strip()
-                        if texto_opcion.startswith(buscar_texto + ' -'):
-                            if opcion_encontrada is None:
-                                opcion_encontrada = opcion
-                            elif '$ 0,00' not in texto_opcion:
-                                # Preferir la opción con precio real sobre la gratuita
-                                opcion_encontrada = opcion
-
-                if opcion_encontrada:
-                    texto_seleccionado = opcion_encontrada.text.strip()
-                    if self.headless_mode:
-                        self.driver.execute_script("arguments[0].click();", opcion_encontrada)
-                    else:
-                        opcion_encontrada.click()
+                if indice is not None:
+                    texto_seleccionado = nombres_opciones[indice]
+                    self.click_combobox_option(indice)
                     self.log(f"  ✓ Tarifa seleccionada: {texto_seleccionado}")
-                    time.sleep(0.3)
+                    self.wait_for_dom(COMBOBOX_OPTIONS_CSS, present=False)
                 else:
-                    nombres_opciones = [o.text.strip() for o in opciones]
                     self.log(f"  ✗ Tarifa '{valor_sheet}' no encontrada en opciones: {nombres_opciones}")
 
                     # Actualizar Sheet con error
                     if self.sheet:
                         try:
                             error_msg = f"ERROR: Tarifa '{valor_sheet}' no encontrada"
-                            self.sheet.update_cell(self.current_row, self.get_column_index('Estado'), error_msg)
+                            self.queue_cell_write(self.current_row, self.get_column_index('Estado'), error_msg)
                         except:
                             pass
 
@@ -1305,7 +2277,7 @@ class TicketAutomation:
                 if self.sheet:
                     try:
                         error_msg = f"ERROR: No se pudo seleccionar tarifa"
-                        self.sheet.update_cell(self.current_row, self.get_column_index('Estado'), error_msg)
+                        self.queue_cell_write(self.current_row, self.get_column_index('Estado'), error_msg)
                     except:
                         pass
 
@@ -1341,18 +2313,17 @@ class TicketAutomation:
             
             if cargar_asistentes:
                 # Llenar datos del asistente
-                nombre = str(row_data.get('Nombre', ''))
-                apellido = str(row_data.get('Apellido', ''))
+                nombre = payload['nombre']
+                apellido = payload['apellido']
 
-                # Limpiar DNI: solo letras y números (soporta pasaportes alfanuméricos)
-                # Convertir a string primero (Google Sheets puede devolver números como int)
-                dni_raw = str(row_data.get('DNI', ''))
-                dni = re.sub(r'[^a-zA-Z0-9]', '', dni_raw)
+                # DNI ya limpiado en _prepare_row_payload
+                dni_raw = payload['dni_raw']
+                dni = payload['dni']
                 if dni != dni_raw:
                     self.log(f"  DNI limpiado: '{dni_raw}' → '{dni}'")
 
                 # Leer tipo de documento del Sheet (DNI, CI, Pasaporte, Otro)
-                tipo_documento = str(row_data.get('Tipo', 'DNI')).strip()
+                tipo_documento = payload['tipo_documento']
 
                 # PASO 6b: Seleccionar tipo de documento
                 self.log(f"6b. Seleccionando tipo de documento del Sheet: {tipo_documento}")
@@ -1365,8 +2336,7 @@ class TicketAutomation:
                     posibles_tipos = ['DNI', 'CI', 'Pasaporte', 'Otro', 'Documento']
                     for tipo in posibles_tipos:
                         try:
-                            tipo_doc_button = self.driver.find_element(By.XPATH,
-                                f"//button[contains(@id, 'headlessui-listbox-button')]//span[contains(text(), '{tipo}')]/..")
+                            tipo_doc_button = self.driver.find_element(By.XPATH, TIPO_DOC_BUTTON_XPATH.format(tipo))
                             self.log(f"  ✓ Encontrado listbox de tipo de documento con texto '{tipo}'")
                             break
                         except:
@@ -1375,8 +2345,7 @@ class TicketAutomation:
                     if not tipo_doc_button:
                         self.log(f"  ⚠ No se encontró listbox de tipo de documento por contenido, intentando con el último button...")
                         # Fallback: usar el último listbox button encontrado
-                        tipo_doc_buttons = self.driver.find_elements(By.XPATH,
-                            "//button[contains(@id, 'headlessui-listbox-button')]")
+                        tipo_doc_buttons = self.driver.find_elements(By.CSS_SELECTOR, LISTBOX_BUTTONS_CSS)
                         if len(tipo_doc_buttons) > 0:
                             tipo_doc_button = tipo_doc_buttons[-1]  # Último button
                             self.log(f"  Usando último listbox button (total: {len(tipo_doc_buttons)})")
@@ -1386,20 +2355,9 @@ class TicketAutomation:
 
                 if tipo_doc_button:
                     try:
-                        # Hacer click en el botón para abrir el dropdown
+                        # Abrir el dropdown y listar TODAS las opciones disponibles
                         self.log(f"  Abriendo dropdown de tipo de documento...")
-                        if self.headless_mode:
-                            self.driver.execute_script("arguments[0].click();", tipo_doc_button)
-                        else:
-                            tipo_doc_button.click()
-
-                        # Esperar a que aparezcan las opciones
-                        time.sleep(0.5)
-
-                        # Listar TODAS las opciones disponibles en el dropdown
-                        opciones_elements = self.driver.find_elements(By.XPATH,
-                            "//li[contains(@id, 'headlessui-listbox-option')]//span[contains(@class, 'block truncate')]")
-                        opciones_disponibles = [opt.text.strip() for opt in opciones_elements]
+                        opciones_disponibles = self.open_listbox(tipo_doc_button)
                         self.log(f"  Opciones disponibles en dropdown: {opciones_disponibles}")
 
                         # Find matching option using flexible text matching
@@ -1414,21 +2372,12 @@ class TicketAutomation:
                             # El tipo existe: buscar y hacer click en la opción EXACTA del dropdown
                             self.log(f"  ✓ Tipo '{tipo_documento}' coincide con '{matching_tipo}' en el dropdown")
 
-                            # XPath que busca el texto exacto dentro del span (usar el matching_tipo del dropdown)
-                            tipo_option_xpath = f"//li[contains(@id, 'headlessui-listbox-option')]//span[contains(@class, 'block truncate') and text()='{matching_tipo}']"
-
-                            tipo_option = WebDriverWait(self.driver, 5).until(
-                                EC.element_to_be_clickable((By.XPATH, tipo_option_xpath))
-                            )
-
-                            # Click en la opción
-                            if self.headless_mode:
-                                self.driver.execute_script("arguments[0].click();", tipo_option)
-                            else:
-                                tipo_option.click()
+                            # Click en la opción con el texto exacto del dropdown (matching_tipo)
+                            if not self.click_listbox_option(matching_tipo):
+                                raise NoSuchElementException(f"No se encontró la opción '{matching_tipo}'")
 
                             self.log(f"  ✓ Tipo de documento seleccionado: {tipo_documento}")
-                            time.sleep(0.3)
+                            self.wait_for_dom(LISTBOX_OPTIONS_CSS, present=False)
 
                         else:
                             # El tipo del Sheet NO existe en el dropdown - ERROR CRÍTICO
@@ -1440,7 +2389,7 @@ class TicketAutomation:
                             # Cerrar el dropdown
                             try:
                                 self.driver.execute_script("document.body.click();")
-                                time.sleep(0.3)
+                                self.wait_for_dom(LISTBOX_OPTIONS_CSS, present=False)
                             except:
                                 pass
 
@@ -1448,7 +2397,7 @@ class TicketAutomation:
                             if self.sheet:
                                 try:
                                     error_msg = f"ERROR: Tipo '{tipo_documento}' no válido para este evento. Opciones: {', '.join(opciones_disponibles)}"
-                                    self.sheet.update_cell(self.current_row, self.get_column_index('Estado'), error_msg)
+                                    self.queue_cell_write(self.current_row, self.get_column_index('Estado'), error_msg)
                                 except:
                                     pass
 
@@ -1465,7 +2414,7 @@ class TicketAutomation:
                         # Intentar cerrar el dropdown
                         try:
                             self.driver.execute_script("document.body.click();")
-                            time.sleep(0.3)
+                            self.wait_for_dom(LISTBOX_OPTIONS_CSS, present=False)
                         except:
                             pass
 
@@ -1479,7 +2428,7 @@ class TicketAutomation:
                     if self.sheet:
                         try:
                             error_msg = f"ERROR: No se encontró selector de tipo de documento"
-                            self.sheet.update_cell(self.current_row, self.get_column_index('Estado'), error_msg)
+                            self.queue_cell_write(self.current_row, self.get_column_index('Estado'), error_msg)
                         except:
                             pass
 
@@ -1499,72 +2448,23 @@ class TicketAutomation:
                 )
 
 
-            # PASO 8: Omitir (si aparece)
-            self.log("8. Buscando botón Omitir...")
-            self.wait_and_click(
-                "//button[contains(., 'Omitir')]",
-                timeout=3,
-                description="omitir"
-            )
+            # PASOS 8-10: Omitir (si aparece), Quentro y enviar por email,
+            # clickeados dentro del navegador en un solo round trip
+            self.log("8-10. Omitir, Quentro y enviar por email...")
+            self.run_click_steps(CLICK_STEPS_METODO_ENVIO)
 
-            # PASO 9: Seleccionar Quentro
-            self.log("9. Seleccionando Quentro...")
-            self.wait_and_click(
-                "//button[contains(@class, 'group') and contains(., 'Quentro')]",
-                description="Quentro"
-            )
-
-            # PASO 10: Seleccionar enviar por email
-            self.log("10. Seleccionando enviar por email...")
-            self.wait_and_click(
-                "//button[contains(@class, 'group') and contains(., 'Enviar por email')]",
-                description="enviar por email"
-            )
-            # PASO 11: Ingresar email y continuar
-            email = str(row_data.get('Mail', ''))
+            # PASO 11: Ingresar email; Continuar, segundo Omitir y Reservar van
+            # juntos en un solo round trip
+            email = payload['email']
             if email:
                 self.log(f"11. Ingresando email: {email}")
                 self.wait_and_send_keys("email", email, description="email")
-
-                # Click en Continuar después del email
-                self.log("11b. Haciendo click en Continuar después del email...")
-                continuar_email = self.wait_and_click(
-                    "//button[@type='submit' and contains(., 'Continuar') and contains(@class, 'self-end')]",
-                    timeout=5,
-                    description="botón Continuar después de email"
-                )
-                
-                if not continuar_email:
-                    # Intentar selector alternativo
-                    self.wait_and_click(
-                        "//button[@type='submit' and contains(@class, 'bg-primary-600') and contains(., 'Continuar')]",
-                        timeout=3,
-                        description="botón Continuar alternativo"
-                    )
-
-                # Esperar a que cargue la siguiente sección
-                time.sleep(1)
-
-                # PASO 12: Omitir (si aparece nuevamente)
-                self.log("12. Buscando segundo botón Omitir...")
-                self.wait_and_click(
-                    "//div[contains(@class, 'border-t')]//button[@type='button' and contains(., 'Omitir')]",
-                    timeout=5,
-                    description="omitir pequeño"
-                )
-            
-            # PASO 13: Reservar entradas
-            self.log("13. Reservando entradas...")
-            reservar = self.wait_and_click(
-                "//button[contains(., 'Reservar entradas')]",
-                description="reservar entradas"
-            )
-            
-            if not reservar:
-                self.wait_and_click(
-                    "//button[contains(@class, 'bg-primary-600') and contains(@class, 'text-base')]",
-                    description="botón principal"
-                )
+                self.log("11b-13. Continuar, omitir y reservar entradas...")
+                self.run_click_steps(CLICK_STEPS_DESPUES_EMAIL + CLICK_STEPS_RESERVAR)
+            else:
+                self.log("11. Sin email: se saltean Continuar y el segundo Omitir")
+                self.log("13. Reservando entradas...")
+                self.run_click_steps(CLICK_STEPS_RESERVAR)
 
             # VERIFICAR ERROR DNI DUPLICADO INMEDIATAMENTE (antes de esperar carga)
             if self.check_duplicate_dni_error_fast():
@@ -1573,24 +2473,28 @@ class TicketAutomation:
 
             # Solo si no hay error, esperar que aparezcan las opciones de pago
             try:
-                WebDriverWait(self.driver, 10).until(
-                    EC.presence_of_element_located((By.XPATH,
-                        "//div[@role='radiogroup'] | //button[@type='submit' and contains(., 'Pagar')]"))
+                WebDriverWait(self.driver, 10, poll_frequency=0.05).until(
+                    EC.presence_of_element_located((By.XPATH, PAYMENT_OPTIONS_XPATH))
                 )
                 self.log("✓ Opciones de pago cargadas correctamente")
-                time.sleep(0.5)  # Micro-delay para estabilización
+                # Estabilización: esperar que Pagar quede habilitado (no un delay fijo)
+                try:
+                    WebDriverWait(self.driver, 1, poll_frequency=0.05).until(
+                        EC.element_to_be_clickable((By.XPATH, PAGAR_BUTTON_XPATH))
+                    )
+                except TimeoutException:
+                    pass  # Puede habilitarse recién al elegir la forma de pago
             except TimeoutException:
                 self.log("⚠ Opciones de pago tardaron en cargar")
 
             # PASO 14: Seleccionar Cortesía como forma de pago si está disponible
             # (aplica para cualquier tarifa de $0, no solo las que se llaman "Cortesía")
             try:
-                cortesia_radio = self.driver.find_elements(By.XPATH,
-                    "//div[@role='radiogroup']//p[text()='Cortesía']/ancestor::div[@role='radio']")
+                cortesia_radio = self.driver.find_elements(By.XPATH, CORTESIA_RADIO_XPATH)
                 if cortesia_radio:
                     self.log("14. Seleccionando Cortesía como forma de pago...")
                     cortesia_seleccionada = self.wait_and_click(
-                        "//div[@role='radiogroup']//p[text()='Cortesía']/ancestor::div[@role='radio']",
+                        CORTESIA_RADIO_XPATH,
                         timeout=5,
                         description="botón radio Cortesía"
                     )
@@ -1606,7 +2510,7 @@ class TicketAutomation:
             # PASO 15: Pagar
             self.log("15. Confirmando pago...")
             pagar = self.wait_and_click(
-                "//button[@type='submit' and contains(., 'Pagar')]",
+                PAGAR_BUTTON_XPATH,
                 description="pagar"
             )
             
@@ -1619,12 +2523,8 @@ class TicketAutomation:
             # PASO 16: Esperar confirmación y capturar número de ticket
             # Esperar que aparezca el número de ticket (en lugar de sleep de 5 segundos)
             try:
-                WebDriverWait(self.driver, 10).until(
-                    EC.presence_of_element_located((By.XPATH,
-                        "//p[contains(@class, 'text-gray-500') and contains(text(), '#')] | "
-                        "//span[contains(text(), '#')] | "
-                        "//div[contains(text(), '#')] | "
-                        "//*[contains(@class, 'text-sm') and contains(text(), '#')]"))
+                WebDriverWait(self.driver, 10, poll_frequency=0.05).until(
+                    EC.presence_of_element_located((By.XPATH, TICKET_NUMBER_ANY_XPATH))
                 )
             except TimeoutException:
                 self.log("  ⚠ No se detectó número de ticket rápidamente")
@@ -1634,17 +2534,15 @@ class TicketAutomation:
             ticket_number = self.capture_ticket_number()
             
             if ticket_number:
-                duration = time.time() - start_time
+                duration = (time.perf_counter_ns() - start_ns) / 1e9
                 self.log(f"✓ Ticket generado: {ticket_number}")
                 self.log(f"⏱️ TICKET {ticket_number} EMITIDO EN {duration:.1f} SEGUNDOS")
 
-                # PASO 17: Realizar otra venta
+                # PASO 17: Volver a la página de emisión
                 self.log("17. Preparando siguiente venta...")
-                self.wait_and_click(
-                    "//button[contains(., 'Realizar otra venta')]",
-                    timeout=5,
-                    description="realizar otra venta"
-                )
+                # Directo a la URL de emisión del evento, en vez del botón
+                # "Realizar otra venta" (modal animado + transición del router)
+                self._navigate_to_sale_page()
 
                 return ticket_number
             else:
@@ -1659,43 +2557,32 @@ class TicketAutomation:
 
     def emitir_ticket_innominado(self, row_data, row_number):
         """Proceso completo de emisión de ticket innominado (sin datos personales)"""
-        start_time = time.time()  # Inicio del timer de performance
+        start_ns = time.perf_counter_ns()  # Inicio del timer de performance (monotónico)
         try:
+            payload = self._prepare_row_payload(row_data)
             self.log(f"\n=== Procesando INNOMINADO fila {row_number} ===")
 
             # Set current row for error handling
             self.current_row = row_number
 
             # PASO 1: Seleccionar función (IDÉNTICO A NOMINADOS)
-            funcion = str(row_data.get('Función', '')).strip()
+            funcion = payload['funcion']
             if funcion:
                 self.log(f"1. Seleccionando función: {funcion}")
             else:
                 self.log("1. Seleccionando función (primera disponible)...")
 
-            # Click en el primer listbox button (selector de función)
-            funcion_buttons = self.driver.find_elements(By.XPATH,
-                "//button[contains(@id, 'headlessui-listbox-button') and contains(@class, 'cursor-default')]")
+            # Click en el primer listbox button (selector de función), apenas se monta
+            funcion_buttons = self._wait_for(FUNCION_BUTTONS_CSS, timeout=5)
 
             if len(funcion_buttons) > 0:
-                # Click en el primer button (función)
-                if self.headless_mode:
-                    self.driver.execute_script("arguments[0].click();", funcion_buttons[0])
-                else:
-                    funcion_buttons[0].click()
-
-                # Esperar que se desplieguen las opciones
-                time.sleep(0.5)
-
-                # Listar TODAS las opciones disponibles
-                opciones_elements = self.driver.find_elements(By.XPATH,
-                    "//li[contains(@id, 'headlessui-listbox-option')]//span[contains(@class, 'block truncate')]")
-                opciones_disponibles = [opt.text.strip() for opt in opciones_elements]
+                # Abrir el primer button (función) y listar TODAS las opciones disponibles
+                opciones_disponibles = self.open_listbox(funcion_buttons[0])
                 self.log(f"  Opciones de función disponibles: {opciones_disponibles}")
 
                 if funcion:
                     # Normalize the function from Google Sheets for locale-independent comparison
-                    funcion_normalizada = self.normalize_datetime_string(funcion)
+                    funcion_normalizada = payload['funcion_normalizada']
                     self.log(f"  Función del Sheet: '{funcion}' (normalizada: '{funcion_normalizada}')")
 
                     # Find matching option using flexible date matching
@@ -1711,36 +2598,12 @@ class TicketAutomation:
                         self.log(f"  ✓ Función '{funcion}' coincide con '{matching_option}' en el dropdown")
 
                         try:
-                            # Find and click the matching option
-                            # Re-fetch elements to avoid stale element issues
-                            opciones_li = self.driver.find_elements(By.XPATH,
-                                "//li[contains(@id, 'headlessui-listbox-option')]")
-
-                            funcion_option = None
-                            for li_elem in opciones_li:
-                                try:
-                                    span_elem = li_elem.find_element(By.XPATH, ".//span[contains(@class, 'block truncate')]")
-                                    # Use dates_match for consistency (handles whitespace/encoding diffs after re-fetch)
-                                    if self.dates_match(span_elem.text.strip(), matching_option):
-                                        funcion_option = li_elem
-                                        break
-                                except:
-                                    continue
-
-                            if funcion_option:
-                                # Click en la opción
-                                if self.headless_mode:
-                                    self.driver.execute_script("arguments[0].click();", funcion_option)
-                                else:
-                                    funcion_option.click()
-
+                            # Click en la opción (mismo texto que devolvió el listbox abierto)
+                            if self.click_listbox_option(matching_option):
                                 self.log(f"  ✓ Función seleccionada: {funcion}")
-                                time.sleep(0.3)
+                                self.wait_for_dom(LISTBOX_OPTIONS_CSS, present=False)
                             else:
                                 # Debug: show exact bytes to diagnose encoding issues
-                                refetched = [li.find_element(By.XPATH, ".//span[contains(@class, 'block truncate')]").text
-                                             for li in opciones_li if li.find_elements(By.XPATH, ".//span[contains(@class, 'block truncate')]")]
-                                self.log(f"  DEBUG refetched options: {refetched}")
                                 self.log(f"  DEBUG matching_option repr: {repr(matching_option)}")
                                 raise Exception(f"No se encontró el elemento para '{matching_option}'")
 
@@ -1756,7 +2619,7 @@ class TicketAutomation:
                             if self.sheet:
                                 try:
                                     error_msg = f"ERROR: No se pudo seleccionar función '{funcion}'"
-                                    self.sheet.update_cell(self.current_row, self.get_column_index('Estado'), error_msg)
+                                    self.queue_cell_write(self.current_row, self.get_column_index('Estado'), error_msg)
                                 except:
                                     pass
 
@@ -1773,7 +2636,7 @@ class TicketAutomation:
                         # Cerrar el dropdown
                         try:
                             self.driver.execute_script("document.body.click();")
-                            time.sleep(0.3)
+                            self.wait_for_dom(LISTBOX_OPTIONS_CSS, present=False)
                         except:
                             pass
 
@@ -1781,109 +2644,72 @@ class TicketAutomation:
                         if self.sheet:
                             try:
                                 error_msg = f"ERROR: Función '{funcion}' no válida. Opciones: {', '.join(opciones_disponibles)}"
-                                self.sheet.update_cell(self.current_row, self.get_column_index('Estado'), error_msg)
+                                self.queue_cell_write(self.current_row, self.get_column_index('Estado'), error_msg)
                             except:
                                 pass
 
                         # SKIP esta entrada
                         self.log(f"  ⏭️  Saltando esta entrada y continuando con la siguiente...")
-                        self._navigate_to_sale_page()
+                        # No se seleccionó nada todavía: si ya está en la página, no recargar
+                        self._navigate_to_sale_page(reload=False)
                         return
 
                 else:
                     # Si no hay función especificada, usar la primera
                     self.log("  Sin función especificada, usando primera disponible")
                     self.wait_and_click(
-                        "//li[contains(@id, 'headlessui-listbox-option')][1]",
+                        LISTBOX_OPTIONS_CSS,
+                        by=By.CSS_SELECTOR,
                         timeout=5,
                         description="primera función"
                     )
 
             # PASO 2: Seleccionar sector (IDÉNTICO A NOMINADOS)
-            sector = str(row_data.get('Sector', '')).strip()
+            sector = payload['sector']
             if sector:
                 self.log(f"2. Seleccionando sector: {sector}")
                 # Click en el segundo listbox (sector)
-                sector_buttons = self.driver.find_elements(By.XPATH,
-                    "//button[contains(@id, 'headlessui-listbox-button')]")
+                sector_buttons = self._wait_for(LISTBOX_BUTTONS_CSS, count=2, timeout=2)
 
                 if len(sector_buttons) > 1:
-                    if self.headless_mode:
-                        self.driver.execute_script("arguments[0].click();", sector_buttons[1])
-                    else:
-                        sector_buttons[1].click()
-
-                    # Buscar y clickear el sector correcto
-                    try:
-                        # Buscar match parcial del sector
-                        sector_option = self.driver.find_element(By.XPATH,
-                            f"//li[contains(@id, 'headlessui-listbox-option')][contains(translate(., 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), '{sector.lower()}')]")
-                        if self.headless_mode:
-                            self.driver.execute_script("arguments[0].click();", sector_option)
-                        else:
-                            sector_option.click()
-                    except:
-                        # Si no encuentra, seleccionar el primero
-                        self.wait_and_click(
-                            "//li[contains(@id, 'headlessui-listbox-option')][1]",
-                            timeout=3,
-                            description="primer sector disponible"
-                        )
+                    # Abrir, buscar match parcial del sector y clickearlo (si no, el primero)
+                    sector_elegido = self.select_listbox_option(sector_buttons[1], sector)
+                    if sector_elegido is None:
+                        self.log("  ⚠ No se encontró ningún sector disponible")
+                    elif sector.lower() not in sector_elegido.lower():
+                        self.log(f"  ⚠ Sector '{sector}' no encontrado, usando '{sector_elegido}'")
 
             # PASO 3: Seleccionar tarifa - usar valor del Sheet (IDÉNTICO A NOMINADOS)
-            valor_sheet = str(row_data.get('Valor', '')).strip()
+            valor_sheet, nombre_tarifa = payload['valor_sheet'], payload['nombre_tarifa']
             self.log(f"3. Seleccionando tarifa: {valor_sheet}")
 
             try:
                 # Click en el botón del combobox para abrir dropdown (NO escribir en el input)
-                tarifa_button = WebDriverWait(self.driver, 5).until(
-                    EC.element_to_be_clickable((By.XPATH, "//button[contains(@id, 'headlessui-combobox-button')]"))
+                tarifa_button = WebDriverWait(self.driver, 5, poll_frequency=0.05).until(
+                    EC.element_to_be_clickable((By.CSS_SELECTOR, COMBOBOX_BUTTON_CSS))
                 )
-                tarifa_button.click()
-                time.sleep(0.5)
 
-                # Obtener TODAS las opciones visibles del dropdown
-                opciones = WebDriverWait(self.driver, 3).until(
-                    EC.presence_of_all_elements_located((By.XPATH, "//li[contains(@id, 'headlessui-combobox-option')]"))
-                )
+                # Abrir y leer TODAS las opciones del dropdown en un solo round trip
+                nombres_opciones = self.open_combobox(tarifa_button)
+                if not nombres_opciones:
+                    raise TimeoutException("No aparecieron opciones de tarifa")
 
-                # Buscar la opción que matchee exactamente el valor del sheet
-                opcion_encontrada = None
-                for opcion in opciones:
-                    texto_opcion = opcion.text.strip()
-                    if texto_opcion == valor_sheet:
-                        opcion_encontrada = opcion
-                        break
+                # Match exacto con el valor del sheet, o parcial por nombre de tarifa
+                indice = _find_tarifa(nombres_opciones, valor_sheet, nombre_tarifa)
 
-                # Si no hay match exacto, buscar por coincidencia parcial (nombre de tarifa)
-                if not opcion_encontrada:
-                    buscar_texto = valor_sheet.split(' -')[0].strip() if ' -' in valor_sheet else valor_sheet
-                    for opcion in opciones:
-                        texto_opcion = opcion.text.strip()
-                        if texto_opcion.startswith(buscar_texto + ' -'):
-                            if opcion_encontrada is None:
-                                opcion_encontrada = opcion
-                            elif '$ 0,00' not in texto_opcion:
-                                # Preferir la opción con precio real sobre la gratuita
-                                opcion_encontrada = opcion
-
-                if opcion_encontrada:
-                    texto_seleccionado = opcion_encontrada.text.strip()
-                    if self.headless_mode:
-                        self.driver.execute_script("arguments[0].click();", opcion_encontrada)
-                    else:
-                        opcion_encontrada.click()
+                if indice is not None:
+                    texto_seleccionado = nombres_opciones[indice]
+                    self.click_combobox_option(indice)
                     self.log(f"  ✓ Tarifa seleccionada: {texto_seleccionado}")
-                    time.sleep(0.3)
+                    self.wait_for_dom(COMBOBOX_OPTIONS_CSS, present=False)
                 else:
-                    nombres_opciones = [o.text.strip() for o in opciones]
                     self.log(f"  ✗ Tarifa '{valor_sheet}' no encontrada en opciones: {nombres_opciones}")
 
                     # Actualizar Sheet con error
                     if self.sheet:
                         try:
                             error_msg = f"ERROR: Tarifa '{valor_sheet}' no encontrada"
-                            self.sheet.update_cell(self.current_row, self.get_column_index('Estado'), error_msg)
+                            self.queue_cell_write(self.current_row, self.get_column_index('Estado'), error_msg)
                         except:
                             pass
 
@@ -1900,7 +2726,7 @@ class TicketAutomation:
                 if self.sheet:
                     try:
                         error_msg = f"ERROR: No se pudo seleccionar tarifa"
-                        self.sheet.update_cell(self.current_row, self.get_column_index('Estado'), error_msg)
+                        self.queue_cell_write(self.current_row, self.get_column_index('Estado'), error_msg)
                     except:
                         pass
 
@@ -1909,14 +2735,14 @@ class TicketAutomation:
                 return
 
             # PASO 4: Cantidad (DIFERENTE - Leer y llenar cantidad)
-            cantidad = str(row_data.get('Cantidad', '1'))
+            cantidad = payload['cantidad']
             self.log(f"4. Ingresando cantidad desde Sheet: {cantidad}")
 
             # Buscar campo de cantidad con ID correcto: items.0.quantity
             cantidad_llenada = False
             try:
                 # Buscar el campo con el ID correcto
-                cantidad_input = WebDriverWait(self.driver, 5).until(
+                cantidad_input = WebDriverWait(self.driver, 5, poll_frequency=0.05).until(
                     EC.presence_of_element_located((By.ID, "items.0.quantity"))
                 )
 
@@ -1929,7 +2755,6 @@ class TicketAutomation:
                 # Disparar eventos para que el framework detecte el cambio
                 self.driver.execute_script("arguments[0].dispatchEvent(new Event('input', { bubbles: true }));", cantidad_input)
                 self.driver.execute_script("arguments[0].dispatchEvent(new Event('change', { bubbles: true }));", cantidad_input)
-                time.sleep(0.2)
 
                 # Verificar que el valor se estableció correctamente
                 valor_actual = cantidad_input.get_attribute('value')
@@ -1965,90 +2790,26 @@ class TicketAutomation:
                 )
 
             # PASO 6: OMITIR DIRECTAMENTE (COMPLETAMENTE DIFERENTE)
-            self.log("6. Omitiendo carga de asistentes...")
-            omitir_clicked = self.wait_and_click(
-                "//button[@type='submit' and contains(., 'Omitir')]",
-                timeout=5,
-                description="botón Omitir"
-            )
-
-            if not omitir_clicked:
-                # Intentar selector alternativo
-                self.wait_and_click(
-                    "//button[contains(@class, 'bg-primary-600') and contains(., 'Omitir')]",
-                    timeout=3,
-                    description="botón Omitir alternativo"
-                )
-
             # PASO 7-16: IDÉNTICO A NOMINADOS (empezando desde paso 8 de nominados)
 
-            # PASO 7: Omitir (si aparece)
-            self.log("7. Buscando botón Omitir...")
-            self.wait_and_click(
-                "//button[contains(., 'Omitir')]",
-                timeout=3,
-                description="omitir"
-            )
-
-            # PASO 8: Seleccionar Quentro
-            self.log("8. Seleccionando Quentro...")
-            self.wait_and_click(
-                "//button[contains(@class, 'group') and contains(., 'Quentro')]",
-                description="Quentro"
-            )
+            # PASOS 6-9: Omitir asistentes, Omitir (si aparece), Quentro y enviar
+            # por email, clickeados dentro del navegador en un solo round trip;
+            # los Omitir se saltean apenas aparece Quentro
+            self.log("6-9. Omitiendo carga de asistentes, Quentro y enviar por email...")
+            self.run_click_steps(CLICK_STEPS_OMITIR_ASISTENTES + CLICK_STEPS_METODO_ENVIO)
 
-            # PASO 9: Seleccionar enviar por email
-            self.log("9. Seleccionando enviar por email...")
-            self.wait_and_click(
-                "//button[contains(@class, 'group') and contains(., 'Enviar por email')]",
-                description="enviar por email"
-            )
-
-            # PASO 10: Ingresar email y continuar
-            email = str(row_data.get('Mail', ''))
+            # PASO 10: Ingresar email; Continuar, segundo Omitir y Reservar van
+            # juntos en un solo round trip
+            email = payload['email']
             if email:
                 self.log(f"10. Ingresando email: {email}")
                 self.wait_and_send_keys("email", email, description="email")
-
-                # Click en Continuar después del email
-                self.log("10b. Haciendo click en Continuar después del email...")
-                continuar_email = self.wait_and_click(
-                    "//button[@type='submit' and contains(., 'Continuar') and contains(@class, 'self-end')]",
-                    timeout=5,
-                    description="botón Continuar después de email"
-                )
-
-                if not continuar_email:
-                    # Intentar selector alternativo
-                    self.wait_and_click(
-                        "//button[@type='submit' and contains(@class, 'bg-primary-600') and contains(., 'Continuar')]",
-                        timeout=3,
-                        description="botón Continuar alternativo"
-                    )
-
-                # Esperar a que cargue la siguiente sección
-                time.sleep(1)
-
-                # PASO 11: Omitir (si aparece nuevamente)
-                self.log("11. Buscando segundo botón Omitir...")
-                self.wait_and_click(
-                    "//div[contains(@class, 'border-t')]//button[@type='button' and contains(., 'Omitir')]",
-                    timeout=5,
-                    description="omitir pequeño"
-                )
-
-            # PASO 12: Reservar entradas
-            self.log("12. Reservando entradas...")
-            reservar = self.wait_and_click(
-                "//button[contains(., 'Reservar entradas')]",
-                description="reservar entradas"
-            )
-
-            if not reservar:
-                self.wait_and_click(
-                    "//button[contains(@class, 'bg-primary-600') and contains(@class, 'text-base')]",
-                    description="botón principal"
-                )
+                self.log("10b-12. Continuar, omitir y reservar entradas...")
+                self.run_click_steps(CLICK_STEPS_DESPUES_EMAIL + CLICK_STEPS_RESERVAR)
+            else:
+                self.log("10. Sin email: se saltean Continuar y el segundo Omitir")
+                self.log("12. Reservando entradas...")
+                self.run_click_steps(CLICK_STEPS_RESERVAR)
 
             # VERIFICAR ERROR DNI DUPLICADO INMEDIATAMENTE (antes de esperar carga)
             if self.check_duplicate_dni_error_fast():
@@ -2057,24 +2818,28 @@ class TicketAutomation:
 
             # Solo si no hay error, esperar que aparezcan las opciones de pago
             try:
-                WebDriverWait(self.driver, 10).until(
-                    EC.presence_of_element_located((By.XPATH,
-                        "//div[@role='radiogroup'] | //button[@type='submit' and contains(., 'Pagar')]"))
+                WebDriverWait(self.driver, 10, poll_frequency=0.05).until(
+                    EC.presence_of_element_located((By.XPATH, PAYMENT_OPTIONS_XPATH))
                 )
                 self.log("✓ Opciones de pago cargadas correctamente")
-                time.sleep(0.5)  # Micro-delay para estabilización
+                # Estabilización: esperar que Pagar quede habilitado (no un delay fijo)
+                try:
+                    WebDriverWait(self.driver, 1, poll_frequency=0.05).until(
+                        EC.element_to_be_clickable((By.XPATH, PAGAR_BUTTON_XPATH))
+                    )
+                except TimeoutException:
+                    pass  # Puede habilitarse recién al elegir la forma de pago
             except TimeoutException:
                 self.log("⚠ Opciones de pago tardaron en cargar")
 
             # PASO 13: Seleccionar Cortesía como forma de pago si está disponible
             # (aplica para cualquier tarifa de $0, no solo las que se llaman "Cortesía")
             try:
-                cortesia_radio = self.driver.find_elements(By.XPATH,
-                    "//div[@role='radiogroup']//p[text()='Cortesía']/ancestor::div[@role='radio']")
+                cortesia_radio = self.driver.find_elements(By.XPATH, CORTESIA_RADIO_XPATH)
                 if cortesia_radio:
                     self.log("13. Seleccionando Cortesía como forma de pago...")
                     cortesia_seleccionada = self.wait_and_click(
-                        "//div[@role='radiogroup']//p[text()='Cortesía']/ancestor::div[@role='radio']",
+                        CORTESIA_RADIO_XPATH,
                         timeout=5,
                         description="botón radio Cortesía"
                     )
@@ -2090,7 +2855,7 @@ class TicketAutomation:
             # PASO 14: Pagar
             self.log("14. Confirmando pago...")
             pagar = self.wait_and_click(
-                "//button[@type='submit' and contains(., 'Pagar')]",
+                PAGAR_BUTTON_XPATH,
                 description="pagar"
             )
 
@@ -2102,12 +2867,8 @@ class TicketAutomation:
 
             # PASO 15: Esperar confirmación y capturar número de ticket
             try:
-                WebDriverWait(self.driver, 10).until(
-                    EC.presence_of_element_located((By.XPATH,
-                        "//p[contains(@class, 'text-gray-500') and contains(text(), '#')] | "
-                        "//span[contains(text(), '#')] | "
-                        "//div[contains(text(), '#')] | "
-                        "//*[contains(@class, 'text-sm') and contains(text(), '#')]"))
+                WebDriverWait(self.driver, 10, poll_frequency=0.05).until(
+                    EC.presence_of_element_located((By.XPATH, TICKET_NUMBER_ANY_XPATH))
                 )
             except TimeoutException:
                 self.log("  ⚠ No se detectó número de ticket rápidamente")
@@ -2117,17 +2878,15 @@ class TicketAutomation:
             ticket_number = self.capture_ticket_number()
 
             if ticket_number:
-                duration = time.time() - start_time
+                duration = (time.perf_counter_ns() - start_ns) / 1e9
                 self.log(f"✓ Ticket innominado generado: {ticket_number}")
                 self.log(f"⏱️ TICKET INNOMINADO {ticket_number} EMITIDO EN {duration:.1f} SEGUNDOS")
 
-                # PASO 17: Realizar otra venta
+                # PASO 17: Volver a la página de emisión
                 self.log("16. Preparando siguiente venta...")
-                self.wait_and_click(
-                    "//button[contains(., 'Realizar otra venta')]",
-                    timeout=5,
-                    description="realizar otra venta"
-                )
+                # Directo a la URL de emisión del evento, en vez del botón
+                # "Realizar otra venta" (modal animado + transición del router)
+                self._navigate_to_sale_page()
 
                 return ticket_number
             else:
@@ -2142,96 +2901,245 @@ class TicketAutomation:
     def capture_ticket_number(self):
         """Captura el número de ticket de la confirmación"""
         try:
-            patterns = [
-                "//p[contains(@class, 'text-gray-500') and contains(text(), '#')]",
-                "//span[contains(text(), '#')]",
-                "//div[contains(text(), '#')]",
-                "//*[contains(@class, 'text-sm') and contains(text(), '#')]"
-            ]
-            
-            for pattern in patterns:
-                try:
-                    elements = self.driver.find_elements(By.XPATH, pattern)
-                    for elem in elements:
-                        text = elem.text.strip()
-                        if '#' in text and any(c.isdigit() for c in text):
-                            match = re.search(r'#\d+', text)
-                            if match:
-                                return match.group()
-                except:
-                    continue
-            
-            return None
-            
+            # Un solo round trip en vez de find_elements + .text por elemento
+            return self.driver.execute_script(JS_READ_TICKET_NUMBER)
         except Exception as e:
             self.log(f"Error capturando ticket: {str(e)}")
             return None
     
+    def _emit_row(self, idx, row, resultado_col, codigo_col, innominado):
+        """Emite el ticket de una fila y encola su resultado. True si se emitió."""
+        try:
+            if innominado:
+                ticket_number = self.emitir_ticket_innominado(row, idx)
+            else:
+                ticket_number = self.emitir_ticket_completo(row, idx)
+
+            if ticket_number == "ERROR_DNI_DUPLICADO":
+                # Marcar error específico de DNI duplicado
+                self.queue_cell_write(idx, resultado_col, 'Error - DNI duplicado')
+                self.log(f"⚠️ DNI duplicado registrado - continuando con siguiente ticket")
+                ok = False
+            elif ticket_number:
+                # Actualizar el sheet con éxito
+                # Primero el registro local: el lote puede confirmarse en segundo plano
+                # apenas se encola, y la confirmación es la que borra la entrada
+                _save_processed_row(self._sheet_key(), idx, row, ticket_number)
+                self.queue_cell_write(idx, resultado_col, 'Procesado')  # Estado en Resultado
+                self.queue_cell_write(idx, codigo_col, ticket_number)  # Número en Código
+                tipo = "innominado " if innominado else ""
+                self.log(f"✓ Ticket {tipo}emitido y actualizado en Sheet: {ticket_number}")
+                ok = True
+            else:
+                # Marcar error genérico de procesamiento
+                self.queue_cell_write(idx, resultado_col, 'Error - No se procesó')
+                self.log(f"⚠️ Error genérico: ticket_number = {ticket_number}")
+                ok = False
+
+            # Sin pausa fija entre emisiones: la vuelta a la página de emisión ya
+            # espera SALE_PAGE_READY_CSS y la fila siguiente espera sus botones
+            return ok
+
+        except Exception as e:
+            self.log(f"✗ Error en fila {idx}: {str(e)}")
+            try:
+                self.queue_cell_write(idx, resultado_col, f'Error: {str(e)[:30]}')
+            except:
+                pass
+            return False
+
+    def _sheet_key(self, title=None):
+        """Clave de la hoja (por defecto la actual) en el registro local de filas emitidas"""
+        return f"{self.sheet.id}/{title or self.current_worksheet.title}"
+
+    def _emit_rows(self, rows, resultado_col, codigo_col, innominado):
+        """Emite las filas [(idx, row), ...] y devuelve (emitidos, errores).
+
+        Con PARALLEL_SESSIONS > 1 reparte las filas entre este Chrome y otros
+        adicionales, cada uno con su propio login; si no, las emite en orden.
+        """
+        helpers = self._ready_helper_sessions(min(self.PARALLEL_SESSIONS, len(rows)) - 1)
+        try:
+            if not helpers:
+                return self._emit_rows_sequential(rows, resultado_col, codigo_col, innominado)
+
+            sessions = [self] + helpers
+            self.log(f"Emitiendo con {len(sessions)} sesiones en paralelo")
+            row_queue = queue.Queue()
+            for item in rows:
+                row_queue.put(item)
+
+            def drain(session):
+                ok = failed = 0
+                while not self._closing.is_set():
+                    try:
+                        idx, row = row_queue.get_nowait()
+                    except queue.Empty:
+                        return ok, failed
+                    if session._emit_row(idx, row, resultado_col, codigo_col, innominado):
+                        ok += 1
+                    else:
+                        failed += 1
+                return ok, failed
+
+            with ThreadPoolExecutor(max_workers=len(sessions)) as pool:
+                results = list(pool.map(drain, sessions))
+            return sum(r[0] for r in results), sum(r[1] for r in results)
+        finally:
+            # Las sesiones quedan abiertas para la próxima corrida; sus
+            # escrituras se envían ahora, como las de esta instancia
+            for helper in helpers:
+                helper.flush_sheet_writes()
+
+    def _emit_rows_sequential(self, rows, resultado_col, codigo_col, innominado):
+        """Emite las filas en orden con este Chrome"""
+        ok = failed = 0
+        for idx, row in rows:
+            if self._closing.is_set():
+                self.log("⏹ Aplicación cerrándose: se corta la emisión")
+                break
+            if self._emit_row(idx, row, resultado_col, codigo_col, innominado):
+                ok += 1
+            else:
+                failed += 1
+        return ok, failed
+
+    def warm_helper_sessions(self):
+        """Lanza y loguea los Chrome adicionales (BL_SESSIONS) sin esperar a una corrida.
+
+        Se llama al conectar, en segundo plano: el arranque de Chrome y el login
+        se pagan una vez y no al iniciar la emisión.
+        """
+        with self._warm_lock:
+            with self._helpers_lock:
+                # Las logueadas con otra cuenta no sirven tras reconectar
+                stale = [h for h in self._helpers if h._login_credentials != self._login_credentials]
+                self._helpers = [h for h in self._helpers if h not in stale]
+                missing = self.PARALLEL_SESSIONS - 1 - len(self._helpers)
+            for helper in stale:
+                helper.close()
+            if missing <= 0 or self._closing.is_set():
+                return
+
+            # Sin _helpers_lock mientras arrancan: close() no espera a Chrome
+            started = self._start_helper_sessions(missing)
+            with self._helpers_lock:
+                if not self._closing.is_set():
+                    self._helpers += started
+                    started = []
+            # La aplicación se cerró mientras arrancaban
+            for helper in started:
+                helper.close()
+
+    def _ready_helper_sessions(self, count):
+        """Hasta count sesiones adicionales en la página de emisión del evento actual"""
+        if count <= 0:
+            return []
+        self.warm_helper_sessions()
+
+        def ready(helper):
+            helper.sheet = self.sheet
+            helper.gspread_client = self.gspread_client
+            helper.current_worksheet = getattr(self, 'current_worksheet', None)
+            helper.selected_event = self.selected_event
+            helper._header_index = self._header_index
+            return helper._navigate_to_sale_page()
+
+        with self._helpers_lock:
+            helpers = self._helpers[:count]
+        if not helpers:
+            return []
+        with ThreadPoolExecutor(max_workers=len(helpers)) as pool:
+            ok = list(pool.map(ready, helpers))
+
+        broken = [h for h, good in zip(helpers, ok) if not good]
+        if broken:
+            with self._helpers_lock:
+                self._helpers = [h for h in self._helpers if h not in broken]
+            for helper in broken:
+                helper.log("⚠ Sesión adicional no disponible, se sigue sin ella")
+                helper.close()
+        return [h for h, good in zip(helpers, ok) if good]
+
+    def _start_helper_sessions(self, count):
+        """Lanza y loguea count Chrome adicionales.
+
+        Las que no logran arrancar se descartan; devuelve las que quedaron listas.
+        """
+        if count <= 0 or not self._login_credentials:
+            return []
+
+        first = len(self._helpers) + 2
+
+        def start(number):
+            helper = TicketAutomation(headless_mode=True)
+            helper.log_queue = self.log_queue
+            helper.log_prefix = f"[S{number}] "
+            helper.allow_persistent_profile = False
+            if helper.setup_driver() and helper.login(*self._login_credentials):
+                return helper
+            helper.log("⚠ Sesión adicional no disponible, se sigue sin ella")
+            helper.close()
+            return None
+
+        self.log(f"Iniciando {count} sesiones adicionales...")
+        with ThreadPoolExecutor(max_workers=count) as pool:
+            started = list(pool.map(start, range(first, first + count)))
+        return [helper for helper in started if helper]
+
     def process_nominadas(self, worksheet_name="Nominadas"):
         """Procesa todos los tickets nominados"""
         try:
-            worksheet = self.sheet.worksheet(worksheet_name)
+            worksheet = self.get_worksheet(worksheet_name)
             self.current_worksheet = worksheet  # Set current worksheet for get_column_index()
-            records = worksheet.get_all_records()
+            headers, records = self.read_worksheet_rows(worksheet)
 
             self.log(f"\n{'='*50}")
             self.log(f"Iniciando procesamiento de {len(records)} registros")
             self.log(f"{'='*50}\n")
 
-            # Obtener índices de columnas
-            headers = worksheet.row_values(1)
-            resultado_col = headers.index('Resultado') + 1 if 'Resultado' in headers else len(headers)
-            codigo_col = headers.index('Código') + 1 if 'Código' in headers else len(headers) + 1
+            # Obtener índices de columnas (cacheados en la misma lectura)
+            resultado_col = self.get_column_index('Resultado', worksheet) or len(headers)
+            codigo_col = self.get_column_index('Código', worksheet) or len(headers) + 1
             
             processed = 0
             errors = 0
             skipped = 0
+            sheet_key = self._sheet_key()
             
+            # Validaciones baratas primero; las filas válidas se emiten después
+            pendientes = []
             for idx, row in enumerate(records, start=2):
-                try:
-                    # Verificar si ya fue procesado
-                    if row.get('Código') and str(row.get('Código')).startswith('#'):
-                        self.log(f"Fila {idx}: Ya procesado ({row.get('Código')}), saltando...")
-                        skipped += 1
-                        continue
-                    
-                    # Verificar datos mínimos
-                    if not row.get('DNI'):
-                        self.log(f"Fila {idx}: Sin DNI, saltando...")
-                        worksheet.update_cell(idx, resultado_col, 'Error - Sin DNI')
-                        errors += 1
-                        continue
-                    
-                    # Emitir ticket
-                    ticket_number = self.emitir_ticket_completo(row, idx)
-
-                    if ticket_number == "ERROR_DNI_DUPLICADO":
-                        # Marcar error específico de DNI duplicado
-                        worksheet.update_cell(idx, resultado_col, 'Error - DNI duplicado')
-                        errors += 1
-                        self.log(f"⚠️ DNI duplicado registrado - continuando con siguiente ticket")
-                    elif ticket_number:
-                        # Actualizar el sheet con éxito
-                        worksheet.update_cell(idx, resultado_col, 'Procesado')  # Estado en Resultado
-                        worksheet.update_cell(idx, codigo_col, ticket_number)   # Número en Código
-                        processed += 1
-                        self.log(f"✓ Ticket emitido y actualizado en Sheet: {ticket_number}")
-                    else:
-                        # Marcar error genérico de procesamiento
-                        worksheet.update_cell(idx, resultado_col, 'Error - No se procesó')
-                        errors += 1
-                        self.log(f"⚠️ Error genérico: ticket_number = {ticket_number}")
-                    
-                    # Pequeña pausa entre emisiones (menos en modo headless)
-                    time.sleep(0.5 if self.headless_mode else 1)
-                    
-                except Exception as e:
-                    self.log(f"✗ Error en fila {idx}: {str(e)}")
-                    try:
-                        worksheet.update_cell(idx, resultado_col, f'Error: {str(e)[:30]}')
-                    except:
-                        pass
+                # Verificar si ya fue procesado
+                if row.get('Código') and str(row.get('Código')).startswith('#'):
+                    self.log(f"Fila {idx}: Ya procesado ({row.get('Código')}), saltando...")
+                    # Si quedó en el registro local (cierre antes de confirmar), ya no hace falta
+                    _forget_processed_rows([(sheet_key, idx)])
+                    skipped += 1
+                    continue
+
+                # Emitido en una corrida anterior cuyo resultado no llegó al Sheet
+                ticket_previo = _processed_ticket(sheet_key, idx, row)
+                if ticket_previo:
+                    self.log(f"Fila {idx}: Ya emitido ({ticket_previo}) según registro local, reescribiendo...")
+                    self.queue_cell_write(idx, resultado_col, 'Procesado')
+                    self.queue_cell_write(idx, codigo_col, ticket_previo)
+                    skipped += 1
+                    continue
+
+                # Verificar datos mínimos
+                if not row.get('DNI'):
+                    self.log(f"Fila {idx}: Sin DNI, saltando...")
+                    self.queue_cell_write(idx, resultado_col, 'Error - Sin DNI')
                     errors += 1
+                    continue
+
+                pendientes.append((idx, row))
+
+            # Emitir tickets
+            ok, failed = self._emit_rows(pendientes, resultado_col, codigo_col, innominado=False)
+            processed += ok
+            errors += failed
             
             # Resumen final
             self.log(f"\n{'='*50}")
@@ -2244,83 +3152,71 @@ class TicketAutomation:
             
         except Exception as e:
             self.log(f"✗ Error general: {str(e)}")
+        finally:
+            # Escribir lo que quede encolado, incluso si el procesamiento se cortó
+            self.flush_sheet_writes()
 
     def process_innominadas(self, worksheet_name="Innominadas"):
         """Procesa todos los tickets innominados"""
         try:
             # Intentar "Innominadas" primero, luego "innominadas"
-            try:
-                worksheet = self.sheet.worksheet(worksheet_name)
-            except:
-                worksheet = self.sheet.worksheet(worksheet_name.lower())
+            worksheet = self.get_worksheet(worksheet_name, worksheet_name.lower())
 
             self.current_worksheet = worksheet  # Set current worksheet for get_column_index()
-            records = worksheet.get_all_records()
+            headers, records = self.read_worksheet_rows(worksheet)
 
             self.log(f"\n{'='*50}")
             self.log(f"Iniciando procesamiento de {len(records)} tickets INNOMINADOS")
             self.log(f"{'='*50}\n")
 
-            # Obtener índices de columnas
-            headers = worksheet.row_values(1)
-            resultado_col = headers.index('Resultado') + 1 if 'Resultado' in headers else len(headers)
-            codigo_col = headers.index('Código') + 1 if 'Código' in headers else len(headers) + 1
+            # Obtener índices de columnas (cacheados en la misma lectura)
+            resultado_col = self.get_column_index('Resultado', worksheet) or len(headers)
+            codigo_col = self.get_column_index('Código', worksheet) or len(headers) + 1
 
             processed = 0
             errors = 0
             skipped = 0
+            sheet_key = self._sheet_key()
 
+            # Validaciones baratas primero; las filas válidas se emiten después
+            pendientes = []
             for idx, row in enumerate(records, start=2):
-                try:
-                    # Verificar si ya fue procesado
-                    if row.get('Código') and str(row.get('Código')).startswith('#'):
-                        self.log(f"Fila {idx}: Ya procesado ({row.get('Código')}), saltando...")
-                        skipped += 1
-                        continue
+                # Verificar si ya fue procesado
+                if row.get('Código') and str(row.get('Código')).startswith('#'):
+                    self.log(f"Fila {idx}: Ya procesado ({row.get('Código')}), saltando...")
+                    # Si quedó en el registro local (cierre antes de confirmar), ya no hace falta
+                    _forget_processed_rows([(sheet_key, idx)])
+                    skipped += 1
+                    continue
 
-                    # VALIDACIÓN DIFERENTE: Verificar Cantidad
-                    cantidad = str(row.get('Cantidad', '0'))
-                    try:
-                        cantidad_int = int(cantidad)
-                    except:
-                        cantidad_int = 0
+                # Emitido en una corrida anterior cuyo resultado no llegó al Sheet
+                ticket_previo = _processed_ticket(sheet_key, idx, row)
+                if ticket_previo:
+                    self.log(f"Fila {idx}: Ya emitido ({ticket_previo}) según registro local, reescribiendo...")
+                    self.queue_cell_write(idx, resultado_col, 'Procesado')
+                    self.queue_cell_write(idx, codigo_col, ticket_previo)
+                    skipped += 1
+                    continue
 
-                    if cantidad_int <= 0:
-                        self.log(f"Fila {idx}: Cantidad inválida o 0, saltando...")
-                        worksheet.update_cell(idx, resultado_col, 'Error - Cantidad inválida')
-                        errors += 1
-                        continue
+                # VALIDACIÓN DIFERENTE: Verificar Cantidad
+                cantidad = str(row.get('Cantidad', '0'))
+                try:
+                    cantidad_int = int(cantidad)
+                except:
+                    cantidad_int = 0
 
-                    # LLAMAR FUNCIÓN INNOMINADA
-                    ticket_number = self.emitir_ticket_innominado(row, idx)
-
-                    if ticket_number == "ERROR_DNI_DUPLICADO":
-                        # Marcar error específico de DNI duplicado
-                        worksheet.update_cell(idx, resultado_col, 'Error - DNI duplicado')
-                        errors += 1
-                        self.log(f"⚠️ DNI duplicado registrado - continuando con siguiente ticket")
-                    elif ticket_number:
-                        # Actualizar el sheet con éxito
-                        worksheet.update_cell(idx, resultado_col, 'Procesado')  # Estado en Resultado
-                        worksheet.update_cell(idx, codigo_col, ticket_number)   # Número en Código
-                        processed += 1
-                        self.log(f"✓ Ticket innominado emitido y actualizado en Sheet: {ticket_number}")
-                    else:
-                        # Marcar error genérico de procesamiento
-                        worksheet.update_cell(idx, resultado_col, 'Error - No se procesó')
-                        errors += 1
-                        self.log(f"⚠️ Error genérico: ticket_number = {ticket_number}")
+                if cantidad_int <= 0:
+                    self.log(f"Fila {idx}: Cantidad inválida o 0, saltando...")
+                    self.queue_cell_write(idx, resultado_col, 'Error - Cantidad inválida')
+                    errors += 1
+                    continue
 
-                    # Pequeña pausa entre emisiones (menos en modo headless)
-                    time.sleep(0.5 if self.headless_mode else 1)
+                pendientes.append((idx, row))
 
-                except Exception as e:
-                    self.log(f"✗ Error en fila {idx}: {str(e)}")
-                    try:
-                        worksheet.update_cell(idx, resultado_col, f'Error: {str(e)[:30]}')
-                    except:
-                        pass
-                    errors += 1
+            # LLAMAR FUNCIÓN INNOMINADA
+            ok, failed = self._emit_rows(pendientes, resultado_col, codigo_col, innominado=True)
+            processed += ok
+            errors += failed
 
             # Resumen final
             self.log(f"\n{'='*50}")
@@ -2333,19 +3229,29 @@ class TicketAutomation:
 
         except Exception as e:
             self.log(f"✗ Error general innominados: {str(e)}")
+        finally:
+            # Escribir lo que quede encolado, incluso si el procesamiento se cortó
+            self.flush_sheet_writes()
 
     def log(self, message):
         """Loguea mensajes en la interfaz y consola"""
         timestamp = datetime.now().strftime("%H:%M:%S")
-        log_message = f"[{timestamp}] {message}"
+        log_message = f"[{timestamp}] {self.log_prefix}{message}"
         print(log_message)
-        if self.log_text:
-            self.log_text.insert(tk.END, log_message + "\n")
-            self.log_text.see(tk.END)
-            self.log_text.update()
+        # Sin tocar Tk desde el hilo de trabajo: la GUI vacía la cola en su mainloop
+        if self.log_queue is not None:
+            self.log_queue.put(log_message)
 
 # Interfaz gráfica con opción de headless
 class AutomationGUI:
+    # Cada cuánto (ms) se vuelca la cola de log al widget mientras llegan líneas
+    # y cuando está quieta, cuántas líneas por vuelta como máximo, y cuántas se
+    # conservan (las más viejas se descartan)
+    LOG_DRAIN_MS = 16
+    LOG_IDLE_MS = 100
+    LOG_DRAIN_BATCH = 256
+    LOG_MAX_LINES = 5000
+
     def __init__(self):
         # Windows DPI awareness: must be set BEFORE creating Tk root
         if sys.platform == 'win32':
@@ -2361,6 +3267,16 @@ class AutomationGUI:
         self.available_events = []
         self.credential_manager = CredentialManager()
         self.updater_instance = None
+        # Un solo pool para el trabajo de la GUI que usa Chrome (conexión,
+        # emisión, template) en vez de un hilo nuevo por click; corta enseguida
+        # al cerrar. Lo que no se puede cortar (consultas de actualización,
+        # arranque de sesiones paralelas) va en hilos daemon con _run_daemon
+        self._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="gui-bg")
+        # Chrome se usa desde un hilo a la vez: la precarga del evento no debe
+        # pisarse con una emisión o un template en curso
+        self._driver_lock = threading.Lock()
+        # Evento cuya página de emisión quedó precargada al seleccionarlo
+        self._prefetched_event_id = None
         self.setup_ui()
 
         # Check for updates on startup (after 3 seconds, non-blocking)
@@ -2434,6 +3350,7 @@ class AutomationGUI:
         
         self.event_listbox = tk.Listbox(self.event_frame, height=10)
         self.event_listbox.pack(fill="x", pady=5)
+        self.event_listbox.bind("<<ListboxSelect>>", self._prefetch_event)
         
         self.get_events_button = ttk.Button(self.event_frame, text="Refrescar Eventos",
                                            command=self.get_events, state="disabled")
@@ -2466,10 +3383,12 @@ class AutomationGUI:
         
         self.log_text = scrolledtext.ScrolledText(log_frame, height=15)
         self.log_text.pack(fill="both", expand=True)
+        self.log_queue = queue.Queue()
+        self.root.after(self.LOG_DRAIN_MS, self._drain_logs)
         
         # Crear automation con el modo inicial
         self.automation = TicketAutomation(headless_mode=False)
-        self.automation.log_text = self.log_text
+        self.automation.log_queue = self.log_queue
         
         # Instrucciones
         self.automation.log("=== INSTRUCCIONES ===")
@@ -2512,25 +3431,36 @@ class AutomationGUI:
             messagebox.showerror("Error", "Ingresá la URL del Google Sheet")
             return
         
-        # Cerrar driver anterior si existe
-        if self.automation and self.automation.driver:
-            self.automation.driver.quit()
-        
-        # Crear nueva instancia con headless mode siempre activado para máximo rendimiento
-        self.automation = TicketAutomation(headless_mode=True)
-        self.automation.log_text = self.log_text
+        # Las reconexiones reutilizan la misma instancia: su Chrome, el cliente
+        # de Sheets, los caches y el worker de escrituras siguen vivos
+        if not self.automation.headless_mode:
+            # La instancia inicial (visible) nunca lanzó Chrome: se reemplaza, en
+            # la primera conexión, por una headless para máximo rendimiento
+            self.automation = TicketAutomation(headless_mode=True)
+            self.automation.log_queue = self.log_queue
             
         self.connect_button.config(state="disabled")
         
-        thread = threading.Thread(target=self._connect_thread, 
-                                 args=(email, password, sheet_url))
-        thread.daemon = True
-        thread.start()
+        self._executor.submit(self._connect_thread, email, password, sheet_url)
     
     def _connect_thread(self, email, password, sheet_url):
         """Thread de conexión"""
+        # El login navega con el mismo Chrome: que una precarga no se cruce
+        with self._driver_lock:
+            self._prefetched_event_id = None
+            connected = self._connect(email, password, sheet_url)
+        if connected:
+            # Obtener eventos automáticamente después del login exitoso; ya
+            # sin el lock, que get_events toma desde el hilo de Tk
+            self.root.after(0, self.get_events)
+
+    def _connect(self, email, password, sheet_url):
+        """Lanza/reutiliza Chrome, hace login y conecta el Sheet (con _driver_lock tomado).
+
+        Devuelve True si todo quedó conectado.
+        """
         try:
-            if not self.automation.setup_driver():
+            if not self.automation.ensure_driver():
                 self.root.after(0, lambda: messagebox.showerror("Error", "No se pudo configurar el driver"))
                 return
 
@@ -2548,12 +3478,14 @@ class AutomationGUI:
                 return
 
             self.automation.log("✓ Sistemas conectados exitosamente")
-            self.automation.log("Obteniendo eventos automáticamente...")
 
-            # Obtener eventos automáticamente después del login exitoso
-            self.root.after(0, self.get_events)
+            # Las sesiones paralelas arrancan mientras se eligen el evento y la hoja
+            if self.automation.PARALLEL_SESSIONS > 1:
+                self._run_daemon(self.automation.warm_helper_sessions)
+            self.automation.log("Obteniendo eventos automáticamente...")
 
             self.root.after(0, lambda: self.get_events_button.config(state="normal"))
+            return True
 
         except Exception as e:
             self.automation.log(f"Error: {str(e)}")
@@ -2563,8 +3495,19 @@ class AutomationGUI:
     
     def get_events(self):
         """Obtiene y muestra los eventos disponibles"""
+        # Corre en el hilo de Tk: sin esperar si Chrome está ocupado (emisión,
+        # template o precarga), para no congelar la ventana
+        if not self._driver_lock.acquire(blocking=False):
+            self.automation.log("⚠ Chrome está ocupado, refrescá los eventos en un momento")
+            return
+        try:
+            self._prefetched_event_id = None
+            events = self.automation.get_available_events()
+        finally:
+            self._driver_lock.release()
+
         self.event_listbox.delete(0, tk.END)
-        self.available_events = self.automation.get_available_events()
+        self.available_events = events
         
         if self.available_events:
             for event in self.available_events:
@@ -2591,25 +3534,54 @@ class AutomationGUI:
         
         self.start_button.config(state="disabled")
         
-        thread = threading.Thread(target=self._process_thread, 
-                                 args=(selected_event,))
-        thread.daemon = True
-        thread.start()
+        self._executor.submit(self._process_thread, selected_event)
     
+    def _prefetch_event(self, _event=None):
+        """Al seleccionar un evento, abre su página de emisión en segundo plano.
+
+        La carga se solapa con el tiempo que tarda el usuario en hacer click
+        en Iniciar; _open_sale_page la reutiliza si el evento coincide.
+        """
+        selection = self.event_listbox.curselection()
+        if not selection or not self.automation or not self.automation.driver:
+            return
+        self._executor.submit(self._prefetch_sale_page, self.available_events[selection[0]])
+
+    def _prefetch_sale_page(self, event):
+        # Si hay una emisión usando Chrome, no precargar
+        if not self._driver_lock.acquire(blocking=False):
+            return
+        try:
+            self._prefetched_event_id = None
+            self.automation.selected_event = event
+            # Siempre recarga: la página pudo quedar tocada (p. ej. por un template)
+            if self.automation._navigate_to_sale_page():
+                self._prefetched_event_id = event['id']
+        finally:
+            self._driver_lock.release()
+
+    def _open_sale_page(self, selected_event):
+        """Deja Chrome en la página de emisión de selected_event.
+
+        Si la precarga ya la abrió (y nada la usó desde entonces) no se recarga.
+        Llamar con _driver_lock tomado.
+        """
+        # Una precarga de otro evento pudo cambiarlo antes de tomar el lock
+        self.automation.selected_event = selected_event
+        prefetched = self._prefetched_event_id == selected_event['id']
+        self._prefetched_event_id = None
+        if not self.automation._navigate_to_sale_page(reload=not prefetched):
+            raise TimeoutException("No se pudo abrir la página de emisión")
+
     def _process_thread(self, selected_event):
         """Thread de procesamiento"""
         try:
-            # Ir a la página de emisión del evento
-            self.automation.driver.get(f"https://pos.buenalive.com/events/{selected_event['id']}/sale")
+            with self._driver_lock:
+                # Ir a la página de emisión del evento y esperar que esté lista
+                self._open_sale_page(selected_event)
 
-            # Esperar que la página de emisión esté lista
-            WebDriverWait(self.automation.driver, 10).until(
-                EC.presence_of_element_located((By.XPATH,
-                    "//button[contains(@id, 'headlessui-listbox-button')] | //input | //form"))
-            )
-
-            # Procesar tickets nominados
-            self.automation.process_nominadas()
+                # Procesar tickets nominados
+                self.automation.process_nominadas()
 
             self.root.after(0, lambda: messagebox.showinfo("Éxito", "Procesamiento completado. Revisá el log para ver el resumen."))
 
@@ -2632,25 +3604,17 @@ class AutomationGUI:
 
         self.start_innominados_button.config(state="disabled")
 
-        thread = threading.Thread(target=self._process_thread_innominados,
-                                 args=(selected_event,))
-        thread.daemon = True
-        thread.start()
+        self._executor.submit(self._process_thread_innominados, selected_event)
 
     def _process_thread_innominados(self, selected_event):
         """Thread de procesamiento de innominados"""
         try:
-            # Ir a la página de emisión del evento
-            self.automation.driver.get(f"https://pos.buenalive.com/events/{selected_event['id']}/sale")
-
-            # Esperar que la página de emisión esté lista
-            WebDriverWait(self.automation.driver, 10).until(
-                EC.presence_of_element_located((By.XPATH,
-                    "//button[contains(@id, 'headlessui-listbox-button')] | //input | //form"))
-            )
+            with self._driver_lock:
+                # Ir a la página de emisión del evento y esperar que esté lista
+                self._open_sale_page(selected_event)
 
-            # Procesar tickets INNOMINADOS
-            self.automation.process_innominadas()
+                # Procesar tickets INNOMINADOS
+                self.automation.process_innominadas()
 
             self.root.after(0, lambda: messagebox.showinfo("Éxito", "Procesamiento de innominados completado. Revisá el log para ver el resumen."))
 
@@ -2684,26 +3648,17 @@ class AutomationGUI:
         self.create_template_button.config(state="disabled")
         self.automation.log(f"\nCreando template para '{selected_event['name']}'...")
 
-        thread = threading.Thread(
-            target=self._create_template_thread,
-            args=(selected_event, sheet_name))
-        thread.daemon = True
-        thread.start()
+        self._executor.submit(self._create_template_thread, selected_event, sheet_name)
 
     def _create_template_thread(self, selected_event, sheet_name):
         """Thread for template creation"""
         try:
             # Navigate to the event's sale page to extract options
-            self.automation.selected_event = selected_event
-            self.automation.driver.get(f"https://pos.buenalive.com/events/{selected_event['id']}/sale")
-
-            WebDriverWait(self.automation.driver, 10).until(
-                EC.presence_of_element_located((By.XPATH,
-                    "//button[contains(@id, 'headlessui-listbox-button')] | //input | //form"))
-            )
+            with self._driver_lock:
+                self._open_sale_page(selected_event)
 
-            # Extract dropdown options from the page
-            event_options = self.automation.extract_event_options()
+                # Extract dropdown options from the page
+                event_options = self.automation.extract_event_options()
             if not event_options:
                 self.root.after(0, lambda: messagebox.showerror("Error", "No se pudieron extraer las opciones del evento"))
                 return
@@ -2732,6 +3687,11 @@ class AutomationGUI:
         finally:
             self.root.after(0, lambda: self.create_template_button.config(state="normal"))
 
+    @staticmethod
+    def _run_daemon(target):
+        """Corre target en un hilo daemon, que no demora la salida del proceso"""
+        threading.Thread(target=target, daemon=True).start()
+
     def check_for_updates_silently(self):
         """Check for updates on startup without blocking UI"""
         def check():
@@ -2744,8 +3704,7 @@ class AutomationGUI:
                 # Fail silently on startup check
                 pass
 
-        thread = threading.Thread(target=check, daemon=True)
-        thread.start()
+        self._run_daemon(check)
 
     def _show_startup_update_notification(self, latest_version):
         """Show update notification from startup check"""
@@ -2773,9 +3732,7 @@ class AutomationGUI:
         self.update_progress.pack(pady=5)
         self.update_progress.start(10)
 
-        thread = threading.Thread(target=self._check_updates_thread)
-        thread.daemon = True
-        thread.start()
+        self._run_daemon(self._check_updates_thread)
 
     def _check_updates_thread(self):
         """Thread for checking updates"""
@@ -2831,11 +3788,46 @@ class AutomationGUI:
             f"No se pudo verificar actualizaciones:\n{error_message}"
         )
 
+    def _drain_logs(self):
+        """Vuelca la cola de log al widget en un solo insert y se reprograma.
+
+        Los mensajes llegan desde los hilos de trabajo; acá se escriben en
+        tandas desde el mainloop, en vez de un insert + update() por línea.
+        """
+        lines = []
+        try:
+            while len(lines) < self.LOG_DRAIN_BATCH:
+                lines.append(self.log_queue.get_nowait())
+        except queue.Empty:
+            pass
+
+        if lines:
+            self.log_text.insert(tk.END, "\n".join(lines) + "\n")
+            # Buffer circular: conservar solo las últimas LOG_MAX_LINES líneas
+            total = int(self.log_text.index('end-1c').split('.')[0])
+            if total > self.LOG_MAX_LINES:
+                self.log_text.delete('1.0', f'{total - self.LOG_MAX_LINES}.0')
+            self.log_text.see(tk.END)
+
+        # Sin actividad se consulta a 10 Hz en vez de despertar el mainloop a 60 Hz
+        self.root.after(self.LOG_DRAIN_MS if lines else self.LOG_IDLE_MS, self._drain_logs)
+
     def run(self):
         def on_closing():
-            if self.automation and self.automation.driver:
-                self.automation.driver.quit()
-            self.root.destroy()
+            # La ventana se va ya; el flush al Sheet y el cierre de Chrome
+            # siguen en segundo plano, sin trabar el hilo de Tk
+            self.root.withdraw()
+            self._executor.shutdown(wait=False, cancel_futures=True)
+
+            def shutdown():
+                try:
+                    if self.automation:
+                        # Marca el cierre: las corridas en curso cortan en la próxima fila
+                        self.automation.close()
+                finally:
+                    self.root.after(0, self.root.destroy)
+
+            self._run_daemon(shutdown)
 
         self.root.protocol("WM_DELETE_WINDOW", on_closing)
         self.root.mainloop()
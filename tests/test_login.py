@@ -0,0 +1,108 @@
+"""
+Tests for TicketAutomation.login() when the Chrome profile already holds a
+session (BL_PERSIST_PROFILE): the home page skips the login form, and login()
+has to continue from whichever screen it lands on.
+
+Run with: python -m unittest discover tests
+"""
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+try:
+    import main
+    from selenium.webdriver.common.by import By
+    from selenium.common.exceptions import NoSuchElementException
+except ImportError as e:  # selenium, gspread, tkinter... not installed
+    raise unittest.SkipTest(f"main.py dependencies not available: {e}")
+
+
+class FakeElement:
+    def __init__(self, name, clicks):
+        self.name = name
+        self._clicks = clicks
+
+    def is_displayed(self):
+        return True
+
+    def is_enabled(self):
+        return True
+
+    def click(self):
+        self._clicks.append(self.name)
+
+
+class FakeDriver:
+    """Driver whose page shows only the elements listed in `present`."""
+
+    def __init__(self, present):
+        self.present = set(present)
+        self.clicks = []
+        self.lookups = []
+
+    def get(self, url):
+        pass
+
+    def _match(self, by, value):
+        if by == By.ID and value == "username":
+            return "form"
+        if by == By.XPATH and value == main.BACKOFFICE_XPATH:
+            return "backoffice"
+        if by == By.CSS_SELECTOR and main.DASHBOARD_CARD_CSS in value:
+            return "dashboard"
+        return None
+
+    def find_elements(self, by, value):
+        name = self._match(by, value)
+        return [FakeElement(name, self.clicks)] if name in self.present else []
+
+    def find_element(self, by, value):
+        self.lookups.append(value)
+        elements = self.find_elements(by, value)
+        if not elements:
+            raise NoSuchElementException(value)
+        if elements[0].name == "backoffice":
+            # Picking the system leads to the dashboard
+            self.present.add("dashboard")
+        return elements[0]
+
+    def save_screenshot(self, path):
+        return False
+
+
+class LoginWithOpenSessionTests(unittest.TestCase):
+    def make_automation(self, driver):
+        automation = main.TicketAutomation(headless_mode=True)
+        automation.driver = driver
+        automation.log = lambda message: None
+        self.addCleanup(automation._sheet_executor.shutdown)
+        return automation
+
+    def test_page_state(self):
+        self.assertEqual(main._login_page_state(FakeDriver({"form"})), "form")
+        self.assertEqual(main._login_page_state(FakeDriver({"backoffice"})), "backoffice")
+        self.assertEqual(main._login_page_state(FakeDriver({"dashboard"})), "dashboard")
+        self.assertFalse(main._login_page_state(FakeDriver(())))
+
+    def test_already_on_dashboard(self):
+        driver = FakeDriver({"dashboard"})
+        automation = self.make_automation(driver)
+
+        self.assertTrue(automation.login("user@example.com", "secret"))
+        self.assertNotIn("password", driver.lookups)
+        self.assertEqual(driver.clicks, [])
+        self.assertEqual(automation._login_credentials, ("user@example.com", "secret"))
+
+    def test_already_on_backoffice_selector(self):
+        driver = FakeDriver({"backoffice"})
+        automation = self.make_automation(driver)
+
+        self.assertTrue(automation.login("user@example.com", "secret"))
+        self.assertNotIn("password", driver.lookups)
+        self.assertEqual(driver.clicks, ["backoffice"])
+
+
+if __name__ == "__main__":
+    unittest.main()